@@ -25,7 +25,7 @@ import {
   Image,
 } from 'react-native';
 import { SafeAreaProvider } from 'react-native-safe-area-context';
-import { IMAGE_MAP, ImageKey } from './ImageMap';
+import { useImage } from './ImageMap';
 
 export default function ProfsScreen() {
   const router = useRouter();
@@ -104,17 +104,16 @@ export default function ProfsScreen() {
   };
 
   // Component to render professor image or default icon
+  // (the photo's shard of the image map is loaded the first time it is shown)
   const ProfImage = ({ prof }: { prof: Professor }) => {
-    let name = prof?.faculty_url?.split('/').pop();
-    if (name == undefined) name = '';
-    let imageKey = name as ImageKey;
-    
-    if (!imageKey || !IMAGE_MAP[imageKey]) {
+    const source = useImage(prof?.faculty_url?.split('/').pop(), 'thumb');
+
+    if (!source) {
       return (<Ionicons name="person-circle-outline" size={50} color="#666" />);
     } else
     return (
       <View style={{borderRadius: 50, overflow: 'hidden'}}>
-        <Image source={IMAGE_MAP[imageKey]} style={{width: 50, height: 50}} />
+        <Image source={source} style={{width: 50, height: 50}} />
       </View>
     );
   }
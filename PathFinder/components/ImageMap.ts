@@ -1,8 +1,9 @@
-// src/constants/ImageMap.ts
 // THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
 
+import { useEffect, useState } from 'react';
+
 // Define the Union Type of all available image keys for type safety
-export type ImageKey = 
+export type ImageKey =
   | 'abby-kinchy'
   | 'adam-biggs'
   | 'adam-dayem'
@@ -27,7 +28,6 @@ export type ImageKey =
   | 'andrew-horning'
   | 'anita-greenfield'
   | 'anthony-tessari'
-  | 'anthony-titus'
   | 'antoinette-maniatty'
   | 'aparna-gupta'
   | 'arpit-agrawal'
@@ -42,7 +42,6 @@ export type ImageKey =
   | 'ben-larson'
   | 'benj-gleeksman'
   | 'benjamin-chang'
-  | 'benjamin-vanmuysen'
   | 'bill-francis'
   | 'billur-aksoy'
   | 'bin-gao'
@@ -61,19 +60,19 @@ export type ImageKey =
   | 'bruno-nkuiya-mbakop'
   | 'bulent-yener'
   | 'caleb-white'
-  | 'carla-leitao'
+  | 'cara-wang'
   | 'carlos-varela'
   | 'casey-hoffman'
   | 'catalin-picu'
   | 'catherine-royer'
   | 'chaitanya-ullal'
+  | 'chanaka-edirisinghe'
   | 'charles-martin'
   | 'chjan-lim'
   | 'chris-bystroff'
   | 'chris-letchford'
   | 'chris-mcdermott'
   | 'christian-wetzel'
-  | 'christianna-bennett'
   | 'christopher-carothers'
   | 'christopher-cioffi'
   | 'christopher-fisher-lochhead'
@@ -87,8 +86,6 @@ export type ImageKey =
   | 'chuck-stewart'
   | 'chulsung-bae'
   | 'chunyu-wang'
-  | 'ciro-najle'
-  | 'claire-moriarty'
   | 'clint-ballinger'
   | 'conor-lennon'
   | 'corey-woodcock'
@@ -102,7 +99,6 @@ export type ImageKey =
   | 'daniel-stevenson'
   | 'daniel-thero'
   | 'daniel-walczyk'
-  | 'david-bell'
   | 'david-corr'
   | 'deanna-thompson'
   | 'deborah-mcguinness'
@@ -114,18 +110,18 @@ export type ImageKey =
   | 'donald-schwendeman'
   | 'dorit-nevo'
   | 'doug-swank'
+  | 'drronsun'
   | 'edmund-palermo'
   | 'edwin-fohtung'
-  | 'edwin-liu'
   | 'eliane-zerbetto-traldi'
   | 'elisabeth-brown'
   | 'elizabeth-blaber'
+  | 'elizabeth-kam'
   | 'elizabeth-press'
   | 'elizabeth-sprague'
   | 'elliot-anshelevich'
   | 'emily-gruendel'
   | 'emily-liu'
-  | 'emir-pekdemir'
   | 'emrah-aktunc'
   | 'eric-ameres'
   | 'eric-h-ledet'
@@ -134,13 +130,10 @@ export type ImageKey =
   | 'esra-agca-aktunc'
   | 'esther-wertz'
   | 'ethan-brown'
-  | 'evan-douglis'
   | 'eyosias-ashenafi'
   | 'fabian-faulstich'
-  | 'fengqi-li'
   | 'fengyan-li'
   | 'filbert-totsingan'
-  | 'fleet-hower'
   | 'fotis-kopsaftopoulos'
   | 'franck-djeumou-mbouwe'
   | 'frank-spear'
@@ -159,10 +152,11 @@ export type ImageKey =
   | 'gina-kucinski'
   | 'glenn-ciolek'
   | 'gregor-kovacic'
-  | 'gustavo-crembil'
   | 'gwo-ching-wang'
   | 'gyorgy-korniss'
   | 'heidi-jo-newberg'
+  | 'helen-zha'
+  | 'helen-zhou'
   | 'heng-liu'
   | 'hisham-mohamed'
   | 'holly-traver'
@@ -180,7 +174,6 @@ export type ImageKey =
   | 'james-hendler'
   | 'james-lu'
   | 'james-malazita'
-  | 'jarah-moesch'
   | 'jason-du'
   | 'jason-hicken'
   | 'jason-huh'
@@ -203,7 +196,6 @@ export type ImageKey =
   | 'joel-plawsky'
   | 'johan-maharjan'
   | 'john-lagraff'
-  | 'john-loercher'
   | 'john-m-reilly'
   | 'john-milanese'
   | 'john-mitchell'
@@ -218,7 +210,6 @@ export type ImageKey =
   | 'jorge-rivero'
   | 'jose-holguin-veras'
   | 'joseph-michael'
-  | 'joshua-draper'
   | 'joshua-hurst'
   | 'juergen-hahn'
   | 'julian-georg'
@@ -251,16 +242,15 @@ export type ImageKey =
   | 'kristin-johnson-finn-johnson'
   | 'kseniya-klyachko'
   | 'kurt-anderson'
-  | 'kyle-troyer'
   | 'kyle-wilt'
   | 'lee-ligon'
   | 'lei-yu'
   | 'leo-wan'
   | 'leonid-pogorelyuk'
+  | 'leslie-zeng'
   | 'liad-wagman'
   | 'liping-huang'
   | 'liu-liu'
-  | 'lonn-combs'
   | 'lucy-zhang'
   | 'luigi-vanfretti'
   | 'luiz-victor-repolho-cagliari'
@@ -268,7 +258,6 @@ export type ImageKey =
   | 'm-arshad-zahangir-chowdhury'
   | 'm-hakan-hekimoglu'
   | 'malik-magdon-ismail'
-  | 'marc-tatarsky'
   | 'marcus-carter'
   | 'margaret-mcdermott'
   | 'margarita-kirova-snover'
@@ -282,10 +271,8 @@ export type ImageKey =
   | 'marvin-bentley'
   | 'mary-anne-staniszewski'
   | 'masoud-zarifneshat'
-  | 'matt-burgermaster'
   | 'mattheos-koffas'
   | 'matthew-goodheart'
-  | 'matthew-lopez'
   | 'matthew-oehlschlaeger'
   | 'matthew-pasek'
   | 'matthew-wolf-meyer'
@@ -297,9 +284,8 @@ export type ImageKey =
   | 'mi-tran'
   | 'michael-amitay'
   | 'michael-century'
-  | 'michael-klein-0'
   | 'michael-klein'
-  | 'michael-oatman'
+  | 'michael-klein-0'
   | 'michael-symans'
   | 'miguel-matos'
   | 'mike-van-valkenburg'
@@ -311,322 +297,232 @@ export type ImageKey =
   | 'monica-agarwal'
   | 'morgan-schaller'
   | 'mourad-zeghal'
-  | 'rhett-russo'
-  | 'stephanie-loveless';
+  | 'moussa-ngom'
+  | 'muhsin-celik'
+  | 'murali-chari'
+  | 'nadarajah-narendran'
+  | 'nancy-campbell'
+  | 'nathan-meltz'
+  | 'neha-keshan'
+  | 'nicholas-mizer'
+  | 'nick-platts'
+  | 'nihat-baysal'
+  | 'nikhil-koratkar'
+  | 'nima-ahmadi'
+  | 'ning-xiang'
+  | 'nishtha-langer'
+  | 'omar-el-shafee'
+  | 'onkar-sahni'
+  | 'oshani-seneviratne'
+  | 'ozgur-tumuklu'
+  | 'pankaj-karande'
+  | 'patricia-search'
+  | 'patrick-underhill'
+  | 'paul-chow'
+  | 'paul-keblinski'
+  | 'peter-dinolfo'
+  | 'peter-j-bonitatibus'
+  | 'peter-kramer'
+  | 'peter-persans'
+  | 'philip-vanderhyden'
+  | 'pingkun-yan'
+  | 'prabhakar-neti'
+  | 'prabhat-hajela'
+  | 'prakrati-thakur'
+  | 'prashun-gorai'
+  | 'qiang-ji'
+  | 'radoslav-ivanov'
+  | 'raffi-garcia'
+  | 'rahmi-ozisik'
+  | 'rahul-rahul'
+  | 'raquel-velho'
+  | 'ravishankar-sundararaman'
+  | 'rebecca-doerge'
+  | 'rena-huang'
+  | 'rich-radke'
+  | 'richard-bonocora'
+  | 'richard-gross'
+  | 'richard-plotka'
+  | 'rob-hamilton'
+  | 'robert-hull'
+  | 'robert-jones'
+  | 'robert-nideffer'
+  | 'robert-niemiec'
+  | 'robert-whalen'
+  | 'ronald-hedden'
+  | 'ross-rice'
+  | 'rostyslav-korolov'
+  | 'rui-fan'
+  | 'ruimin-ke'
+  | 'rush-swope'
+  | 'russell-kraft'
+  | 'saggi-nevo'
+  | 'sam-strizver'
+  | 'samir-salamah'
+  | 'sandeep-singh'
+  | 'sandipan-mishra'
+  | 'sandra-nierzwicki-bauer'
+  | 'sang-han'
+  | 'sangwoo-lee'
+  | 'santiago-paternain'
+  | 'sara-black'
+  | 'sara-tack'
+  | 'sarah-cadieux'
+  | 'sarah-felix'
+  | 'sarah-greene'
+  | 'sasha-wagner'
+  | 'scott-forth'
+  | 'sean-x-he'
+  | 'sebastian-souyris'
+  | 'seemanti-ramanath'
+  | 'selmer-bringsjord'
+  | 'semih-akin'
+  | 'sergei-nirenburg'
+  | 'shanbin-shi'
+  | 'shankar-narayan'
+  | 'shaowu-pan'
+  | 'shawn-yu-lin'
+  | 'shayla-sawyer'
+  | 'shekhar-garde'
+  | 'shengbai-zhang'
+  | 'shun-uchida'
+  | 'shyam-kumar'
+  | 'sibel-adali'
+  | 'silvia-ruzanka'
+  | 'skye-anicca'
+  | 'stephanie-loveless'
+  | 'steven-cramer'
+  | 't-ravichandran'
+  | 'tahseen-hasan'
+  | 'tamar-gordon'
+  | 'tankut-atuk'
+  | 'tanya-singh'
+  | 'tara-cohen'
+  | 'tathagata-bhaduri'
+  | 'theodorian-borca-tasciuc'
+  | 'thierry-blanchet'
+  | 'thomas-ferguson'
+  | 'tianyi-chen'
+  | 'timothy-golden'
+  | 'todd-przybycien'
+  | 'tom-haley'
+  | 'tomek-strzalkowski'
+  | 'tong-zhang'
+  | 'trevor-rhone'
+  | 'ukwatte-lokuliyanage-indika-perera'
+  | 'ute-besenecker'
+  | 'uwe-kruger'
+  | 'uzma-mushtaque'
+  | 'victor-robles-sanchez'
+  | 'victoria-bennett'
+  | 'vidhya-chakrapani'
+  | 'vivek-ghosal'
+  | 'walaid-sehwail'
+  | 'wei-bao'
+  | 'wei-ji'
+  | 'weina-ran'
+  | 'wes-turner'
+  | 'wilfredo-colon'
+  | 'william-gibbons'
+  | 'william-henshaw'
+  | 'wint-thu'
+  | 'xavier-intes'
+  | 'xiangyi-meng'
+  | 'xun-wang'
+  | 'yael-erel'
+  | 'yangyang-xu'
+  | 'yao-ma'
+  | 'yaron-danon'
+  | 'yinan-wang'
+  | 'yingrui-yang'
+  | 'yong-sung-kim'
+  | 'yong-zheng'
+  | 'yujie-ruan'
+  | 'yunfeng-shi'
+  | 'yuri-lvov'
+  | 'zack-ward'
+  | 'zheyu-zhang';
+
+export type ImageVariant = 'thumb' | 'detail';
 
 // Define the type for the image source (a number, which is what require() returns)
 type ImageSource = number;
+export type ImageShard = Record<string, Record<ImageVariant, ImageSource>>;
+
+// Every key with a photo; the shard holding a key is its first letter
+const KEYS = 'abby-kinchy|adam-biggs|adam-dayem|adrianna-oropello|agung-julius|ahmed-eleish|alex-gittens|alex-patterson|alexander-hiland|alexander-ma|alexandros-tsamis|alhussein-abouzeid|ali-shahsavari|ali-tajer|alicia-walf|allison-hoffman|amgalanbaatar-baldansuren|amir-hirsa|ana-milanova|andres-munoz-rojas|andrew-fitzgerald|andrew-horning|anita-greenfield|anthony-tessari|antoinette-maniatty|aparna-gupta|arpit-agrawal|arta-yazdanseta|asish-ghosh|audrey-peterson-mccann|azita-hirsa|b-wayne-bequette|bahar-cavdar|barbara-cutler|belmiro-galo-da-silva|ben-larson|benj-gleeksman|benjamin-chang|bill-francis|billur-aksoy|bin-gao|birsen-yazici|blanca-barquera|bolek-szymanski|boon-ooi|bram-van-heuveln|branda-miller|brandi-brace|brandon-costelloe-kuehn|brett-fajen|brian-clark|brian-jensen|bruce-piper|bruno-nkuiya-mbakop|bulent-yener|caleb-white|cara-wang|carlos-varela|casey-hoffman|catalin-picu|catherine-royer|chaitanya-ullal|chanaka-edirisinghe|charles-martin|chjan-lim|chris-bystroff|chris-letchford|chris-mcdermott|christian-wetzel|christopher-carothers|christopher-cioffi|christopher-fisher-lochhead|christopher-jeansonne|christopher-perry|christopher-puleo|christopher-sims|christopher-tozzi|christos-varsamis|chrysi-nanou|chuck-stewart|chulsung-bae|chunyu-wang|clint-ballinger|conor-lennon|corey-woodcock|corinne-jones|damien-west|dan-ditursi|daniel-gall|daniel-lander|daniel-lewis|daniel-lyles|daniel-stevenson|daniel-thero|daniel-walczyk|david-corr|deanna-thompson|deborah-mcguinness|deepak-vashishth|dennis-shelden|diana-borca-tasciuc|diego-moran-ramirez|dominik-fritz|donald-schwendeman|dorit-nevo|doug-swank|drronsun|edmund-palermo|edwin-fohtung|eliane-zerbetto-traldi|elisabeth-brown|elizabeth-blaber|elizabeth-kam|elizabeth-press|elizabeth-sprague|elliot-anshelevich|emily-gruendel|emily-liu|emrah-aktunc|eric-ameres|eric-h-ledet|eric-rutledge|esen-yel|esra-agca-aktunc|esther-wertz|ethan-brown|eyosias-ashenafi|fabian-faulstich|fengyan-li|filbert-totsingan|fotis-kopsaftopoulos|franck-djeumou-mbouwe|frank-spear|fred-schubert|fudong-han|gaetano-montelione|ganpati-ramanath|gaurav-jain|ge-wang|geetu-sharma|george-lee|george-makhatadze|george-slota|georges-belfort|gerald-korenowski|gina-kucinski|glenn-ciolek|gregor-kovacic|gwo-ching-wang|gyorgy-korniss|heidi-jo-newberg|helen-zha|helen-zhou|heng-liu|hisham-mohamed|holly-traver|huaming-peng|humberto-terrones|hyun-gook-kang|ian-chadd|igor-vamos|ingrid-wilke|ish-jain|jackie-herron-berry|jacob-merson|jacob-shelley|james-bailey|james-hendler|james-lu|james-malazita|jason-du|jason-hicken|jason-huh|jason-kuruzovich|jeff-morris|jeffrey-banks|jennifer-cardinal|jennifer-hurley|jennifer-pazour|jenny-kemp|jeremy-farrell|ji-young-kim|jian-shi|jian-sun|jianling-yue|jianxi-gao|jidong-xiao|jie-lian|joel-giedt|joel-plawsky|johan-maharjan|john-lagraff|john-m-reilly|john-milanese|john-mitchell|john-sturman|john-tichy|john-wen|johnson-samuel|jonas-braasch|jonathan-dordick|jonathan-mckinney|jonathan-stetler|jorge-rivero|jose-holguin-veras|joseph-michael|joshua-hurst|juergen-hahn|julian-georg|june-deery|junichi-kanai|justin-dowdall|k-v-lakshmi|kanad-basu|karthik-panneerselvam|kartik-josyula|karyn-rogers|kate-galloway|katherine-tyrol|kathleen-ruiz|kathy-fontaine|kathy-high|kedong-chen|keith-fraser|keith-taylor|ken-simons|kenneth-ragsdale|kevin-fletcher|kevin-housley|kevin-rose|kimberly-oakes|konstantin-kuzmin|koushik-kar|kristen-mills|kristin-bennett|kristin-johnson-finn-johnson|kseniya-klyachko|kurt-anderson|kyle-wilt|lee-ligon|lei-yu|leo-wan|leonid-pogorelyuk|leslie-zeng|liad-wagman|liping-huang|liu-liu|lucy-zhang|luigi-vanfretti|luiz-victor-repolho-cagliari|lydia-manikonda|m-arshad-zahangir-chowdhury|m-hakan-hekimoglu|malik-magdon-ismail|marcus-carter|margaret-mcdermott|margarita-kirova-snover|mariah-hahn|marianne-nyman|marjorie-mcshane|mark-gilder|mark-holmes|mark-shephard|martin-schmidt|marvin-bentley|mary-anne-staniszewski|masoud-zarifneshat|mattheos-koffas|matthew-goodheart|matthew-oehlschlaeger|matthew-pasek|matthew-wolf-meyer|maurice-suckling|maya-kiehl|mei-si|meimuneh-sumadi|meng-wang|mi-tran|michael-amitay|michael-century|michael-klein|michael-klein-0|michael-symans|miguel-matos|mike-van-valkenburg|min-li|mina-mahmoudi|mitchell-murray|mohammad-mohammadi-amiri|mohammed-zaki|monica-agarwal|morgan-schaller|mourad-zeghal|moussa-ngom|muhsin-celik|murali-chari|nadarajah-narendran|nancy-campbell|nathan-meltz|neha-keshan|nicholas-mizer|nick-platts|nihat-baysal|nikhil-koratkar|nima-ahmadi|ning-xiang|nishtha-langer|omar-el-shafee|onkar-sahni|oshani-seneviratne|ozgur-tumuklu|pankaj-karande|patricia-search|patrick-underhill|paul-chow|paul-keblinski|peter-dinolfo|peter-j-bonitatibus|peter-kramer|peter-persans|philip-vanderhyden|pingkun-yan|prabhakar-neti|prabhat-hajela|prakrati-thakur|prashun-gorai|qiang-ji|radoslav-ivanov|raffi-garcia|rahmi-ozisik|rahul-rahul|raquel-velho|ravishankar-sundararaman|rebecca-doerge|rena-huang|rich-radke|richard-bonocora|richard-gross|richard-plotka|rob-hamilton|robert-hull|robert-jones|robert-nideffer|robert-niemiec|robert-whalen|ronald-hedden|ross-rice|rostyslav-korolov|rui-fan|ruimin-ke|rush-swope|russell-kraft|saggi-nevo|sam-strizver|samir-salamah|sandeep-singh|sandipan-mishra|sandra-nierzwicki-bauer|sang-han|sangwoo-lee|santiago-paternain|sara-black|sara-tack|sarah-cadieux|sarah-felix|sarah-greene|sasha-wagner|scott-forth|sean-x-he|sebastian-souyris|seemanti-ramanath|selmer-bringsjord|semih-akin|sergei-nirenburg|shanbin-shi|shankar-narayan|shaowu-pan|shawn-yu-lin|shayla-sawyer|shekhar-garde|shengbai-zhang|shun-uchida|shyam-kumar|sibel-adali|silvia-ruzanka|skye-anicca|stephanie-loveless|steven-cramer|t-ravichandran|tahseen-hasan|tamar-gordon|tankut-atuk|tanya-singh|tara-cohen|tathagata-bhaduri|theodorian-borca-tasciuc|thierry-blanchet|thomas-ferguson|tianyi-chen|timothy-golden|todd-przybycien|tom-haley|tomek-strzalkowski|tong-zhang|trevor-rhone|ukwatte-lokuliyanage-indika-perera|ute-besenecker|uwe-kruger|uzma-mushtaque|victor-robles-sanchez|victoria-bennett|vidhya-chakrapani|vivek-ghosal|walaid-sehwail|wei-bao|wei-ji|weina-ran|wes-turner|wilfredo-colon|william-gibbons|william-henshaw|wint-thu|xavier-intes|xiangyi-meng|xun-wang|yael-erel|yangyang-xu|yao-ma|yaron-danon|yinan-wang|yingrui-yang|yong-sung-kim|yong-zheng|yujie-ruan|yunfeng-shi|yuri-lvov|zack-ward|zheyu-zhang';
+const IMAGE_KEYS = new Set(KEYS.split('|'));
 
-// Define and export the constant map
-export const IMAGE_MAP: Record<ImageKey, ImageSource> = {
-  'abby-kinchy': require('../assets/images/imgs/abby-kinchy.jpg'),
-  'adam-biggs': require('../assets/images/imgs/adam-biggs.jpg'),
-  'adam-dayem': require('../assets/images/imgs/adam-dayem.jpg'),
-  'adrianna-oropello': require('../assets/images/imgs/adrianna-oropello.jpg'),
-  'agung-julius': require('../assets/images/imgs/agung-julius.jpg'),
-  'ahmed-eleish': require('../assets/images/imgs/ahmed-eleish.jpg'),
-  'alex-gittens': require('../assets/images/imgs/alex-gittens.jpg'),
-  'alex-patterson': require('../assets/images/imgs/alex-patterson.jpg'),
-  'alexander-hiland': require('../assets/images/imgs/alexander-hiland.jpg'),
-  'alexander-ma': require('../assets/images/imgs/alexander-ma.jpg'),
-  'alexandros-tsamis': require('../assets/images/imgs/alexandros-tsamis.jpg'),
-  'alhussein-abouzeid': require('../assets/images/imgs/alhussein-abouzeid.jpg'),
-  'ali-shahsavari': require('../assets/images/imgs/ali-shahsavari.jpg'),
-  'ali-tajer': require('../assets/images/imgs/ali-tajer.jpg'),
-  'alicia-walf': require('../assets/images/imgs/alicia-walf.jpg'),
-  'allison-hoffman': require('../assets/images/imgs/allison-hoffman.jpg'),
-  'amgalanbaatar-baldansuren': require('../assets/images/imgs/amgalanbaatar-baldansuren.jpg'),
-  'amir-hirsa': require('../assets/images/imgs/amir-hirsa.jpg'),
-  'ana-milanova': require('../assets/images/imgs/ana-milanova.jpg'),
-  'andres-munoz-rojas': require('../assets/images/imgs/andres-munoz-rojas.jpg'),
-  'andrew-fitzgerald': require('../assets/images/imgs/andrew-fitzgerald.jpg'),
-  'andrew-horning': require('../assets/images/imgs/andrew-horning.jpg'),
-  'anita-greenfield': require('../assets/images/imgs/anita-greenfield.jpg'),
-  'anthony-tessari': require('../assets/images/imgs/anthony-tessari.jpg'),
-  'anthony-titus': require('../assets/images/imgs/anthony-titus.jpg'),
-  'antoinette-maniatty': require('../assets/images/imgs/antoinette-maniatty.jpg'),
-  'aparna-gupta': require('../assets/images/imgs/aparna-gupta.jpg'),
-  'arpit-agrawal': require('../assets/images/imgs/arpit-agrawal.jpg'),
-  'arta-yazdanseta': require('../assets/images/imgs/arta-yazdanseta.jpg'),
-  'asish-ghosh': require('../assets/images/imgs/asish-ghosh.jpg'),
-  'audrey-peterson-mccann': require('../assets/images/imgs/audrey-peterson-mccann.jpg'),
-  'azita-hirsa': require('../assets/images/imgs/azita-hirsa.jpg'),
-  'b-wayne-bequette': require('../assets/images/imgs/b-wayne-bequette.jpg'),
-  'bahar-cavdar': require('../assets/images/imgs/bahar-cavdar.jpg'),
-  'barbara-cutler': require('../assets/images/imgs/barbara-cutler.jpg'),
-  'belmiro-galo-da-silva': require('../assets/images/imgs/belmiro-galo-da-silva.jpg'),
-  'ben-larson': require('../assets/images/imgs/ben-larson.jpg'),
-  'benj-gleeksman': require('../assets/images/imgs/benj-gleeksman.jpg'),
-  'benjamin-chang': require('../assets/images/imgs/benjamin-chang.jpg'),
-  'benjamin-vanmuysen': require('../assets/images/imgs/benjamin-vanmuysen.jpg'),
-  'bill-francis': require('../assets/images/imgs/bill-francis.jpg'),
-  'billur-aksoy': require('../assets/images/imgs/billur-aksoy.jpg'),
-  'bin-gao': require('../assets/images/imgs/bin-gao.jpg'),
-  'birsen-yazici': require('../assets/images/imgs/birsen-yazici.jpg'),
-  'blanca-barquera': require('../assets/images/imgs/blanca-barquera.jpg'),
-  'bolek-szymanski': require('../assets/images/imgs/bolek-szymanski.jpg'),
-  'boon-ooi': require('../assets/images/imgs/boon-ooi.jpg'),
-  'bram-van-heuveln': require('../assets/images/imgs/bram-van-heuveln.jpg'),
-  'branda-miller': require('../assets/images/imgs/branda-miller.jpg'),
-  'brandi-brace': require('../assets/images/imgs/brandi-brace.jpg'),
-  'brandon-costelloe-kuehn': require('../assets/images/imgs/brandon-costelloe-kuehn.jpg'),
-  'brett-fajen': require('../assets/images/imgs/brett-fajen.jpg'),
-  'brian-clark': require('../assets/images/imgs/brian-clark.jpg'),
-  'brian-jensen': require('../assets/images/imgs/brian-jensen.jpg'),
-  'bruce-piper': require('../assets/images/imgs/bruce-piper.jpg'),
-  'bruno-nkuiya-mbakop': require('../assets/images/imgs/bruno-nkuiya-mbakop.jpg'),
-  'bulent-yener': require('../assets/images/imgs/bulent-yener.jpg'),
-  'caleb-white': require('../assets/images/imgs/caleb-white.jpg'),
-  'carla-leitao': require('../assets/images/imgs/carla-leitao.jpg'),
-  'carlos-varela': require('../assets/images/imgs/carlos-varela.jpg'),
-  'casey-hoffman': require('../assets/images/imgs/casey-hoffman.jpg'),
-  'catalin-picu': require('../assets/images/imgs/catalin-picu.jpg'),
-  'catherine-royer': require('../assets/images/imgs/catherine-royer.jpg'),
-  'chaitanya-ullal': require('../assets/images/imgs/chaitanya-ullal.jpg'),
-  'charles-martin': require('../assets/images/imgs/charles-martin.jpg'),
-  'chjan-lim': require('../assets/images/imgs/chjan-lim.jpg'),
-  'chris-bystroff': require('../assets/images/imgs/chris-bystroff.jpg'),
-  'chris-letchford': require('../assets/images/imgs/chris-letchford.jpg'),
-  'chris-mcdermott': require('../assets/images/imgs/chris-mcdermott.jpg'),
-  'christian-wetzel': require('../assets/images/imgs/christian-wetzel.jpg'),
-  'christianna-bennett': require('../assets/images/imgs/christianna-bennett.jpg'),
-  'christopher-carothers': require('../assets/images/imgs/christopher-carothers.jpg'),
-  'christopher-cioffi': require('../assets/images/imgs/christopher-cioffi.jpg'),
-  'christopher-fisher-lochhead': require('../assets/images/imgs/christopher-fisher-lochhead.jpg'),
-  'christopher-jeansonne': require('../assets/images/imgs/christopher-jeansonne.jpg'),
-  'christopher-perry': require('../assets/images/imgs/christopher-perry.jpg'),
-  'christopher-puleo': require('../assets/images/imgs/christopher-puleo.jpg'),
-  'christopher-sims': require('../assets/images/imgs/christopher-sims.jpg'),
-  'christopher-tozzi': require('../assets/images/imgs/christopher-tozzi.jpg'),
-  'christos-varsamis': require('../assets/images/imgs/christos-varsamis.jpg'),
-  'chrysi-nanou': require('../assets/images/imgs/chrysi-nanou.jpg'),
-  'chuck-stewart': require('../assets/images/imgs/chuck-stewart.jpg'),
-  'chulsung-bae': require('../assets/images/imgs/chulsung-bae.jpg'),
-  'chunyu-wang': require('../assets/images/imgs/chunyu-wang.jpg'),
-  'ciro-najle': require('../assets/images/imgs/ciro-najle.jpg'),
-  'claire-moriarty': require('../assets/images/imgs/claire-moriarty.jpg'),
-  'clint-ballinger': require('../assets/images/imgs/clint-ballinger.jpg'),
-  'conor-lennon': require('../assets/images/imgs/conor-lennon.jpg'),
-  'corey-woodcock': require('../assets/images/imgs/corey-woodcock.jpg'),
-  'corinne-jones': require('../assets/images/imgs/corinne-jones.jpg'),
-  'damien-west': require('../assets/images/imgs/damien-west.jpg'),
-  'dan-ditursi': require('../assets/images/imgs/dan-ditursi.jpg'),
-  'daniel-gall': require('../assets/images/imgs/daniel-gall.jpg'),
-  'daniel-lander': require('../assets/images/imgs/daniel-lander.jpg'),
-  'daniel-lewis': require('../assets/images/imgs/daniel-lewis.jpg'),
-  'daniel-lyles': require('../assets/images/imgs/daniel-lyles.jpg'),
-  'daniel-stevenson': require('../assets/images/imgs/daniel-stevenson.jpg'),
-  'daniel-thero': require('../assets/images/imgs/daniel-thero.jpg'),
-  'daniel-walczyk': require('../assets/images/imgs/daniel-walczyk.jpg'),
-  'david-bell': require('../assets/images/imgs/david-bell.jpg'),
-  'david-corr': require('../assets/images/imgs/david-corr.jpg'),
-  'deanna-thompson': require('../assets/images/imgs/deanna-thompson.jpg'),
-  'deborah-mcguinness': require('../assets/images/imgs/deborah-mcguinness.jpg'),
-  'deepak-vashishth': require('../assets/images/imgs/deepak-vashishth.jpg'),
-  'dennis-shelden': require('../assets/images/imgs/dennis-shelden.jpg'),
-  'diana-borca-tasciuc': require('../assets/images/imgs/diana-borca-tasciuc.jpg'),
-  'diego-moran-ramirez': require('../assets/images/imgs/diego-moran-ramirez.jpg'),
-  'dominik-fritz': require('../assets/images/imgs/dominik-fritz.jpg'),
-  'donald-schwendeman': require('../assets/images/imgs/donald-schwendeman.jpg'),
-  'dorit-nevo': require('../assets/images/imgs/dorit-nevo.jpg'),
-  'doug-swank': require('../assets/images/imgs/doug-swank.jpg'),
-  'edmund-palermo': require('../assets/images/imgs/edmund-palermo.jpg'),
-  'edwin-fohtung': require('../assets/images/imgs/edwin-fohtung.jpg'),
-  'edwin-liu': require('../assets/images/imgs/edwin-liu.jpg'),
-  'eliane-zerbetto-traldi': require('../assets/images/imgs/eliane-zerbetto-traldi.jpg'),
-  'elisabeth-brown': require('../assets/images/imgs/elisabeth-brown.jpg'),
-  'elizabeth-blaber': require('../assets/images/imgs/elizabeth-blaber.jpg'),
-  'elizabeth-press': require('../assets/images/imgs/elizabeth-press.jpg'),
-  'elizabeth-sprague': require('../assets/images/imgs/elizabeth-sprague.jpg'),
-  'elliot-anshelevich': require('../assets/images/imgs/elliot-anshelevich.jpg'),
-  'emily-gruendel': require('../assets/images/imgs/emily-gruendel.jpg'),
-  'emily-liu': require('../assets/images/imgs/emily-liu.jpg'),
-  'emir-pekdemir': require('../assets/images/imgs/emir-pekdemir.jpg'),
-  'emrah-aktunc': require('../assets/images/imgs/emrah-aktunc.jpg'),
-  'eric-ameres': require('../assets/images/imgs/eric-ameres.jpg'),
-  'eric-h-ledet': require('../assets/images/imgs/eric-h-ledet.jpg'),
-  'eric-rutledge': require('../assets/images/imgs/eric-rutledge.jpg'),
-  'esen-yel': require('../assets/images/imgs/esen-yel.jpg'),
-  'esra-agca-aktunc': require('../assets/images/imgs/esra-agca-aktunc.jpg'),
-  'esther-wertz': require('../assets/images/imgs/esther-wertz.jpg'),
-  'ethan-brown': require('../assets/images/imgs/ethan-brown.jpg'),
-  'evan-douglis': require('../assets/images/imgs/evan-douglis.jpg'),
-  'eyosias-ashenafi': require('../assets/images/imgs/eyosias-ashenafi.jpg'),
-  'fabian-faulstich': require('../assets/images/imgs/fabian-faulstich.jpg'),
-  'fengqi-li': require('../assets/images/imgs/fengqi-li.jpg'),
-  'fengyan-li': require('../assets/images/imgs/fengyan-li.jpg'),
-  'filbert-totsingan': require('../assets/images/imgs/filbert-totsingan.jpg'),
-  'fleet-hower': require('../assets/images/imgs/fleet-hower.jpg'),
-  'fotis-kopsaftopoulos': require('../assets/images/imgs/fotis-kopsaftopoulos.jpg'),
-  'franck-djeumou-mbouwe': require('../assets/images/imgs/franck-djeumou-mbouwe.jpg'),
-  'frank-spear': require('../assets/images/imgs/frank-spear.jpg'),
-  'fred-schubert': require('../assets/images/imgs/fred-schubert.jpg'),
-  'fudong-han': require('../assets/images/imgs/fudong-han.jpg'),
-  'gaetano-montelione': require('../assets/images/imgs/gaetano-montelione.jpg'),
-  'ganpati-ramanath': require('../assets/images/imgs/ganpati-ramanath.jpg'),
-  'gaurav-jain': require('../assets/images/imgs/gaurav-jain.jpg'),
-  'ge-wang': require('../assets/images/imgs/ge-wang.jpg'),
-  'geetu-sharma': require('../assets/images/imgs/geetu-sharma.jpg'),
-  'george-lee': require('../assets/images/imgs/george-lee.jpg'),
-  'george-makhatadze': require('../assets/images/imgs/george-makhatadze.jpg'),
-  'george-slota': require('../assets/images/imgs/george-slota.jpg'),
-  'georges-belfort': require('../assets/images/imgs/georges-belfort.jpg'),
-  'gerald-korenowski': require('../assets/images/imgs/gerald-korenowski.jpg'),
-  'gina-kucinski': require('../assets/images/imgs/gina-kucinski.jpg'),
-  'glenn-ciolek': require('../assets/images/imgs/glenn-ciolek.jpg'),
-  'gregor-kovacic': require('../assets/images/imgs/gregor-kovacic.jpg'),
-  'gustavo-crembil': require('../assets/images/imgs/gustavo-crembil.jpg'),
-  'gwo-ching-wang': require('../assets/images/imgs/gwo-ching-wang.jpg'),
-  'gyorgy-korniss': require('../assets/images/imgs/gyorgy-korniss.jpg'),
-  'heidi-jo-newberg': require('../assets/images/imgs/heidi-jo-newberg.jpg'),
-  'heng-liu': require('../assets/images/imgs/heng-liu.jpg'),
-  'hisham-mohamed': require('../assets/images/imgs/hisham-mohamed.jpg'),
-  'holly-traver': require('../assets/images/imgs/holly-traver.jpg'),
-  'huaming-peng': require('../assets/images/imgs/huaming-peng.jpg'),
-  'humberto-terrones': require('../assets/images/imgs/humberto-terrones.jpg'),
-  'hyun-gook-kang': require('../assets/images/imgs/hyun-gook-kang.jpg'),
-  'ian-chadd': require('../assets/images/imgs/ian-chadd.jpg'),
-  'igor-vamos': require('../assets/images/imgs/igor-vamos.jpg'),
-  'ingrid-wilke': require('../assets/images/imgs/ingrid-wilke.jpg'),
-  'ish-jain': require('../assets/images/imgs/ish-jain.jpg'),
-  'jackie-herron-berry': require('../assets/images/imgs/jackie-herron-berry.jpg'),
-  'jacob-merson': require('../assets/images/imgs/jacob-merson.jpg'),
-  'jacob-shelley': require('../assets/images/imgs/jacob-shelley.jpg'),
-  'james-bailey': require('../assets/images/imgs/james-bailey.jpg'),
-  'james-hendler': require('../assets/images/imgs/james-hendler.jpg'),
-  'james-lu': require('../assets/images/imgs/james-lu.jpg'),
-  'james-malazita': require('../assets/images/imgs/james-malazita.jpg'),
-  'jarah-moesch': require('../assets/images/imgs/jarah-moesch.jpg'),
-  'jason-du': require('../assets/images/imgs/jason-du.jpg'),
-  'jason-hicken': require('../assets/images/imgs/jason-hicken.jpg'),
-  'jason-huh': require('../assets/images/imgs/jason-huh.jpg'),
-  'jason-kuruzovich': require('../assets/images/imgs/jason-kuruzovich.jpg'),
-  'jeff-morris': require('../assets/images/imgs/jeff-morris.jpg'),
-  'jeffrey-banks': require('../assets/images/imgs/jeffrey-banks.jpg'),
-  'jennifer-cardinal': require('../assets/images/imgs/jennifer-cardinal.jpg'),
-  'jennifer-hurley': require('../assets/images/imgs/jennifer-hurley.jpg'),
-  'jennifer-pazour': require('../assets/images/imgs/jennifer-pazour.jpg'),
-  'jenny-kemp': require('../assets/images/imgs/jenny-kemp.jpg'),
-  'jeremy-farrell': require('../assets/images/imgs/jeremy-farrell.jpg'),
-  'ji-young-kim': require('../assets/images/imgs/ji-young-kim.jpg'),
-  'jian-shi': require('../assets/images/imgs/jian-shi.jpg'),
-  'jian-sun': require('../assets/images/imgs/jian-sun.jpg'),
-  'jianling-yue': require('../assets/images/imgs/jianling-yue.jpg'),
-  'jianxi-gao': require('../assets/images/imgs/jianxi-gao.jpg'),
-  'jidong-xiao': require('../assets/images/imgs/jidong-xiao.jpg'),
-  'jie-lian': require('../assets/images/imgs/jie-lian.jpg'),
-  'joel-giedt': require('../assets/images/imgs/joel-giedt.jpg'),
-  'joel-plawsky': require('../assets/images/imgs/joel-plawsky.jpg'),
-  'johan-maharjan': require('../assets/images/imgs/johan-maharjan.jpg'),
-  'john-lagraff': require('../assets/images/imgs/john-lagraff.jpg'),
-  'john-loercher': require('../assets/images/imgs/john-loercher.jpg'),
-  'john-m-reilly': require('../assets/images/imgs/john-m-reilly.jpg'),
-  'john-milanese': require('../assets/images/imgs/john-milanese.jpg'),
-  'john-mitchell': require('../assets/images/imgs/john-mitchell.jpg'),
-  'john-sturman': require('../assets/images/imgs/john-sturman.jpg'),
-  'john-tichy': require('../assets/images/imgs/john-tichy.jpg'),
-  'john-wen': require('../assets/images/imgs/john-wen.jpg'),
-  'johnson-samuel': require('../assets/images/imgs/johnson-samuel.jpg'),
-  'jonas-braasch': require('../assets/images/imgs/jonas-braasch.jpg'),
-  'jonathan-dordick': require('../assets/images/imgs/jonathan-dordick.jpg'),
-  'jonathan-mckinney': require('../assets/images/imgs/jonathan-mckinney.jpg'),
-  'jonathan-stetler': require('../assets/images/imgs/jonathan-stetler.jpg'),
-  'jorge-rivero': require('../assets/images/imgs/jorge-rivero.jpg'),
-  'jose-holguin-veras': require('../assets/images/imgs/jose-holguin-veras.jpg'),
-  'joseph-michael': require('../assets/images/imgs/joseph-michael.jpg'),
-  'joshua-draper': require('../assets/images/imgs/joshua-draper.jpg'),
-  'joshua-hurst': require('../assets/images/imgs/joshua-hurst.jpg'),
-  'juergen-hahn': require('../assets/images/imgs/juergen-hahn.jpg'),
-  'julian-georg': require('../assets/images/imgs/julian-georg.jpg'),
-  'june-deery': require('../assets/images/imgs/june-deery.jpg'),
-  'junichi-kanai': require('../assets/images/imgs/junichi-kanai.jpg'),
-  'justin-dowdall': require('../assets/images/imgs/justin-dowdall.jpg'),
-  'k-v-lakshmi': require('../assets/images/imgs/k-v-lakshmi.jpg'),
-  'kanad-basu': require('../assets/images/imgs/kanad-basu.jpg'),
-  'karthik-panneerselvam': require('../assets/images/imgs/karthik-panneerselvam.jpg'),
-  'kartik-josyula': require('../assets/images/imgs/kartik-josyula.jpg'),
-  'karyn-rogers': require('../assets/images/imgs/karyn-rogers.jpg'),
-  'kate-galloway': require('../assets/images/imgs/kate-galloway.jpg'),
-  'katherine-tyrol': require('../assets/images/imgs/katherine-tyrol.jpg'),
-  'kathleen-ruiz': require('../assets/images/imgs/kathleen-ruiz.jpg'),
-  'kathy-fontaine': require('../assets/images/imgs/kathy-fontaine.jpg'),
-  'kathy-high': require('../assets/images/imgs/kathy-high.jpg'),
-  'kedong-chen': require('../assets/images/imgs/kedong-chen.jpg'),
-  'keith-fraser': require('../assets/images/imgs/keith-fraser.jpg'),
-  'keith-taylor': require('../assets/images/imgs/keith-taylor.jpg'),
-  'ken-simons': require('../assets/images/imgs/ken-simons.jpg'),
-  'kenneth-ragsdale': require('../assets/images/imgs/kenneth-ragsdale.jpg'),
-  'kevin-fletcher': require('../assets/images/imgs/kevin-fletcher.jpg'),
-  'kevin-housley': require('../assets/images/imgs/kevin-housley.jpg'),
-  'kevin-rose': require('../assets/images/imgs/kevin-rose.jpg'),
-  'kimberly-oakes': require('../assets/images/imgs/kimberly-oakes.jpg'),
-  'konstantin-kuzmin': require('../assets/images/imgs/konstantin-kuzmin.jpg'),
-  'koushik-kar': require('../assets/images/imgs/koushik-kar.jpg'),
-  'kristen-mills': require('../assets/images/imgs/kristen-mills.jpg'),
-  'kristin-bennett': require('../assets/images/imgs/kristin-bennett.jpg'),
-  'kristin-johnson-finn-johnson': require('../assets/images/imgs/kristin-johnson-finn-johnson.jpg'),
-  'kseniya-klyachko': require('../assets/images/imgs/kseniya-klyachko.jpg'),
-  'kurt-anderson': require('../assets/images/imgs/kurt-anderson.jpg'),
-  'kyle-troyer': require('../assets/images/imgs/kyle-troyer.jpg'),
-  'kyle-wilt': require('../assets/images/imgs/kyle-wilt.jpg'),
-  'lee-ligon': require('../assets/images/imgs/lee-ligon.jpg'),
-  'lei-yu': require('../assets/images/imgs/lei-yu.jpg'),
-  'leo-wan': require('../assets/images/imgs/leo-wan.jpg'),
-  'leonid-pogorelyuk': require('../assets/images/imgs/leonid-pogorelyuk.jpg'),
-  'liad-wagman': require('../assets/images/imgs/liad-wagman.jpg'),
-  'liping-huang': require('../assets/images/imgs/liping-huang.jpg'),
-  'liu-liu': require('../assets/images/imgs/liu-liu.jpg'),
-  'lonn-combs': require('../assets/images/imgs/lonn-combs.jpg'),
-  'lucy-zhang': require('../assets/images/imgs/lucy-zhang.jpg'),
-  'luigi-vanfretti': require('../assets/images/imgs/luigi-vanfretti.jpg'),
-  'luiz-victor-repolho-cagliari': require('../assets/images/imgs/luiz-victor-repolho-cagliari.jpg'),
-  'lydia-manikonda': require('../assets/images/imgs/lydia-manikonda.jpg'),
-  'm-arshad-zahangir-chowdhury': require('../assets/images/imgs/m-arshad-zahangir-chowdhury.jpg'),
-  'm-hakan-hekimoglu': require('../assets/images/imgs/m-hakan-hekimoglu.jpg'),
-  'malik-magdon-ismail': require('../assets/images/imgs/malik-magdon-ismail.jpg'),
-  'marc-tatarsky': require('../assets/images/imgs/marc-tatarsky.jpg'),
-  'marcus-carter': require('../assets/images/imgs/marcus-carter.jpg'),
-  'margaret-mcdermott': require('../assets/images/imgs/margaret-mcdermott.jpg'),
-  'margarita-kirova-snover': require('../assets/images/imgs/margarita-kirova-snover.jpg'),
-  'mariah-hahn': require('../assets/images/imgs/mariah-hahn.jpg'),
-  'marianne-nyman': require('../assets/images/imgs/marianne-nyman.jpg'),
-  'marjorie-mcshane': require('../assets/images/imgs/marjorie-mcshane.jpg'),
-  'mark-gilder': require('../assets/images/imgs/mark-gilder.jpg'),
-  'mark-holmes': require('../assets/images/imgs/mark-holmes.jpg'),
-  'mark-shephard': require('../assets/images/imgs/mark-shephard.jpg'),
-  'martin-schmidt': require('../assets/images/imgs/martin-schmidt.jpg'),
-  'marvin-bentley': require('../assets/images/imgs/marvin-bentley.jpg'),
-  'mary-anne-staniszewski': require('../assets/images/imgs/mary-anne-staniszewski.jpg'),
-  'masoud-zarifneshat': require('../assets/images/imgs/masoud-zarifneshat.jpg'),
-  'matt-burgermaster': require('../assets/images/imgs/matt-burgermaster.jpg'),
-  'mattheos-koffas': require('../assets/images/imgs/mattheos-koffas.jpg'),
-  'matthew-goodheart': require('../assets/images/imgs/matthew-goodheart.jpg'),
-  'matthew-lopez': require('../assets/images/imgs/matthew-lopez.jpg'),
-  'matthew-oehlschlaeger': require('../assets/images/imgs/matthew-oehlschlaeger.jpg'),
-  'matthew-pasek': require('../assets/images/imgs/matthew-pasek.jpg'),
-  'matthew-wolf-meyer': require('../assets/images/imgs/matthew-wolf-meyer.jpg'),
-  'maurice-suckling': require('../assets/images/imgs/maurice-suckling.jpg'),
-  'maya-kiehl': require('../assets/images/imgs/maya-kiehl.jpg'),
-  'mei-si': require('../assets/images/imgs/mei-si.jpg'),
-  'meimuneh-sumadi': require('../assets/images/imgs/meimuneh-sumadi.jpg'),
-  'meng-wang': require('../assets/images/imgs/meng-wang.jpg'),
-  'mi-tran': require('../assets/images/imgs/mi-tran.jpg'),
-  'michael-amitay': require('../assets/images/imgs/michael-amitay.jpg'),
-  'michael-century': require('../assets/images/imgs/michael-century.jpg'),
-  'michael-klein-0': require('../assets/images/imgs/michael-klein-0.jpg'),
-  'michael-klein': require('../assets/images/imgs/michael-klein.jpg'),
-  'michael-oatman': require('../assets/images/imgs/michael-oatman.jpg'),
-  'michael-symans': require('../assets/images/imgs/michael-symans.jpg'),
-  'miguel-matos': require('../assets/images/imgs/miguel-matos.jpg'),
-  'mike-van-valkenburg': require('../assets/images/imgs/mike-van-valkenburg.jpg'),
-  'min-li': require('../assets/images/imgs/min-li.jpg'),
-  'mina-mahmoudi': require('../assets/images/imgs/mina-mahmoudi.jpg'),
-  'mitchell-murray': require('../assets/images/imgs/mitchell-murray.jpg'),
-  'mohammad-mohammadi-amiri': require('../assets/images/imgs/mohammad-mohammadi-amiri.jpg'),
-  'mohammed-zaki': require('../assets/images/imgs/mohammed-zaki.jpg'),
-  'monica-agarwal': require('../assets/images/imgs/monica-agarwal.jpg'),
-  'morgan-schaller': require('../assets/images/imgs/morgan-schaller.jpg'),
-  'mourad-zeghal': require('../assets/images/imgs/mourad-zeghal.jpg'),
-  'rhett-russo': require('../assets/images/imgs/rhett-russo.jpg'),
-  'stephanie-loveless': require('../assets/images/imgs/stephanie-loveless.jpg'),
+const SHARDS: Record<string, () => Promise<{ default: ImageShard }>> = {
+  'a': () => import('./imageShards/a.80a48ba0'),
+  'b': () => import('./imageShards/b.e462380f'),
+  'c': () => import('./imageShards/c.34735d0c'),
+  'd': () => import('./imageShards/d.37e9f99d'),
+  'e': () => import('./imageShards/e.56ae17be'),
+  'f': () => import('./imageShards/f.5846b831'),
+  'g': () => import('./imageShards/g.06ba7a7f'),
+  'h': () => import('./imageShards/h.165561ad'),
+  'i': () => import('./imageShards/i.51c6528e'),
+  'j': () => import('./imageShards/j.1ca04a7a'),
+  'k': () => import('./imageShards/k.37a6d4a8'),
+  'l': () => import('./imageShards/l.eb36ddaa'),
+  'm': () => import('./imageShards/m.a9eae256'),
+  'n': () => import('./imageShards/n.a93d98f0'),
+  'o': () => import('./imageShards/o.d62964d0'),
+  'p': () => import('./imageShards/p.7320bf6d'),
+  'q': () => import('./imageShards/q.e44a3a10'),
+  'r': () => import('./imageShards/r.00c223bf'),
+  's': () => import('./imageShards/s.95d822cf'),
+  't': () => import('./imageShards/t.74b90067'),
+  'u': () => import('./imageShards/u.24c306df'),
+  'v': () => import('./imageShards/v.c6c75dba'),
+  'w': () => import('./imageShards/w.13180374'),
+  'x': () => import('./imageShards/x.3b99479a'),
+  'y': () => import('./imageShards/y.f6a336d1'),
+  'z': () => import('./imageShards/z.9443eee1'),
 };
+
+const loaded: Record<string, ImageShard> = {};
+const pending: Record<string, Promise<ImageShard>> = {};
+
+function shardOf(key: string): string {
+  return /^[a-z]/.test(key) ? key[0] : '_';
+}
+
+export function hasImage(key: string | undefined): key is ImageKey {
+  return !!key && IMAGE_KEYS.has(key);
+}
+
+// The source if its shard is already loaded, without waiting
+export function getLoadedImage(key: string, variant: ImageVariant = 'thumb'): ImageSource | undefined {
+  return loaded[shardOf(key)]?.[key]?.[variant];
+}
+
+export function loadImage(key: string, variant: ImageVariant = 'thumb'): Promise<ImageSource | undefined> {
+  if (!hasImage(key)) return Promise.resolve(undefined);
+  const name = shardOf(key);
+  if (!pending[name]) {
+    pending[name] = SHARDS[name]().then((module) => (loaded[name] = module.default));
+  }
+  return pending[name].then((shard) => shard[key]?.[variant]);
+}
+
+// Image source for a key, loading its shard on first use; undefined while
+// loading or when there is no photo
+export function useImage(key: string | undefined, variant: ImageVariant = 'thumb'): ImageSource | undefined {
+  const [source, setSource] = useState(() => (key ? getLoadedImage(key, variant) : undefined));
+  useEffect(() => {
+    let live = true;
+    if (!hasImage(key)) {
+      setSource(undefined);
+      return;
+    }
+    loadImage(key, variant).then((loadedSource) => {
+      if (live) setSource(loadedSource);
+    });
+    return () => {
+      live = false;
+    };
+  }, [key, variant]);
+  return source;
+}
@@ -34,7 +34,7 @@ import {
 import { SafeAreaProvider } from 'react-native-safe-area-context';
 import Icon from 'react-native-vector-icons/Feather';
 import { Image } from 'react-native';
-import { IMAGE_MAP, ImageKey } from './ImageMap';
+import { useImage } from './ImageMap';
 
 // --- Type Definitions ---
 type ProfessorProfileProps = {
@@ -100,12 +100,14 @@ const ClassCard = ({ course, isExpanded, onToggle, navigate }: ClassCardProps) =
 };
 
 // Component to render professor image or default icon
-const ProfImage = ({ imageKey }: { imageKey: ImageKey }) => {
-  if (!imageKey || !IMAGE_MAP[imageKey]) {
+// (the photo's shard of the image map is loaded the first time it is shown)
+const ProfImage = ({ imageKey }: { imageKey: string }) => {
+  const source = useImage(imageKey, 'detail');
+  if (!source) {
     return (<Ionicons name="person-circle-outline" size={100} color="#627768" />);
   } else
   return (
-    <Image source={IMAGE_MAP[imageKey]} style={{width: 100, height: 100}} />
+    <Image source={source} style={{width: 100, height: 100}} />
   );
 }
 
@@ -133,7 +135,7 @@ export default function ProfessorProfile({
     if (name == undefined) return '';
     return name;
   }
-  const imageKey = kebabCase() as ImageKey;
+  const imageKey = kebabCase();
   console.log('here is the imagekey', imageKey)
 
   const handleBackPress = () => {
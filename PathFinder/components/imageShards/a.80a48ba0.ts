@@ -0,0 +1,39 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'abby-kinchy': { thumb: require('../../assets/images/faculty/thumb/abby-kinchy.ad0c13ae.webp'), detail: require('../../assets/images/faculty/detail/abby-kinchy.c5fbceb3.webp') },
+  'adam-biggs': { thumb: require('../../assets/images/faculty/thumb/adam-biggs.48ceff75.webp'), detail: require('../../assets/images/faculty/detail/adam-biggs.6700324c.webp') },
+  'adam-dayem': { thumb: require('../../assets/images/faculty/thumb/adam-dayem.5593d236.webp'), detail: require('../../assets/images/faculty/detail/adam-dayem.fdcc212b.webp') },
+  'adrianna-oropello': { thumb: require('../../assets/images/faculty/thumb/adrianna-oropello.0dfcc078.webp'), detail: require('../../assets/images/faculty/detail/adrianna-oropello.c93b5c69.webp') },
+  'agung-julius': { thumb: require('../../assets/images/faculty/thumb/agung-julius.d94d0baa.webp'), detail: require('../../assets/images/faculty/detail/agung-julius.6b2ecb79.webp') },
+  'ahmed-eleish': { thumb: require('../../assets/images/faculty/thumb/ahmed-eleish.723fb458.webp'), detail: require('../../assets/images/faculty/detail/ahmed-eleish.7fc17f6e.webp') },
+  'alex-gittens': { thumb: require('../../assets/images/faculty/thumb/alex-gittens.4a326729.webp'), detail: require('../../assets/images/faculty/detail/alex-gittens.4732d8bc.webp') },
+  'alex-patterson': { thumb: require('../../assets/images/faculty/thumb/alex-patterson.03f2d9a6.webp'), detail: require('../../assets/images/faculty/detail/alex-patterson.2e9b2140.webp') },
+  'alexander-hiland': { thumb: require('../../assets/images/faculty/thumb/alexander-hiland.9d1f1f71.webp'), detail: require('../../assets/images/faculty/detail/alexander-hiland.1f33bc30.webp') },
+  'alexander-ma': { thumb: require('../../assets/images/faculty/thumb/alexander-ma.95c95792.webp'), detail: require('../../assets/images/faculty/detail/alexander-ma.7a378a73.webp') },
+  'alexandros-tsamis': { thumb: require('../../assets/images/faculty/thumb/alexandros-tsamis.fd1778d3.webp'), detail: require('../../assets/images/faculty/detail/alexandros-tsamis.174dcaff.webp') },
+  'alhussein-abouzeid': { thumb: require('../../assets/images/faculty/thumb/alhussein-abouzeid.3846e7a7.webp'), detail: require('../../assets/images/faculty/detail/alhussein-abouzeid.8ebb8797.webp') },
+  'ali-shahsavari': { thumb: require('../../assets/images/faculty/thumb/ali-shahsavari.056a0d37.webp'), detail: require('../../assets/images/faculty/detail/ali-shahsavari.c713d92c.webp') },
+  'ali-tajer': { thumb: require('../../assets/images/faculty/thumb/ali-tajer.8d1a7a6c.webp'), detail: require('../../assets/images/faculty/detail/ali-tajer.77a65bb6.webp') },
+  'alicia-walf': { thumb: require('../../assets/images/faculty/thumb/alicia-walf.ec1e2ee9.webp'), detail: require('../../assets/images/faculty/detail/alicia-walf.969e3a5d.webp') },
+  'allison-hoffman': { thumb: require('../../assets/images/faculty/thumb/allison-hoffman.d1e6c4fa.webp'), detail: require('../../assets/images/faculty/detail/allison-hoffman.dcfb69e6.webp') },
+  'amgalanbaatar-baldansuren': { thumb: require('../../assets/images/faculty/thumb/amgalanbaatar-baldansuren.9f11389a.webp'), detail: require('../../assets/images/faculty/detail/amgalanbaatar-baldansuren.25d25a4b.webp') },
+  'amir-hirsa': { thumb: require('../../assets/images/faculty/thumb/amir-hirsa.9c125d71.webp'), detail: require('../../assets/images/faculty/detail/amir-hirsa.7353033f.webp') },
+  'ana-milanova': { thumb: require('../../assets/images/faculty/thumb/ana-milanova.e748e85b.webp'), detail: require('../../assets/images/faculty/detail/ana-milanova.ebab0cfb.webp') },
+  'andres-munoz-rojas': { thumb: require('../../assets/images/faculty/thumb/andres-munoz-rojas.5f75a1fa.webp'), detail: require('../../assets/images/faculty/detail/andres-munoz-rojas.aafb4fa6.webp') },
+  'andrew-fitzgerald': { thumb: require('../../assets/images/faculty/thumb/andrew-fitzgerald.46b1f9be.webp'), detail: require('../../assets/images/faculty/detail/andrew-fitzgerald.8dc7d070.webp') },
+  'andrew-horning': { thumb: require('../../assets/images/faculty/thumb/andrew-horning.93dc9798.webp'), detail: require('../../assets/images/faculty/detail/andrew-horning.1d6a93db.webp') },
+  'anita-greenfield': { thumb: require('../../assets/images/faculty/thumb/anita-greenfield.69e24640.webp'), detail: require('../../assets/images/faculty/detail/anita-greenfield.444cba8e.webp') },
+  'anthony-tessari': { thumb: require('../../assets/images/faculty/thumb/anthony-tessari.73ae7d71.webp'), detail: require('../../assets/images/faculty/detail/anthony-tessari.fc863a70.webp') },
+  'antoinette-maniatty': { thumb: require('../../assets/images/faculty/thumb/antoinette-maniatty.24733e45.webp'), detail: require('../../assets/images/faculty/detail/antoinette-maniatty.02aad100.webp') },
+  'aparna-gupta': { thumb: require('../../assets/images/faculty/thumb/aparna-gupta.027c23d3.webp'), detail: require('../../assets/images/faculty/detail/aparna-gupta.cc4148b0.webp') },
+  'arpit-agrawal': { thumb: require('../../assets/images/faculty/thumb/arpit-agrawal.1158fc85.webp'), detail: require('../../assets/images/faculty/detail/arpit-agrawal.c04be7e7.webp') },
+  'arta-yazdanseta': { thumb: require('../../assets/images/faculty/thumb/arta-yazdanseta.0150d8ff.webp'), detail: require('../../assets/images/faculty/detail/arta-yazdanseta.b34df635.webp') },
+  'asish-ghosh': { thumb: require('../../assets/images/faculty/thumb/asish-ghosh.8c5e4fb2.webp'), detail: require('../../assets/images/faculty/detail/asish-ghosh.0e2a6511.webp') },
+  'audrey-peterson-mccann': { thumb: require('../../assets/images/faculty/thumb/audrey-peterson-mccann.1c143cc2.webp'), detail: require('../../assets/images/faculty/detail/audrey-peterson-mccann.1551bfd3.webp') },
+  'azita-hirsa': { thumb: require('../../assets/images/faculty/thumb/azita-hirsa.f355a18a.webp'), detail: require('../../assets/images/faculty/detail/azita-hirsa.994cbbc8.webp') },
+};
+
+export default shard;
@@ -0,0 +1,32 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'b-wayne-bequette': { thumb: require('../../assets/images/faculty/thumb/b-wayne-bequette.14c96af3.webp'), detail: require('../../assets/images/faculty/detail/b-wayne-bequette.65fed4bc.webp') },
+  'bahar-cavdar': { thumb: require('../../assets/images/faculty/thumb/bahar-cavdar.f3f4abd9.webp'), detail: require('../../assets/images/faculty/detail/bahar-cavdar.f6488cbb.webp') },
+  'barbara-cutler': { thumb: require('../../assets/images/faculty/thumb/barbara-cutler.9532300f.webp'), detail: require('../../assets/images/faculty/detail/barbara-cutler.4b765aee.webp') },
+  'belmiro-galo-da-silva': { thumb: require('../../assets/images/faculty/thumb/belmiro-galo-da-silva.2eb3b9f1.webp'), detail: require('../../assets/images/faculty/detail/belmiro-galo-da-silva.16058f8b.webp') },
+  'ben-larson': { thumb: require('../../assets/images/faculty/thumb/ben-larson.2b72cf0f.webp'), detail: require('../../assets/images/faculty/detail/ben-larson.ee6d0607.webp') },
+  'benj-gleeksman': { thumb: require('../../assets/images/faculty/thumb/benj-gleeksman.05bef0cc.webp'), detail: require('../../assets/images/faculty/detail/benj-gleeksman.a0be0dc8.webp') },
+  'benjamin-chang': { thumb: require('../../assets/images/faculty/thumb/benjamin-chang.4198c997.webp'), detail: require('../../assets/images/faculty/detail/benjamin-chang.d62576ac.webp') },
+  'bill-francis': { thumb: require('../../assets/images/faculty/thumb/bill-francis.678e7201.webp'), detail: require('../../assets/images/faculty/detail/bill-francis.7919f4d0.webp') },
+  'billur-aksoy': { thumb: require('../../assets/images/faculty/thumb/billur-aksoy.2e7a2e8a.webp'), detail: require('../../assets/images/faculty/detail/billur-aksoy.ddbc693e.webp') },
+  'bin-gao': { thumb: require('../../assets/images/faculty/thumb/bin-gao.7e94564d.webp'), detail: require('../../assets/images/faculty/detail/bin-gao.5a0e3e44.webp') },
+  'birsen-yazici': { thumb: require('../../assets/images/faculty/thumb/birsen-yazici.76e26623.webp'), detail: require('../../assets/images/faculty/detail/birsen-yazici.01902019.webp') },
+  'blanca-barquera': { thumb: require('../../assets/images/faculty/thumb/blanca-barquera.6cb3d126.webp'), detail: require('../../assets/images/faculty/detail/blanca-barquera.303d8d8d.webp') },
+  'bolek-szymanski': { thumb: require('../../assets/images/faculty/thumb/bolek-szymanski.ef020036.webp'), detail: require('../../assets/images/faculty/detail/bolek-szymanski.8b064e9f.webp') },
+  'boon-ooi': { thumb: require('../../assets/images/faculty/thumb/boon-ooi.b4c5ea7b.webp'), detail: require('../../assets/images/faculty/detail/boon-ooi.adff51d5.webp') },
+  'bram-van-heuveln': { thumb: require('../../assets/images/faculty/thumb/bram-van-heuveln.91d96d4e.webp'), detail: require('../../assets/images/faculty/detail/bram-van-heuveln.0d2678bc.webp') },
+  'branda-miller': { thumb: require('../../assets/images/faculty/thumb/branda-miller.5bb47674.webp'), detail: require('../../assets/images/faculty/detail/branda-miller.fe079c21.webp') },
+  'brandi-brace': { thumb: require('../../assets/images/faculty/thumb/brandi-brace.782b1d0f.webp'), detail: require('../../assets/images/faculty/detail/brandi-brace.bc738abb.webp') },
+  'brandon-costelloe-kuehn': { thumb: require('../../assets/images/faculty/thumb/brandon-costelloe-kuehn.ac6ebb07.webp'), detail: require('../../assets/images/faculty/detail/brandon-costelloe-kuehn.1a7fb5d7.webp') },
+  'brett-fajen': { thumb: require('../../assets/images/faculty/thumb/brett-fajen.c24da0c8.webp'), detail: require('../../assets/images/faculty/detail/brett-fajen.3a49495f.webp') },
+  'brian-clark': { thumb: require('../../assets/images/faculty/thumb/brian-clark.6b954053.webp'), detail: require('../../assets/images/faculty/detail/brian-clark.ac5ffb38.webp') },
+  'brian-jensen': { thumb: require('../../assets/images/faculty/thumb/brian-jensen.14bd7e6b.webp'), detail: require('../../assets/images/faculty/detail/brian-jensen.383f048c.webp') },
+  'bruce-piper': { thumb: require('../../assets/images/faculty/thumb/bruce-piper.19f049e1.webp'), detail: require('../../assets/images/faculty/detail/bruce-piper.61690b97.webp') },
+  'bruno-nkuiya-mbakop': { thumb: require('../../assets/images/faculty/thumb/bruno-nkuiya-mbakop.862da809.webp'), detail: require('../../assets/images/faculty/detail/bruno-nkuiya-mbakop.f407e5af.webp') },
+  'bulent-yener': { thumb: require('../../assets/images/faculty/thumb/bulent-yener.86cec9b7.webp'), detail: require('../../assets/images/faculty/detail/bulent-yener.e749b4a5.webp') },
+};
+
+export default shard;
@@ -0,0 +1,39 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'caleb-white': { thumb: require('../../assets/images/faculty/thumb/caleb-white.752db43b.webp'), detail: require('../../assets/images/faculty/detail/caleb-white.bf65092a.webp') },
+  'cara-wang': { thumb: require('../../assets/images/faculty/thumb/cara-wang.73a64972.webp'), detail: require('../../assets/images/faculty/detail/cara-wang.c8712f4a.webp') },
+  'carlos-varela': { thumb: require('../../assets/images/faculty/thumb/carlos-varela.1a6fcc1d.webp'), detail: require('../../assets/images/faculty/detail/carlos-varela.2f7deefa.webp') },
+  'casey-hoffman': { thumb: require('../../assets/images/faculty/thumb/casey-hoffman.bbc5e70c.webp'), detail: require('../../assets/images/faculty/detail/casey-hoffman.0f93b35f.webp') },
+  'catalin-picu': { thumb: require('../../assets/images/faculty/thumb/catalin-picu.c9eb4f4a.webp'), detail: require('../../assets/images/faculty/detail/catalin-picu.603505e8.webp') },
+  'catherine-royer': { thumb: require('../../assets/images/faculty/thumb/catherine-royer.fd62552b.webp'), detail: require('../../assets/images/faculty/detail/catherine-royer.3465026c.webp') },
+  'chaitanya-ullal': { thumb: require('../../assets/images/faculty/thumb/chaitanya-ullal.cf013da7.webp'), detail: require('../../assets/images/faculty/detail/chaitanya-ullal.71e0fe6c.webp') },
+  'chanaka-edirisinghe': { thumb: require('../../assets/images/faculty/thumb/chanaka-edirisinghe.acd33a80.webp'), detail: require('../../assets/images/faculty/detail/chanaka-edirisinghe.4eb3f0e9.webp') },
+  'charles-martin': { thumb: require('../../assets/images/faculty/thumb/charles-martin.50846296.webp'), detail: require('../../assets/images/faculty/detail/charles-martin.5a9320aa.webp') },
+  'chjan-lim': { thumb: require('../../assets/images/faculty/thumb/chjan-lim.80e62adf.webp'), detail: require('../../assets/images/faculty/detail/chjan-lim.c499dcf7.webp') },
+  'chris-bystroff': { thumb: require('../../assets/images/faculty/thumb/chris-bystroff.329b60d4.webp'), detail: require('../../assets/images/faculty/detail/chris-bystroff.237ee1f5.webp') },
+  'chris-letchford': { thumb: require('../../assets/images/faculty/thumb/chris-letchford.7d5ac7f6.webp'), detail: require('../../assets/images/faculty/detail/chris-letchford.0ec3d9e6.webp') },
+  'chris-mcdermott': { thumb: require('../../assets/images/faculty/thumb/chris-mcdermott.bb5eddaa.webp'), detail: require('../../assets/images/faculty/detail/chris-mcdermott.1ec50880.webp') },
+  'christian-wetzel': { thumb: require('../../assets/images/faculty/thumb/christian-wetzel.622c7923.webp'), detail: require('../../assets/images/faculty/detail/christian-wetzel.22d5dadd.webp') },
+  'christopher-carothers': { thumb: require('../../assets/images/faculty/thumb/christopher-carothers.fadb62c2.webp'), detail: require('../../assets/images/faculty/detail/christopher-carothers.67c62ae8.webp') },
+  'christopher-cioffi': { thumb: require('../../assets/images/faculty/thumb/christopher-cioffi.1a28e519.webp'), detail: require('../../assets/images/faculty/detail/christopher-cioffi.0d6b0a94.webp') },
+  'christopher-fisher-lochhead': { thumb: require('../../assets/images/faculty/thumb/christopher-fisher-lochhead.2622c67e.webp'), detail: require('../../assets/images/faculty/detail/christopher-fisher-lochhead.492f5460.webp') },
+  'christopher-jeansonne': { thumb: require('../../assets/images/faculty/thumb/christopher-jeansonne.31891aa8.webp'), detail: require('../../assets/images/faculty/detail/christopher-jeansonne.e618110c.webp') },
+  'christopher-perry': { thumb: require('../../assets/images/faculty/thumb/christopher-perry.9918b384.webp'), detail: require('../../assets/images/faculty/detail/christopher-perry.d8ec7a96.webp') },
+  'christopher-puleo': { thumb: require('../../assets/images/faculty/thumb/christopher-puleo.c486bd12.webp'), detail: require('../../assets/images/faculty/detail/christopher-puleo.d3046a0b.webp') },
+  'christopher-sims': { thumb: require('../../assets/images/faculty/thumb/christopher-sims.cf9cb780.webp'), detail: require('../../assets/images/faculty/detail/christopher-sims.10d5c9a6.webp') },
+  'christopher-tozzi': { thumb: require('../../assets/images/faculty/thumb/christopher-tozzi.e48c4866.webp'), detail: require('../../assets/images/faculty/detail/christopher-tozzi.3dc5886d.webp') },
+  'christos-varsamis': { thumb: require('../../assets/images/faculty/thumb/christos-varsamis.9557c229.webp'), detail: require('../../assets/images/faculty/detail/christos-varsamis.57b3cfcb.webp') },
+  'chrysi-nanou': { thumb: require('../../assets/images/faculty/thumb/chrysi-nanou.4eac0138.webp'), detail: require('../../assets/images/faculty/detail/chrysi-nanou.41951e8b.webp') },
+  'chuck-stewart': { thumb: require('../../assets/images/faculty/thumb/chuck-stewart.dc605f8e.webp'), detail: require('../../assets/images/faculty/detail/chuck-stewart.9c8ac2ad.webp') },
+  'chulsung-bae': { thumb: require('../../assets/images/faculty/thumb/chulsung-bae.929428c5.webp'), detail: require('../../assets/images/faculty/detail/chulsung-bae.b34e31fe.webp') },
+  'chunyu-wang': { thumb: require('../../assets/images/faculty/thumb/chunyu-wang.4c771117.webp'), detail: require('../../assets/images/faculty/detail/chunyu-wang.7ef6f204.webp') },
+  'clint-ballinger': { thumb: require('../../assets/images/faculty/thumb/clint-ballinger.5860ec3b.webp'), detail: require('../../assets/images/faculty/detail/clint-ballinger.7f6c1722.webp') },
+  'conor-lennon': { thumb: require('../../assets/images/faculty/thumb/conor-lennon.0a1e05bf.webp'), detail: require('../../assets/images/faculty/detail/conor-lennon.77c5c075.webp') },
+  'corey-woodcock': { thumb: require('../../assets/images/faculty/thumb/corey-woodcock.8f3010bc.webp'), detail: require('../../assets/images/faculty/detail/corey-woodcock.18808f9e.webp') },
+  'corinne-jones': { thumb: require('../../assets/images/faculty/thumb/corinne-jones.bb63eb5d.webp'), detail: require('../../assets/images/faculty/detail/corinne-jones.9d21c1ae.webp') },
+};
+
+export default shard;
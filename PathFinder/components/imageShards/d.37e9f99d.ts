@@ -0,0 +1,29 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'damien-west': { thumb: require('../../assets/images/faculty/thumb/damien-west.0c47a8cc.webp'), detail: require('../../assets/images/faculty/detail/damien-west.036ca576.webp') },
+  'dan-ditursi': { thumb: require('../../assets/images/faculty/thumb/dan-ditursi.56845e90.webp'), detail: require('../../assets/images/faculty/detail/dan-ditursi.bf2a0f04.webp') },
+  'daniel-gall': { thumb: require('../../assets/images/faculty/thumb/daniel-gall.1b2c7adc.webp'), detail: require('../../assets/images/faculty/detail/daniel-gall.de27bf46.webp') },
+  'daniel-lander': { thumb: require('../../assets/images/faculty/thumb/daniel-lander.781fc1ca.webp'), detail: require('../../assets/images/faculty/detail/daniel-lander.2d662cee.webp') },
+  'daniel-lewis': { thumb: require('../../assets/images/faculty/thumb/daniel-lewis.a044a13e.webp'), detail: require('../../assets/images/faculty/detail/daniel-lewis.a8767207.webp') },
+  'daniel-lyles': { thumb: require('../../assets/images/faculty/thumb/daniel-lyles.734c7ba7.webp'), detail: require('../../assets/images/faculty/detail/daniel-lyles.be1cec74.webp') },
+  'daniel-stevenson': { thumb: require('../../assets/images/faculty/thumb/daniel-stevenson.e6b98b08.webp'), detail: require('../../assets/images/faculty/detail/daniel-stevenson.e1157f3d.webp') },
+  'daniel-thero': { thumb: require('../../assets/images/faculty/thumb/daniel-thero.114e0efe.webp'), detail: require('../../assets/images/faculty/detail/daniel-thero.63e1a95b.webp') },
+  'daniel-walczyk': { thumb: require('../../assets/images/faculty/thumb/daniel-walczyk.223d2b7a.webp'), detail: require('../../assets/images/faculty/detail/daniel-walczyk.9ddefbea.webp') },
+  'david-corr': { thumb: require('../../assets/images/faculty/thumb/david-corr.5b6be682.webp'), detail: require('../../assets/images/faculty/detail/david-corr.4ee03c47.webp') },
+  'deanna-thompson': { thumb: require('../../assets/images/faculty/thumb/deanna-thompson.02a57fac.webp'), detail: require('../../assets/images/faculty/detail/deanna-thompson.85f1d9d4.webp') },
+  'deborah-mcguinness': { thumb: require('../../assets/images/faculty/thumb/deborah-mcguinness.c5954376.webp'), detail: require('../../assets/images/faculty/detail/deborah-mcguinness.a2f338f0.webp') },
+  'deepak-vashishth': { thumb: require('../../assets/images/faculty/thumb/deepak-vashishth.229e17f9.webp'), detail: require('../../assets/images/faculty/detail/deepak-vashishth.84d35a64.webp') },
+  'dennis-shelden': { thumb: require('../../assets/images/faculty/thumb/dennis-shelden.a46fd8ab.webp'), detail: require('../../assets/images/faculty/detail/dennis-shelden.403611ab.webp') },
+  'diana-borca-tasciuc': { thumb: require('../../assets/images/faculty/thumb/diana-borca-tasciuc.df92dec7.webp'), detail: require('../../assets/images/faculty/detail/diana-borca-tasciuc.47361056.webp') },
+  'diego-moran-ramirez': { thumb: require('../../assets/images/faculty/thumb/diego-moran-ramirez.5906f9ac.webp'), detail: require('../../assets/images/faculty/detail/diego-moran-ramirez.462391b2.webp') },
+  'dominik-fritz': { thumb: require('../../assets/images/faculty/thumb/dominik-fritz.ade98742.webp'), detail: require('../../assets/images/faculty/detail/dominik-fritz.ecfc346d.webp') },
+  'donald-schwendeman': { thumb: require('../../assets/images/faculty/thumb/donald-schwendeman.0521938e.webp'), detail: require('../../assets/images/faculty/detail/donald-schwendeman.6d3f6c6d.webp') },
+  'dorit-nevo': { thumb: require('../../assets/images/faculty/thumb/dorit-nevo.350f92a7.webp'), detail: require('../../assets/images/faculty/detail/dorit-nevo.3fd43b2a.webp') },
+  'doug-swank': { thumb: require('../../assets/images/faculty/thumb/doug-swank.b34c78a0.webp'), detail: require('../../assets/images/faculty/detail/doug-swank.3ca7e792.webp') },
+  'drronsun': { thumb: require('../../assets/images/faculty/thumb/drronsun.2fcd02c3.webp'), detail: require('../../assets/images/faculty/detail/drronsun.b699974d.webp') },
+};
+
+export default shard;
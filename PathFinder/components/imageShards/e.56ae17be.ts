@@ -0,0 +1,28 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'edmund-palermo': { thumb: require('../../assets/images/faculty/thumb/edmund-palermo.fa592982.webp'), detail: require('../../assets/images/faculty/detail/edmund-palermo.b3ede480.webp') },
+  'edwin-fohtung': { thumb: require('../../assets/images/faculty/thumb/edwin-fohtung.da3c068a.webp'), detail: require('../../assets/images/faculty/detail/edwin-fohtung.628ed021.webp') },
+  'eliane-zerbetto-traldi': { thumb: require('../../assets/images/faculty/thumb/eliane-zerbetto-traldi.693623dd.webp'), detail: require('../../assets/images/faculty/detail/eliane-zerbetto-traldi.e5ae645e.webp') },
+  'elisabeth-brown': { thumb: require('../../assets/images/faculty/thumb/elisabeth-brown.cb8e0575.webp'), detail: require('../../assets/images/faculty/detail/elisabeth-brown.689a416d.webp') },
+  'elizabeth-blaber': { thumb: require('../../assets/images/faculty/thumb/elizabeth-blaber.a31c0fd6.webp'), detail: require('../../assets/images/faculty/detail/elizabeth-blaber.22c263d8.webp') },
+  'elizabeth-kam': { thumb: require('../../assets/images/faculty/thumb/elizabeth-kam.27088317.webp'), detail: require('../../assets/images/faculty/detail/elizabeth-kam.233ec3ca.webp') },
+  'elizabeth-press': { thumb: require('../../assets/images/faculty/thumb/elizabeth-press.1dd23cff.webp'), detail: require('../../assets/images/faculty/detail/elizabeth-press.9628bb30.webp') },
+  'elizabeth-sprague': { thumb: require('../../assets/images/faculty/thumb/elizabeth-sprague.c718bc48.webp'), detail: require('../../assets/images/faculty/detail/elizabeth-sprague.b1b34dcf.webp') },
+  'elliot-anshelevich': { thumb: require('../../assets/images/faculty/thumb/elliot-anshelevich.67438602.webp'), detail: require('../../assets/images/faculty/detail/elliot-anshelevich.394101bc.webp') },
+  'emily-gruendel': { thumb: require('../../assets/images/faculty/thumb/emily-gruendel.a6e12f48.webp'), detail: require('../../assets/images/faculty/detail/emily-gruendel.30eb6d19.webp') },
+  'emily-liu': { thumb: require('../../assets/images/faculty/thumb/emily-liu.4a6041a4.webp'), detail: require('../../assets/images/faculty/detail/emily-liu.a3fb8331.webp') },
+  'emrah-aktunc': { thumb: require('../../assets/images/faculty/thumb/emrah-aktunc.8f919f4e.webp'), detail: require('../../assets/images/faculty/detail/emrah-aktunc.0740f795.webp') },
+  'eric-ameres': { thumb: require('../../assets/images/faculty/thumb/eric-ameres.770fd252.webp'), detail: require('../../assets/images/faculty/detail/eric-ameres.1ac8e55f.webp') },
+  'eric-h-ledet': { thumb: require('../../assets/images/faculty/thumb/eric-h-ledet.582196a6.webp'), detail: require('../../assets/images/faculty/detail/eric-h-ledet.ab1a1561.webp') },
+  'eric-rutledge': { thumb: require('../../assets/images/faculty/thumb/eric-rutledge.13a3f1e3.webp'), detail: require('../../assets/images/faculty/detail/eric-rutledge.de49ec0c.webp') },
+  'esen-yel': { thumb: require('../../assets/images/faculty/thumb/esen-yel.37f59b85.webp'), detail: require('../../assets/images/faculty/detail/esen-yel.da239056.webp') },
+  'esra-agca-aktunc': { thumb: require('../../assets/images/faculty/thumb/esra-agca-aktunc.aacebcae.webp'), detail: require('../../assets/images/faculty/detail/esra-agca-aktunc.6406bdf6.webp') },
+  'esther-wertz': { thumb: require('../../assets/images/faculty/thumb/esther-wertz.5a56268d.webp'), detail: require('../../assets/images/faculty/detail/esther-wertz.b11b9da0.webp') },
+  'ethan-brown': { thumb: require('../../assets/images/faculty/thumb/ethan-brown.2d8e99c1.webp'), detail: require('../../assets/images/faculty/detail/ethan-brown.a4d3ae99.webp') },
+  'eyosias-ashenafi': { thumb: require('../../assets/images/faculty/thumb/eyosias-ashenafi.7c112375.webp'), detail: require('../../assets/images/faculty/detail/eyosias-ashenafi.9feee2fe.webp') },
+};
+
+export default shard;
@@ -0,0 +1,16 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'fabian-faulstich': { thumb: require('../../assets/images/faculty/thumb/fabian-faulstich.f8417b0d.webp'), detail: require('../../assets/images/faculty/detail/fabian-faulstich.2af4f1ff.webp') },
+  'fengyan-li': { thumb: require('../../assets/images/faculty/thumb/fengyan-li.d94bc672.webp'), detail: require('../../assets/images/faculty/detail/fengyan-li.d98819d8.webp') },
+  'filbert-totsingan': { thumb: require('../../assets/images/faculty/thumb/filbert-totsingan.4ba3f29b.webp'), detail: require('../../assets/images/faculty/detail/filbert-totsingan.ab7da376.webp') },
+  'fotis-kopsaftopoulos': { thumb: require('../../assets/images/faculty/thumb/fotis-kopsaftopoulos.8931d048.webp'), detail: require('../../assets/images/faculty/detail/fotis-kopsaftopoulos.e3454499.webp') },
+  'franck-djeumou-mbouwe': { thumb: require('../../assets/images/faculty/thumb/franck-djeumou-mbouwe.7e2979f7.webp'), detail: require('../../assets/images/faculty/detail/franck-djeumou-mbouwe.075fe952.webp') },
+  'frank-spear': { thumb: require('../../assets/images/faculty/thumb/frank-spear.54e4ea94.webp'), detail: require('../../assets/images/faculty/detail/frank-spear.f8157da1.webp') },
+  'fred-schubert': { thumb: require('../../assets/images/faculty/thumb/fred-schubert.fb808b8a.webp'), detail: require('../../assets/images/faculty/detail/fred-schubert.bb053d29.webp') },
+  'fudong-han': { thumb: require('../../assets/images/faculty/thumb/fudong-han.ddd2882e.webp'), detail: require('../../assets/images/faculty/detail/fudong-han.9a4af326.webp') },
+};
+
+export default shard;
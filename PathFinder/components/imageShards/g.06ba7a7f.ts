@@ -0,0 +1,23 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'gaetano-montelione': { thumb: require('../../assets/images/faculty/thumb/gaetano-montelione.ae8beede.webp'), detail: require('../../assets/images/faculty/detail/gaetano-montelione.0d17f1c2.webp') },
+  'ganpati-ramanath': { thumb: require('../../assets/images/faculty/thumb/ganpati-ramanath.001a23d3.webp'), detail: require('../../assets/images/faculty/detail/ganpati-ramanath.c8840638.webp') },
+  'gaurav-jain': { thumb: require('../../assets/images/faculty/thumb/gaurav-jain.cae26d4d.webp'), detail: require('../../assets/images/faculty/detail/gaurav-jain.99561115.webp') },
+  'ge-wang': { thumb: require('../../assets/images/faculty/thumb/ge-wang.775c4525.webp'), detail: require('../../assets/images/faculty/detail/ge-wang.37eaffa8.webp') },
+  'geetu-sharma': { thumb: require('../../assets/images/faculty/thumb/geetu-sharma.d2da1ee9.webp'), detail: require('../../assets/images/faculty/detail/geetu-sharma.70ca0587.webp') },
+  'george-lee': { thumb: require('../../assets/images/faculty/thumb/george-lee.4a6cd240.webp'), detail: require('../../assets/images/faculty/detail/george-lee.cb065e65.webp') },
+  'george-makhatadze': { thumb: require('../../assets/images/faculty/thumb/george-makhatadze.1d1311f6.webp'), detail: require('../../assets/images/faculty/detail/george-makhatadze.ac960d62.webp') },
+  'george-slota': { thumb: require('../../assets/images/faculty/thumb/george-slota.bb888914.webp'), detail: require('../../assets/images/faculty/detail/george-slota.ac699ed9.webp') },
+  'georges-belfort': { thumb: require('../../assets/images/faculty/thumb/georges-belfort.9eb73e53.webp'), detail: require('../../assets/images/faculty/detail/georges-belfort.df9d30cd.webp') },
+  'gerald-korenowski': { thumb: require('../../assets/images/faculty/thumb/gerald-korenowski.c99c8aa8.webp'), detail: require('../../assets/images/faculty/detail/gerald-korenowski.91995ea1.webp') },
+  'gina-kucinski': { thumb: require('../../assets/images/faculty/thumb/gina-kucinski.d07e1b1d.webp'), detail: require('../../assets/images/faculty/detail/gina-kucinski.d38541d9.webp') },
+  'glenn-ciolek': { thumb: require('../../assets/images/faculty/thumb/glenn-ciolek.f1b55ec4.webp'), detail: require('../../assets/images/faculty/detail/glenn-ciolek.e725c425.webp') },
+  'gregor-kovacic': { thumb: require('../../assets/images/faculty/thumb/gregor-kovacic.15f356a7.webp'), detail: require('../../assets/images/faculty/detail/gregor-kovacic.a71ef7c7.webp') },
+  'gwo-ching-wang': { thumb: require('../../assets/images/faculty/thumb/gwo-ching-wang.002e2731.webp'), detail: require('../../assets/images/faculty/detail/gwo-ching-wang.1ae5d029.webp') },
+  'gyorgy-korniss': { thumb: require('../../assets/images/faculty/thumb/gyorgy-korniss.2e7b1463.webp'), detail: require('../../assets/images/faculty/detail/gyorgy-korniss.062db649.webp') },
+};
+
+export default shard;
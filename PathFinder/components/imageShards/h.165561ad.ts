@@ -0,0 +1,17 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'heidi-jo-newberg': { thumb: require('../../assets/images/faculty/thumb/heidi-jo-newberg.ad8ba1f8.webp'), detail: require('../../assets/images/faculty/detail/heidi-jo-newberg.e365b9fd.webp') },
+  'helen-zha': { thumb: require('../../assets/images/faculty/thumb/helen-zha.cc4b409a.webp'), detail: require('../../assets/images/faculty/detail/helen-zha.0683f98a.webp') },
+  'helen-zhou': { thumb: require('../../assets/images/faculty/thumb/helen-zhou.6f25b658.webp'), detail: require('../../assets/images/faculty/detail/helen-zhou.c26985a3.webp') },
+  'heng-liu': { thumb: require('../../assets/images/faculty/thumb/heng-liu.13d57937.webp'), detail: require('../../assets/images/faculty/detail/heng-liu.72a14e5d.webp') },
+  'hisham-mohamed': { thumb: require('../../assets/images/faculty/thumb/hisham-mohamed.db7f11bf.webp'), detail: require('../../assets/images/faculty/detail/hisham-mohamed.7c09f25e.webp') },
+  'holly-traver': { thumb: require('../../assets/images/faculty/thumb/holly-traver.7a851e97.webp'), detail: require('../../assets/images/faculty/detail/holly-traver.f59ac324.webp') },
+  'huaming-peng': { thumb: require('../../assets/images/faculty/thumb/huaming-peng.a1254a01.webp'), detail: require('../../assets/images/faculty/detail/huaming-peng.20ca4a99.webp') },
+  'humberto-terrones': { thumb: require('../../assets/images/faculty/thumb/humberto-terrones.8929d6f4.webp'), detail: require('../../assets/images/faculty/detail/humberto-terrones.f0eaab64.webp') },
+  'hyun-gook-kang': { thumb: require('../../assets/images/faculty/thumb/hyun-gook-kang.7f6af3d7.webp'), detail: require('../../assets/images/faculty/detail/hyun-gook-kang.a2ca1d62.webp') },
+};
+
+export default shard;
@@ -0,0 +1,12 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'ian-chadd': { thumb: require('../../assets/images/faculty/thumb/ian-chadd.617b1b12.webp'), detail: require('../../assets/images/faculty/detail/ian-chadd.f653519a.webp') },
+  'igor-vamos': { thumb: require('../../assets/images/faculty/thumb/igor-vamos.067e4c9a.webp'), detail: require('../../assets/images/faculty/detail/igor-vamos.a47bd881.webp') },
+  'ingrid-wilke': { thumb: require('../../assets/images/faculty/thumb/ingrid-wilke.301fb7f8.webp'), detail: require('../../assets/images/faculty/detail/ingrid-wilke.b9391d84.webp') },
+  'ish-jain': { thumb: require('../../assets/images/faculty/thumb/ish-jain.297cf019.webp'), detail: require('../../assets/images/faculty/detail/ish-jain.888ef9e3.webp') },
+};
+
+export default shard;
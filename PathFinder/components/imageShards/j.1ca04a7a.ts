@@ -0,0 +1,57 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'jackie-herron-berry': { thumb: require('../../assets/images/faculty/thumb/jackie-herron-berry.7afa1215.webp'), detail: require('../../assets/images/faculty/detail/jackie-herron-berry.ba5a226d.webp') },
+  'jacob-merson': { thumb: require('../../assets/images/faculty/thumb/jacob-merson.f6b22bdf.webp'), detail: require('../../assets/images/faculty/detail/jacob-merson.e77dfdfd.webp') },
+  'jacob-shelley': { thumb: require('../../assets/images/faculty/thumb/jacob-shelley.3abb0b52.webp'), detail: require('../../assets/images/faculty/detail/jacob-shelley.f41f92f9.webp') },
+  'james-bailey': { thumb: require('../../assets/images/faculty/thumb/james-bailey.265cfae5.webp'), detail: require('../../assets/images/faculty/detail/james-bailey.dcb8ee27.webp') },
+  'james-hendler': { thumb: require('../../assets/images/faculty/thumb/james-hendler.d045c07c.webp'), detail: require('../../assets/images/faculty/detail/james-hendler.3c18eb98.webp') },
+  'james-lu': { thumb: require('../../assets/images/faculty/thumb/james-lu.37ffa852.webp'), detail: require('../../assets/images/faculty/detail/james-lu.457ca8b8.webp') },
+  'james-malazita': { thumb: require('../../assets/images/faculty/thumb/james-malazita.bd620fd4.webp'), detail: require('../../assets/images/faculty/detail/james-malazita.1bd1e956.webp') },
+  'jason-du': { thumb: require('../../assets/images/faculty/thumb/jason-du.079e3d3d.webp'), detail: require('../../assets/images/faculty/detail/jason-du.a2d40ec6.webp') },
+  'jason-hicken': { thumb: require('../../assets/images/faculty/thumb/jason-hicken.028e3f83.webp'), detail: require('../../assets/images/faculty/detail/jason-hicken.b5c551a7.webp') },
+  'jason-huh': { thumb: require('../../assets/images/faculty/thumb/jason-huh.aa8a258e.webp'), detail: require('../../assets/images/faculty/detail/jason-huh.1f19f3c8.webp') },
+  'jason-kuruzovich': { thumb: require('../../assets/images/faculty/thumb/jason-kuruzovich.d19b1cd6.webp'), detail: require('../../assets/images/faculty/detail/jason-kuruzovich.69bed856.webp') },
+  'jeff-morris': { thumb: require('../../assets/images/faculty/thumb/jeff-morris.1abc2fe9.webp'), detail: require('../../assets/images/faculty/detail/jeff-morris.d6d25b3b.webp') },
+  'jeffrey-banks': { thumb: require('../../assets/images/faculty/thumb/jeffrey-banks.7ea1c913.webp'), detail: require('../../assets/images/faculty/detail/jeffrey-banks.7624b59c.webp') },
+  'jennifer-cardinal': { thumb: require('../../assets/images/faculty/thumb/jennifer-cardinal.0bb86c63.webp'), detail: require('../../assets/images/faculty/detail/jennifer-cardinal.cabbbe50.webp') },
+  'jennifer-hurley': { thumb: require('../../assets/images/faculty/thumb/jennifer-hurley.3556c003.webp'), detail: require('../../assets/images/faculty/detail/jennifer-hurley.e1f0e4e3.webp') },
+  'jennifer-pazour': { thumb: require('../../assets/images/faculty/thumb/jennifer-pazour.309b9601.webp'), detail: require('../../assets/images/faculty/detail/jennifer-pazour.31e5eced.webp') },
+  'jenny-kemp': { thumb: require('../../assets/images/faculty/thumb/jenny-kemp.cbe98b4b.webp'), detail: require('../../assets/images/faculty/detail/jenny-kemp.be35ff74.webp') },
+  'jeremy-farrell': { thumb: require('../../assets/images/faculty/thumb/jeremy-farrell.002b811a.webp'), detail: require('../../assets/images/faculty/detail/jeremy-farrell.e9c86fd6.webp') },
+  'ji-young-kim': { thumb: require('../../assets/images/faculty/thumb/ji-young-kim.d40b117c.webp'), detail: require('../../assets/images/faculty/detail/ji-young-kim.f3d1c9c4.webp') },
+  'jian-shi': { thumb: require('../../assets/images/faculty/thumb/jian-shi.54fe4d1f.webp'), detail: require('../../assets/images/faculty/detail/jian-shi.91f4165e.webp') },
+  'jian-sun': { thumb: require('../../assets/images/faculty/thumb/jian-sun.373e352b.webp'), detail: require('../../assets/images/faculty/detail/jian-sun.82b0216e.webp') },
+  'jianling-yue': { thumb: require('../../assets/images/faculty/thumb/jianling-yue.916e8f43.webp'), detail: require('../../assets/images/faculty/detail/jianling-yue.f6c75299.webp') },
+  'jianxi-gao': { thumb: require('../../assets/images/faculty/thumb/jianxi-gao.3b969024.webp'), detail: require('../../assets/images/faculty/detail/jianxi-gao.10c14f1a.webp') },
+  'jidong-xiao': { thumb: require('../../assets/images/faculty/thumb/jidong-xiao.e7a81f96.webp'), detail: require('../../assets/images/faculty/detail/jidong-xiao.affb99e9.webp') },
+  'jie-lian': { thumb: require('../../assets/images/faculty/thumb/jie-lian.2f4af9fb.webp'), detail: require('../../assets/images/faculty/detail/jie-lian.983dce67.webp') },
+  'joel-giedt': { thumb: require('../../assets/images/faculty/thumb/joel-giedt.392ba053.webp'), detail: require('../../assets/images/faculty/detail/joel-giedt.47a88e2a.webp') },
+  'joel-plawsky': { thumb: require('../../assets/images/faculty/thumb/joel-plawsky.df02c5ca.webp'), detail: require('../../assets/images/faculty/detail/joel-plawsky.d40ecc5e.webp') },
+  'johan-maharjan': { thumb: require('../../assets/images/faculty/thumb/johan-maharjan.2957541e.webp'), detail: require('../../assets/images/faculty/detail/johan-maharjan.723d4378.webp') },
+  'john-lagraff': { thumb: require('../../assets/images/faculty/thumb/john-lagraff.0a4f0953.webp'), detail: require('../../assets/images/faculty/detail/john-lagraff.961e3d78.webp') },
+  'john-m-reilly': { thumb: require('../../assets/images/faculty/thumb/john-m-reilly.5d9a8ce8.webp'), detail: require('../../assets/images/faculty/detail/john-m-reilly.1d0035d8.webp') },
+  'john-milanese': { thumb: require('../../assets/images/faculty/thumb/john-milanese.c5d96a9e.webp'), detail: require('../../assets/images/faculty/detail/john-milanese.1066a37e.webp') },
+  'john-mitchell': { thumb: require('../../assets/images/faculty/thumb/john-mitchell.d33cf74c.webp'), detail: require('../../assets/images/faculty/detail/john-mitchell.142d0ae0.webp') },
+  'john-sturman': { thumb: require('../../assets/images/faculty/thumb/john-sturman.e6f1ab4d.webp'), detail: require('../../assets/images/faculty/detail/john-sturman.ca9dfa9c.webp') },
+  'john-tichy': { thumb: require('../../assets/images/faculty/thumb/john-tichy.48e1da7e.webp'), detail: require('../../assets/images/faculty/detail/john-tichy.cce15ad0.webp') },
+  'john-wen': { thumb: require('../../assets/images/faculty/thumb/john-wen.8c003508.webp'), detail: require('../../assets/images/faculty/detail/john-wen.21a6ad16.webp') },
+  'johnson-samuel': { thumb: require('../../assets/images/faculty/thumb/johnson-samuel.931619e8.webp'), detail: require('../../assets/images/faculty/detail/johnson-samuel.d372fbae.webp') },
+  'jonas-braasch': { thumb: require('../../assets/images/faculty/thumb/jonas-braasch.cb962f13.webp'), detail: require('../../assets/images/faculty/detail/jonas-braasch.3930395c.webp') },
+  'jonathan-dordick': { thumb: require('../../assets/images/faculty/thumb/jonathan-dordick.f04512d7.webp'), detail: require('../../assets/images/faculty/detail/jonathan-dordick.0259ed2e.webp') },
+  'jonathan-mckinney': { thumb: require('../../assets/images/faculty/thumb/jonathan-mckinney.0f7904f1.webp'), detail: require('../../assets/images/faculty/detail/jonathan-mckinney.4eb3621a.webp') },
+  'jonathan-stetler': { thumb: require('../../assets/images/faculty/thumb/jonathan-stetler.a46f1856.webp'), detail: require('../../assets/images/faculty/detail/jonathan-stetler.88e96d7c.webp') },
+  'jorge-rivero': { thumb: require('../../assets/images/faculty/thumb/jorge-rivero.ae4aa72e.webp'), detail: require('../../assets/images/faculty/detail/jorge-rivero.6141a75b.webp') },
+  'jose-holguin-veras': { thumb: require('../../assets/images/faculty/thumb/jose-holguin-veras.0539d913.webp'), detail: require('../../assets/images/faculty/detail/jose-holguin-veras.6de82cb0.webp') },
+  'joseph-michael': { thumb: require('../../assets/images/faculty/thumb/joseph-michael.209f9d97.webp'), detail: require('../../assets/images/faculty/detail/joseph-michael.787c95df.webp') },
+  'joshua-hurst': { thumb: require('../../assets/images/faculty/thumb/joshua-hurst.901b09af.webp'), detail: require('../../assets/images/faculty/detail/joshua-hurst.d6268146.webp') },
+  'juergen-hahn': { thumb: require('../../assets/images/faculty/thumb/juergen-hahn.175b9344.webp'), detail: require('../../assets/images/faculty/detail/juergen-hahn.1ae6df5f.webp') },
+  'julian-georg': { thumb: require('../../assets/images/faculty/thumb/julian-georg.ce604dac.webp'), detail: require('../../assets/images/faculty/detail/julian-georg.3b95fda9.webp') },
+  'june-deery': { thumb: require('../../assets/images/faculty/thumb/june-deery.03d36f5f.webp'), detail: require('../../assets/images/faculty/detail/june-deery.74e66630.webp') },
+  'junichi-kanai': { thumb: require('../../assets/images/faculty/thumb/junichi-kanai.7c49239b.webp'), detail: require('../../assets/images/faculty/detail/junichi-kanai.1ed1adc6.webp') },
+  'justin-dowdall': { thumb: require('../../assets/images/faculty/thumb/justin-dowdall.e599e879.webp'), detail: require('../../assets/images/faculty/detail/justin-dowdall.eed2d8b5.webp') },
+};
+
+export default shard;
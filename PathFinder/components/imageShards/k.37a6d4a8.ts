@@ -0,0 +1,35 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'k-v-lakshmi': { thumb: require('../../assets/images/faculty/thumb/k-v-lakshmi.295582a7.webp'), detail: require('../../assets/images/faculty/detail/k-v-lakshmi.7c96f79e.webp') },
+  'kanad-basu': { thumb: require('../../assets/images/faculty/thumb/kanad-basu.f205ed57.webp'), detail: require('../../assets/images/faculty/detail/kanad-basu.dff14e1d.webp') },
+  'karthik-panneerselvam': { thumb: require('../../assets/images/faculty/thumb/karthik-panneerselvam.904f4f2e.webp'), detail: require('../../assets/images/faculty/detail/karthik-panneerselvam.2010c948.webp') },
+  'kartik-josyula': { thumb: require('../../assets/images/faculty/thumb/kartik-josyula.bd14a9f9.webp'), detail: require('../../assets/images/faculty/detail/kartik-josyula.bca73f6f.webp') },
+  'karyn-rogers': { thumb: require('../../assets/images/faculty/thumb/karyn-rogers.51b5982f.webp'), detail: require('../../assets/images/faculty/detail/karyn-rogers.fd0a5a9b.webp') },
+  'kate-galloway': { thumb: require('../../assets/images/faculty/thumb/kate-galloway.172977a5.webp'), detail: require('../../assets/images/faculty/detail/kate-galloway.3619f828.webp') },
+  'katherine-tyrol': { thumb: require('../../assets/images/faculty/thumb/katherine-tyrol.f0f6256a.webp'), detail: require('../../assets/images/faculty/detail/katherine-tyrol.9262cdc0.webp') },
+  'kathleen-ruiz': { thumb: require('../../assets/images/faculty/thumb/kathleen-ruiz.10746808.webp'), detail: require('../../assets/images/faculty/detail/kathleen-ruiz.e711af33.webp') },
+  'kathy-fontaine': { thumb: require('../../assets/images/faculty/thumb/kathy-fontaine.329222f9.webp'), detail: require('../../assets/images/faculty/detail/kathy-fontaine.87497873.webp') },
+  'kathy-high': { thumb: require('../../assets/images/faculty/thumb/kathy-high.845b42ed.webp'), detail: require('../../assets/images/faculty/detail/kathy-high.3ccbdc0f.webp') },
+  'kedong-chen': { thumb: require('../../assets/images/faculty/thumb/kedong-chen.dfaa8d00.webp'), detail: require('../../assets/images/faculty/detail/kedong-chen.58644ae4.webp') },
+  'keith-fraser': { thumb: require('../../assets/images/faculty/thumb/keith-fraser.45fa19b5.webp'), detail: require('../../assets/images/faculty/detail/keith-fraser.0b0e5c16.webp') },
+  'keith-taylor': { thumb: require('../../assets/images/faculty/thumb/keith-taylor.72d2c29e.webp'), detail: require('../../assets/images/faculty/detail/keith-taylor.6a3a4f0f.webp') },
+  'ken-simons': { thumb: require('../../assets/images/faculty/thumb/ken-simons.6a207730.webp'), detail: require('../../assets/images/faculty/detail/ken-simons.7bef6cf8.webp') },
+  'kenneth-ragsdale': { thumb: require('../../assets/images/faculty/thumb/kenneth-ragsdale.55ed7607.webp'), detail: require('../../assets/images/faculty/detail/kenneth-ragsdale.cf105088.webp') },
+  'kevin-fletcher': { thumb: require('../../assets/images/faculty/thumb/kevin-fletcher.2d2d24ef.webp'), detail: require('../../assets/images/faculty/detail/kevin-fletcher.1749bd6b.webp') },
+  'kevin-housley': { thumb: require('../../assets/images/faculty/thumb/kevin-housley.5d19e512.webp'), detail: require('../../assets/images/faculty/detail/kevin-housley.46175c67.webp') },
+  'kevin-rose': { thumb: require('../../assets/images/faculty/thumb/kevin-rose.1494e93a.webp'), detail: require('../../assets/images/faculty/detail/kevin-rose.8277e765.webp') },
+  'kimberly-oakes': { thumb: require('../../assets/images/faculty/thumb/kimberly-oakes.9e731a22.webp'), detail: require('../../assets/images/faculty/detail/kimberly-oakes.ca1fb8ff.webp') },
+  'konstantin-kuzmin': { thumb: require('../../assets/images/faculty/thumb/konstantin-kuzmin.c6fc53b1.webp'), detail: require('../../assets/images/faculty/detail/konstantin-kuzmin.2e8d5fd2.webp') },
+  'koushik-kar': { thumb: require('../../assets/images/faculty/thumb/koushik-kar.871520e6.webp'), detail: require('../../assets/images/faculty/detail/koushik-kar.b0c92608.webp') },
+  'kristen-mills': { thumb: require('../../assets/images/faculty/thumb/kristen-mills.2f6e692c.webp'), detail: require('../../assets/images/faculty/detail/kristen-mills.9aabe236.webp') },
+  'kristin-bennett': { thumb: require('../../assets/images/faculty/thumb/kristin-bennett.89120f0a.webp'), detail: require('../../assets/images/faculty/detail/kristin-bennett.86896949.webp') },
+  'kristin-johnson-finn-johnson': { thumb: require('../../assets/images/faculty/thumb/kristin-johnson-finn-johnson.428d42fd.webp'), detail: require('../../assets/images/faculty/detail/kristin-johnson-finn-johnson.e3b29f13.webp') },
+  'kseniya-klyachko': { thumb: require('../../assets/images/faculty/thumb/kseniya-klyachko.b8ce6dda.webp'), detail: require('../../assets/images/faculty/detail/kseniya-klyachko.1abcd6f9.webp') },
+  'kurt-anderson': { thumb: require('../../assets/images/faculty/thumb/kurt-anderson.cd025863.webp'), detail: require('../../assets/images/faculty/detail/kurt-anderson.c1d6e2d2.webp') },
+  'kyle-wilt': { thumb: require('../../assets/images/faculty/thumb/kyle-wilt.e8436a0a.webp'), detail: require('../../assets/images/faculty/detail/kyle-wilt.f3ac44a1.webp') },
+};
+
+export default shard;
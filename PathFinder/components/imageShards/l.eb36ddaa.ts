@@ -0,0 +1,20 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'lee-ligon': { thumb: require('../../assets/images/faculty/thumb/lee-ligon.a63c7987.webp'), detail: require('../../assets/images/faculty/detail/lee-ligon.c05953ef.webp') },
+  'lei-yu': { thumb: require('../../assets/images/faculty/thumb/lei-yu.a7fa63ec.webp'), detail: require('../../assets/images/faculty/detail/lei-yu.50467c1c.webp') },
+  'leo-wan': { thumb: require('../../assets/images/faculty/thumb/leo-wan.e8719654.webp'), detail: require('../../assets/images/faculty/detail/leo-wan.66524f0c.webp') },
+  'leonid-pogorelyuk': { thumb: require('../../assets/images/faculty/thumb/leonid-pogorelyuk.ea94c7ac.webp'), detail: require('../../assets/images/faculty/detail/leonid-pogorelyuk.cb9bcdec.webp') },
+  'leslie-zeng': { thumb: require('../../assets/images/faculty/thumb/leslie-zeng.ec743a8f.webp'), detail: require('../../assets/images/faculty/detail/leslie-zeng.98e7c667.webp') },
+  'liad-wagman': { thumb: require('../../assets/images/faculty/thumb/liad-wagman.f20cd4f6.webp'), detail: require('../../assets/images/faculty/detail/liad-wagman.ffc82a10.webp') },
+  'liping-huang': { thumb: require('../../assets/images/faculty/thumb/liping-huang.575454d4.webp'), detail: require('../../assets/images/faculty/detail/liping-huang.eb83483b.webp') },
+  'liu-liu': { thumb: require('../../assets/images/faculty/thumb/liu-liu.9d70fbc7.webp'), detail: require('../../assets/images/faculty/detail/liu-liu.46cd675a.webp') },
+  'lucy-zhang': { thumb: require('../../assets/images/faculty/thumb/lucy-zhang.560487f8.webp'), detail: require('../../assets/images/faculty/detail/lucy-zhang.fe9bb1e0.webp') },
+  'luigi-vanfretti': { thumb: require('../../assets/images/faculty/thumb/luigi-vanfretti.0c7bf4a8.webp'), detail: require('../../assets/images/faculty/detail/luigi-vanfretti.b9bbd9e2.webp') },
+  'luiz-victor-repolho-cagliari': { thumb: require('../../assets/images/faculty/thumb/luiz-victor-repolho-cagliari.c7f84573.webp'), detail: require('../../assets/images/faculty/detail/luiz-victor-repolho-cagliari.aad49c65.webp') },
+  'lydia-manikonda': { thumb: require('../../assets/images/faculty/thumb/lydia-manikonda.6675f3c1.webp'), detail: require('../../assets/images/faculty/detail/lydia-manikonda.528f9544.webp') },
+};
+
+export default shard;
@@ -0,0 +1,53 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'm-arshad-zahangir-chowdhury': { thumb: require('../../assets/images/faculty/thumb/m-arshad-zahangir-chowdhury.d8068017.webp'), detail: require('../../assets/images/faculty/detail/m-arshad-zahangir-chowdhury.d900d3b2.webp') },
+  'm-hakan-hekimoglu': { thumb: require('../../assets/images/faculty/thumb/m-hakan-hekimoglu.bd345392.webp'), detail: require('../../assets/images/faculty/detail/m-hakan-hekimoglu.93fefd4e.webp') },
+  'malik-magdon-ismail': { thumb: require('../../assets/images/faculty/thumb/malik-magdon-ismail.701711a2.webp'), detail: require('../../assets/images/faculty/detail/malik-magdon-ismail.4486a9a4.webp') },
+  'marcus-carter': { thumb: require('../../assets/images/faculty/thumb/marcus-carter.eb544e94.webp'), detail: require('../../assets/images/faculty/detail/marcus-carter.e7c494f2.webp') },
+  'margaret-mcdermott': { thumb: require('../../assets/images/faculty/thumb/margaret-mcdermott.70a04c98.webp'), detail: require('../../assets/images/faculty/detail/margaret-mcdermott.9a4a15ec.webp') },
+  'margarita-kirova-snover': { thumb: require('../../assets/images/faculty/thumb/margarita-kirova-snover.b09224ff.webp'), detail: require('../../assets/images/faculty/detail/margarita-kirova-snover.d525257d.webp') },
+  'mariah-hahn': { thumb: require('../../assets/images/faculty/thumb/mariah-hahn.3f6a6209.webp'), detail: require('../../assets/images/faculty/detail/mariah-hahn.74c841ed.webp') },
+  'marianne-nyman': { thumb: require('../../assets/images/faculty/thumb/marianne-nyman.d77db6c6.webp'), detail: require('../../assets/images/faculty/detail/marianne-nyman.ef04d26b.webp') },
+  'marjorie-mcshane': { thumb: require('../../assets/images/faculty/thumb/marjorie-mcshane.4af06925.webp'), detail: require('../../assets/images/faculty/detail/marjorie-mcshane.ea7513b0.webp') },
+  'mark-gilder': { thumb: require('../../assets/images/faculty/thumb/mark-gilder.211738f2.webp'), detail: require('../../assets/images/faculty/detail/mark-gilder.91d2e33e.webp') },
+  'mark-holmes': { thumb: require('../../assets/images/faculty/thumb/mark-holmes.d4fe17be.webp'), detail: require('../../assets/images/faculty/detail/mark-holmes.535ada49.webp') },
+  'mark-shephard': { thumb: require('../../assets/images/faculty/thumb/mark-shephard.a9bb7d9c.webp'), detail: require('../../assets/images/faculty/detail/mark-shephard.ac5d9eeb.webp') },
+  'martin-schmidt': { thumb: require('../../assets/images/faculty/thumb/martin-schmidt.5f4a1a9d.webp'), detail: require('../../assets/images/faculty/detail/martin-schmidt.94fa3c3a.webp') },
+  'marvin-bentley': { thumb: require('../../assets/images/faculty/thumb/marvin-bentley.47c3acf0.webp'), detail: require('../../assets/images/faculty/detail/marvin-bentley.1c60a11f.webp') },
+  'mary-anne-staniszewski': { thumb: require('../../assets/images/faculty/thumb/mary-anne-staniszewski.041f8590.webp'), detail: require('../../assets/images/faculty/detail/mary-anne-staniszewski.b3f542e1.webp') },
+  'masoud-zarifneshat': { thumb: require('../../assets/images/faculty/thumb/masoud-zarifneshat.a93d15cf.webp'), detail: require('../../assets/images/faculty/detail/masoud-zarifneshat.b4710812.webp') },
+  'mattheos-koffas': { thumb: require('../../assets/images/faculty/thumb/mattheos-koffas.e5ede09d.webp'), detail: require('../../assets/images/faculty/detail/mattheos-koffas.96adee0d.webp') },
+  'matthew-goodheart': { thumb: require('../../assets/images/faculty/thumb/matthew-goodheart.1c478b1c.webp'), detail: require('../../assets/images/faculty/detail/matthew-goodheart.569efd3e.webp') },
+  'matthew-oehlschlaeger': { thumb: require('../../assets/images/faculty/thumb/matthew-oehlschlaeger.7f582b34.webp'), detail: require('../../assets/images/faculty/detail/matthew-oehlschlaeger.90a14929.webp') },
+  'matthew-pasek': { thumb: require('../../assets/images/faculty/thumb/matthew-pasek.b587f4f2.webp'), detail: require('../../assets/images/faculty/detail/matthew-pasek.d3ae4ba7.webp') },
+  'matthew-wolf-meyer': { thumb: require('../../assets/images/faculty/thumb/matthew-wolf-meyer.4a8729d0.webp'), detail: require('../../assets/images/faculty/detail/matthew-wolf-meyer.d4b80cc0.webp') },
+  'maurice-suckling': { thumb: require('../../assets/images/faculty/thumb/maurice-suckling.c542e4f6.webp'), detail: require('../../assets/images/faculty/detail/maurice-suckling.63665590.webp') },
+  'maya-kiehl': { thumb: require('../../assets/images/faculty/thumb/maya-kiehl.6be9a76a.webp'), detail: require('../../assets/images/faculty/detail/maya-kiehl.5dc36034.webp') },
+  'mei-si': { thumb: require('../../assets/images/faculty/thumb/mei-si.d91c6590.webp'), detail: require('../../assets/images/faculty/detail/mei-si.22849c63.webp') },
+  'meimuneh-sumadi': { thumb: require('../../assets/images/faculty/thumb/meimuneh-sumadi.fec00b2e.webp'), detail: require('../../assets/images/faculty/detail/meimuneh-sumadi.2dfb5d67.webp') },
+  'meng-wang': { thumb: require('../../assets/images/faculty/thumb/meng-wang.baaa09e4.webp'), detail: require('../../assets/images/faculty/detail/meng-wang.dc9af2d7.webp') },
+  'mi-tran': { thumb: require('../../assets/images/faculty/thumb/mi-tran.8f1be76d.webp'), detail: require('../../assets/images/faculty/detail/mi-tran.0ca757c7.webp') },
+  'michael-amitay': { thumb: require('../../assets/images/faculty/thumb/michael-amitay.d550847d.webp'), detail: require('../../assets/images/faculty/detail/michael-amitay.90dfc641.webp') },
+  'michael-century': { thumb: require('../../assets/images/faculty/thumb/michael-century.26461b29.webp'), detail: require('../../assets/images/faculty/detail/michael-century.5a39f0d2.webp') },
+  'michael-klein': { thumb: require('../../assets/images/faculty/thumb/michael-klein.d549b90a.webp'), detail: require('../../assets/images/faculty/detail/michael-klein.e75fb349.webp') },
+  'michael-klein-0': { thumb: require('../../assets/images/faculty/thumb/michael-klein-0.c55c754c.webp'), detail: require('../../assets/images/faculty/detail/michael-klein-0.0f4d7cf8.webp') },
+  'michael-symans': { thumb: require('../../assets/images/faculty/thumb/michael-symans.63b80f04.webp'), detail: require('../../assets/images/faculty/detail/michael-symans.074c03ab.webp') },
+  'miguel-matos': { thumb: require('../../assets/images/faculty/thumb/miguel-matos.b6dff1c6.webp'), detail: require('../../assets/images/faculty/detail/miguel-matos.fcf4293c.webp') },
+  'mike-van-valkenburg': { thumb: require('../../assets/images/faculty/thumb/mike-van-valkenburg.90c2f6f6.webp'), detail: require('../../assets/images/faculty/detail/mike-van-valkenburg.aeca3e82.webp') },
+  'min-li': { thumb: require('../../assets/images/faculty/thumb/min-li.c5a76cb2.webp'), detail: require('../../assets/images/faculty/detail/min-li.c73f8edb.webp') },
+  'mina-mahmoudi': { thumb: require('../../assets/images/faculty/thumb/mina-mahmoudi.65b1edc3.webp'), detail: require('../../assets/images/faculty/detail/mina-mahmoudi.1bb93cdd.webp') },
+  'mitchell-murray': { thumb: require('../../assets/images/faculty/thumb/mitchell-murray.f593f274.webp'), detail: require('../../assets/images/faculty/detail/mitchell-murray.76d3a4c0.webp') },
+  'mohammad-mohammadi-amiri': { thumb: require('../../assets/images/faculty/thumb/mohammad-mohammadi-amiri.30027204.webp'), detail: require('../../assets/images/faculty/detail/mohammad-mohammadi-amiri.a31a7ee6.webp') },
+  'mohammed-zaki': { thumb: require('../../assets/images/faculty/thumb/mohammed-zaki.032eb3d2.webp'), detail: require('../../assets/images/faculty/detail/mohammed-zaki.634d8029.webp') },
+  'monica-agarwal': { thumb: require('../../assets/images/faculty/thumb/monica-agarwal.19f43ab2.webp'), detail: require('../../assets/images/faculty/detail/monica-agarwal.c6e81793.webp') },
+  'morgan-schaller': { thumb: require('../../assets/images/faculty/thumb/morgan-schaller.11eae148.webp'), detail: require('../../assets/images/faculty/detail/morgan-schaller.2801073b.webp') },
+  'mourad-zeghal': { thumb: require('../../assets/images/faculty/thumb/mourad-zeghal.94129d48.webp'), detail: require('../../assets/images/faculty/detail/mourad-zeghal.4af9c5a9.webp') },
+  'moussa-ngom': { thumb: require('../../assets/images/faculty/thumb/moussa-ngom.dba166ba.webp'), detail: require('../../assets/images/faculty/detail/moussa-ngom.c4c11271.webp') },
+  'muhsin-celik': { thumb: require('../../assets/images/faculty/thumb/muhsin-celik.9159503e.webp'), detail: require('../../assets/images/faculty/detail/muhsin-celik.14ada5fb.webp') },
+  'murali-chari': { thumb: require('../../assets/images/faculty/thumb/murali-chari.7dda8b23.webp'), detail: require('../../assets/images/faculty/detail/murali-chari.4ddee0cc.webp') },
+};
+
+export default shard;
@@ -0,0 +1,19 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'nadarajah-narendran': { thumb: require('../../assets/images/faculty/thumb/nadarajah-narendran.3cdeba0c.webp'), detail: require('../../assets/images/faculty/detail/nadarajah-narendran.c420cc8a.webp') },
+  'nancy-campbell': { thumb: require('../../assets/images/faculty/thumb/nancy-campbell.a377229f.webp'), detail: require('../../assets/images/faculty/detail/nancy-campbell.553e4f05.webp') },
+  'nathan-meltz': { thumb: require('../../assets/images/faculty/thumb/nathan-meltz.56266039.webp'), detail: require('../../assets/images/faculty/detail/nathan-meltz.3dbd8fd7.webp') },
+  'neha-keshan': { thumb: require('../../assets/images/faculty/thumb/neha-keshan.5641d75a.webp'), detail: require('../../assets/images/faculty/detail/neha-keshan.0915f802.webp') },
+  'nicholas-mizer': { thumb: require('../../assets/images/faculty/thumb/nicholas-mizer.7ac2feae.webp'), detail: require('../../assets/images/faculty/detail/nicholas-mizer.daa7ba6d.webp') },
+  'nick-platts': { thumb: require('../../assets/images/faculty/thumb/nick-platts.2ab3e320.webp'), detail: require('../../assets/images/faculty/detail/nick-platts.eb0aa93f.webp') },
+  'nihat-baysal': { thumb: require('../../assets/images/faculty/thumb/nihat-baysal.1bb50c70.webp'), detail: require('../../assets/images/faculty/detail/nihat-baysal.138bf599.webp') },
+  'nikhil-koratkar': { thumb: require('../../assets/images/faculty/thumb/nikhil-koratkar.97879d83.webp'), detail: require('../../assets/images/faculty/detail/nikhil-koratkar.79f4801a.webp') },
+  'nima-ahmadi': { thumb: require('../../assets/images/faculty/thumb/nima-ahmadi.8dbf2e86.webp'), detail: require('../../assets/images/faculty/detail/nima-ahmadi.84a5bca8.webp') },
+  'ning-xiang': { thumb: require('../../assets/images/faculty/thumb/ning-xiang.7c620c18.webp'), detail: require('../../assets/images/faculty/detail/ning-xiang.35578b35.webp') },
+  'nishtha-langer': { thumb: require('../../assets/images/faculty/thumb/nishtha-langer.96262dd4.webp'), detail: require('../../assets/images/faculty/detail/nishtha-langer.11b7c0da.webp') },
+};
+
+export default shard;
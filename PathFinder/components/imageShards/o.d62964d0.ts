@@ -0,0 +1,12 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'omar-el-shafee': { thumb: require('../../assets/images/faculty/thumb/omar-el-shafee.f48bfde6.webp'), detail: require('../../assets/images/faculty/detail/omar-el-shafee.31ace0fd.webp') },
+  'onkar-sahni': { thumb: require('../../assets/images/faculty/thumb/onkar-sahni.9614eee0.webp'), detail: require('../../assets/images/faculty/detail/onkar-sahni.965600f8.webp') },
+  'oshani-seneviratne': { thumb: require('../../assets/images/faculty/thumb/oshani-seneviratne.8fc9504b.webp'), detail: require('../../assets/images/faculty/detail/oshani-seneviratne.098c52b3.webp') },
+  'ozgur-tumuklu': { thumb: require('../../assets/images/faculty/thumb/ozgur-tumuklu.6fddcb64.webp'), detail: require('../../assets/images/faculty/detail/ozgur-tumuklu.a39fe48d.webp') },
+};
+
+export default shard;
@@ -0,0 +1,23 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'pankaj-karande': { thumb: require('../../assets/images/faculty/thumb/pankaj-karande.93b9a45a.webp'), detail: require('../../assets/images/faculty/detail/pankaj-karande.3d58c8a3.webp') },
+  'patricia-search': { thumb: require('../../assets/images/faculty/thumb/patricia-search.0aea1065.webp'), detail: require('../../assets/images/faculty/detail/patricia-search.51359e4c.webp') },
+  'patrick-underhill': { thumb: require('../../assets/images/faculty/thumb/patrick-underhill.c7e9b4f6.webp'), detail: require('../../assets/images/faculty/detail/patrick-underhill.ab7b9b43.webp') },
+  'paul-chow': { thumb: require('../../assets/images/faculty/thumb/paul-chow.b7c253ca.webp'), detail: require('../../assets/images/faculty/detail/paul-chow.12ad2461.webp') },
+  'paul-keblinski': { thumb: require('../../assets/images/faculty/thumb/paul-keblinski.1204f687.webp'), detail: require('../../assets/images/faculty/detail/paul-keblinski.9cc2097c.webp') },
+  'peter-dinolfo': { thumb: require('../../assets/images/faculty/thumb/peter-dinolfo.b77ef1ca.webp'), detail: require('../../assets/images/faculty/detail/peter-dinolfo.13137d95.webp') },
+  'peter-j-bonitatibus': { thumb: require('../../assets/images/faculty/thumb/peter-j-bonitatibus.87378614.webp'), detail: require('../../assets/images/faculty/detail/peter-j-bonitatibus.18f758e5.webp') },
+  'peter-kramer': { thumb: require('../../assets/images/faculty/thumb/peter-kramer.282b8a2a.webp'), detail: require('../../assets/images/faculty/detail/peter-kramer.8fb1c032.webp') },
+  'peter-persans': { thumb: require('../../assets/images/faculty/thumb/peter-persans.c4dc2918.webp'), detail: require('../../assets/images/faculty/detail/peter-persans.f63f660c.webp') },
+  'philip-vanderhyden': { thumb: require('../../assets/images/faculty/thumb/philip-vanderhyden.f11c7dd9.webp'), detail: require('../../assets/images/faculty/detail/philip-vanderhyden.5a1be192.webp') },
+  'pingkun-yan': { thumb: require('../../assets/images/faculty/thumb/pingkun-yan.aed5617b.webp'), detail: require('../../assets/images/faculty/detail/pingkun-yan.486ee63e.webp') },
+  'prabhakar-neti': { thumb: require('../../assets/images/faculty/thumb/prabhakar-neti.b1667ddd.webp'), detail: require('../../assets/images/faculty/detail/prabhakar-neti.5d9d541b.webp') },
+  'prabhat-hajela': { thumb: require('../../assets/images/faculty/thumb/prabhat-hajela.43a7db8c.webp'), detail: require('../../assets/images/faculty/detail/prabhat-hajela.3034da07.webp') },
+  'prakrati-thakur': { thumb: require('../../assets/images/faculty/thumb/prakrati-thakur.94f9e11d.webp'), detail: require('../../assets/images/faculty/detail/prakrati-thakur.f568df07.webp') },
+  'prashun-gorai': { thumb: require('../../assets/images/faculty/thumb/prashun-gorai.a64b4bd9.webp'), detail: require('../../assets/images/faculty/detail/prashun-gorai.e9f106be.webp') },
+};
+
+export default shard;
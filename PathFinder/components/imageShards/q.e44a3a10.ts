@@ -0,0 +1,9 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'qiang-ji': { thumb: require('../../assets/images/faculty/thumb/qiang-ji.3bd44a16.webp'), detail: require('../../assets/images/faculty/detail/qiang-ji.8f267902.webp') },
+};
+
+export default shard;
@@ -0,0 +1,33 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'radoslav-ivanov': { thumb: require('../../assets/images/faculty/thumb/radoslav-ivanov.022be97d.webp'), detail: require('../../assets/images/faculty/detail/radoslav-ivanov.0a4f0c8a.webp') },
+  'raffi-garcia': { thumb: require('../../assets/images/faculty/thumb/raffi-garcia.cece5f69.webp'), detail: require('../../assets/images/faculty/detail/raffi-garcia.8fa952b0.webp') },
+  'rahmi-ozisik': { thumb: require('../../assets/images/faculty/thumb/rahmi-ozisik.f7be7598.webp'), detail: require('../../assets/images/faculty/detail/rahmi-ozisik.ad87c382.webp') },
+  'rahul-rahul': { thumb: require('../../assets/images/faculty/thumb/rahul-rahul.30b0eaab.webp'), detail: require('../../assets/images/faculty/detail/rahul-rahul.6fff4400.webp') },
+  'raquel-velho': { thumb: require('../../assets/images/faculty/thumb/raquel-velho.01f21aea.webp'), detail: require('../../assets/images/faculty/detail/raquel-velho.445e239d.webp') },
+  'ravishankar-sundararaman': { thumb: require('../../assets/images/faculty/thumb/ravishankar-sundararaman.f3916262.webp'), detail: require('../../assets/images/faculty/detail/ravishankar-sundararaman.50ab897d.webp') },
+  'rebecca-doerge': { thumb: require('../../assets/images/faculty/thumb/rebecca-doerge.db8e6676.webp'), detail: require('../../assets/images/faculty/detail/rebecca-doerge.104ea9bf.webp') },
+  'rena-huang': { thumb: require('../../assets/images/faculty/thumb/rena-huang.33223839.webp'), detail: require('../../assets/images/faculty/detail/rena-huang.d4db41b0.webp') },
+  'rich-radke': { thumb: require('../../assets/images/faculty/thumb/rich-radke.471fc3c7.webp'), detail: require('../../assets/images/faculty/detail/rich-radke.4b5615d7.webp') },
+  'richard-bonocora': { thumb: require('../../assets/images/faculty/thumb/richard-bonocora.c9d76d13.webp'), detail: require('../../assets/images/faculty/detail/richard-bonocora.c4bb2c40.webp') },
+  'richard-gross': { thumb: require('../../assets/images/faculty/thumb/richard-gross.009cb6c4.webp'), detail: require('../../assets/images/faculty/detail/richard-gross.78d0ac7f.webp') },
+  'richard-plotka': { thumb: require('../../assets/images/faculty/thumb/richard-plotka.0c3161ce.webp'), detail: require('../../assets/images/faculty/detail/richard-plotka.04fba9f7.webp') },
+  'rob-hamilton': { thumb: require('../../assets/images/faculty/thumb/rob-hamilton.c31ba818.webp'), detail: require('../../assets/images/faculty/detail/rob-hamilton.1aea44cc.webp') },
+  'robert-hull': { thumb: require('../../assets/images/faculty/thumb/robert-hull.594d07b2.webp'), detail: require('../../assets/images/faculty/detail/robert-hull.ee486666.webp') },
+  'robert-jones': { thumb: require('../../assets/images/faculty/thumb/robert-jones.9d6ccd34.webp'), detail: require('../../assets/images/faculty/detail/robert-jones.3663aa4f.webp') },
+  'robert-nideffer': { thumb: require('../../assets/images/faculty/thumb/robert-nideffer.02769814.webp'), detail: require('../../assets/images/faculty/detail/robert-nideffer.cb933a05.webp') },
+  'robert-niemiec': { thumb: require('../../assets/images/faculty/thumb/robert-niemiec.b144ff6a.webp'), detail: require('../../assets/images/faculty/detail/robert-niemiec.9f4e5b32.webp') },
+  'robert-whalen': { thumb: require('../../assets/images/faculty/thumb/robert-whalen.d4a294bd.webp'), detail: require('../../assets/images/faculty/detail/robert-whalen.ec56ce12.webp') },
+  'ronald-hedden': { thumb: require('../../assets/images/faculty/thumb/ronald-hedden.32874a2b.webp'), detail: require('../../assets/images/faculty/detail/ronald-hedden.0ce31f90.webp') },
+  'ross-rice': { thumb: require('../../assets/images/faculty/thumb/ross-rice.4d2372be.webp'), detail: require('../../assets/images/faculty/detail/ross-rice.77f2d500.webp') },
+  'rostyslav-korolov': { thumb: require('../../assets/images/faculty/thumb/rostyslav-korolov.7cddca94.webp'), detail: require('../../assets/images/faculty/detail/rostyslav-korolov.2f7052b6.webp') },
+  'rui-fan': { thumb: require('../../assets/images/faculty/thumb/rui-fan.03a60f8f.webp'), detail: require('../../assets/images/faculty/detail/rui-fan.85a985da.webp') },
+  'ruimin-ke': { thumb: require('../../assets/images/faculty/thumb/ruimin-ke.39f13dc8.webp'), detail: require('../../assets/images/faculty/detail/ruimin-ke.49b1ab4d.webp') },
+  'rush-swope': { thumb: require('../../assets/images/faculty/thumb/rush-swope.3384d95b.webp'), detail: require('../../assets/images/faculty/detail/rush-swope.623a7094.webp') },
+  'russell-kraft': { thumb: require('../../assets/images/faculty/thumb/russell-kraft.68ffc874.webp'), detail: require('../../assets/images/faculty/detail/russell-kraft.d070bbd6.webp') },
+};
+
+export default shard;
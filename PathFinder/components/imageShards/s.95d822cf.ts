@@ -0,0 +1,44 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'saggi-nevo': { thumb: require('../../assets/images/faculty/thumb/saggi-nevo.5dbfc7d1.webp'), detail: require('../../assets/images/faculty/detail/saggi-nevo.5889718f.webp') },
+  'sam-strizver': { thumb: require('../../assets/images/faculty/thumb/sam-strizver.e142c246.webp'), detail: require('../../assets/images/faculty/detail/sam-strizver.40880245.webp') },
+  'samir-salamah': { thumb: require('../../assets/images/faculty/thumb/samir-salamah.0bba74ad.webp'), detail: require('../../assets/images/faculty/detail/samir-salamah.0adfedc9.webp') },
+  'sandeep-singh': { thumb: require('../../assets/images/faculty/thumb/sandeep-singh.d244c5ae.webp'), detail: require('../../assets/images/faculty/detail/sandeep-singh.69ba6837.webp') },
+  'sandipan-mishra': { thumb: require('../../assets/images/faculty/thumb/sandipan-mishra.c908e981.webp'), detail: require('../../assets/images/faculty/detail/sandipan-mishra.64a4a634.webp') },
+  'sandra-nierzwicki-bauer': { thumb: require('../../assets/images/faculty/thumb/sandra-nierzwicki-bauer.23ce48aa.webp'), detail: require('../../assets/images/faculty/detail/sandra-nierzwicki-bauer.2e68a075.webp') },
+  'sang-han': { thumb: require('../../assets/images/faculty/thumb/sang-han.e37e9535.webp'), detail: require('../../assets/images/faculty/detail/sang-han.dbf00510.webp') },
+  'sangwoo-lee': { thumb: require('../../assets/images/faculty/thumb/sangwoo-lee.10c34063.webp'), detail: require('../../assets/images/faculty/detail/sangwoo-lee.fb5506bd.webp') },
+  'santiago-paternain': { thumb: require('../../assets/images/faculty/thumb/santiago-paternain.914f0a8a.webp'), detail: require('../../assets/images/faculty/detail/santiago-paternain.c6b1c362.webp') },
+  'sara-black': { thumb: require('../../assets/images/faculty/thumb/sara-black.673139e2.webp'), detail: require('../../assets/images/faculty/detail/sara-black.dd93d22f.webp') },
+  'sara-tack': { thumb: require('../../assets/images/faculty/thumb/sara-tack.7f33ba42.webp'), detail: require('../../assets/images/faculty/detail/sara-tack.218ba0b1.webp') },
+  'sarah-cadieux': { thumb: require('../../assets/images/faculty/thumb/sarah-cadieux.fc909b92.webp'), detail: require('../../assets/images/faculty/detail/sarah-cadieux.c85129ca.webp') },
+  'sarah-felix': { thumb: require('../../assets/images/faculty/thumb/sarah-felix.9062ee6b.webp'), detail: require('../../assets/images/faculty/detail/sarah-felix.8760811e.webp') },
+  'sarah-greene': { thumb: require('../../assets/images/faculty/thumb/sarah-greene.f76eb445.webp'), detail: require('../../assets/images/faculty/detail/sarah-greene.58ad6b4f.webp') },
+  'sasha-wagner': { thumb: require('../../assets/images/faculty/thumb/sasha-wagner.af473949.webp'), detail: require('../../assets/images/faculty/detail/sasha-wagner.b378f741.webp') },
+  'scott-forth': { thumb: require('../../assets/images/faculty/thumb/scott-forth.393d2283.webp'), detail: require('../../assets/images/faculty/detail/scott-forth.05e46557.webp') },
+  'sean-x-he': { thumb: require('../../assets/images/faculty/thumb/sean-x-he.a597df17.webp'), detail: require('../../assets/images/faculty/detail/sean-x-he.b25e5007.webp') },
+  'sebastian-souyris': { thumb: require('../../assets/images/faculty/thumb/sebastian-souyris.fe659714.webp'), detail: require('../../assets/images/faculty/detail/sebastian-souyris.faca600e.webp') },
+  'seemanti-ramanath': { thumb: require('../../assets/images/faculty/thumb/seemanti-ramanath.f25cb776.webp'), detail: require('../../assets/images/faculty/detail/seemanti-ramanath.3404dd31.webp') },
+  'selmer-bringsjord': { thumb: require('../../assets/images/faculty/thumb/selmer-bringsjord.142d39e6.webp'), detail: require('../../assets/images/faculty/detail/selmer-bringsjord.0a868cbc.webp') },
+  'semih-akin': { thumb: require('../../assets/images/faculty/thumb/semih-akin.971c77cb.webp'), detail: require('../../assets/images/faculty/detail/semih-akin.5a732133.webp') },
+  'sergei-nirenburg': { thumb: require('../../assets/images/faculty/thumb/sergei-nirenburg.0cb62f5f.webp'), detail: require('../../assets/images/faculty/detail/sergei-nirenburg.6244f0ff.webp') },
+  'shanbin-shi': { thumb: require('../../assets/images/faculty/thumb/shanbin-shi.7ab141a3.webp'), detail: require('../../assets/images/faculty/detail/shanbin-shi.4dead196.webp') },
+  'shankar-narayan': { thumb: require('../../assets/images/faculty/thumb/shankar-narayan.f8ca3078.webp'), detail: require('../../assets/images/faculty/detail/shankar-narayan.ce4e1e75.webp') },
+  'shaowu-pan': { thumb: require('../../assets/images/faculty/thumb/shaowu-pan.e4ff572c.webp'), detail: require('../../assets/images/faculty/detail/shaowu-pan.19f80756.webp') },
+  'shawn-yu-lin': { thumb: require('../../assets/images/faculty/thumb/shawn-yu-lin.f997716d.webp'), detail: require('../../assets/images/faculty/detail/shawn-yu-lin.cd745726.webp') },
+  'shayla-sawyer': { thumb: require('../../assets/images/faculty/thumb/shayla-sawyer.68adb97d.webp'), detail: require('../../assets/images/faculty/detail/shayla-sawyer.5970f9c1.webp') },
+  'shekhar-garde': { thumb: require('../../assets/images/faculty/thumb/shekhar-garde.7c472aa1.webp'), detail: require('../../assets/images/faculty/detail/shekhar-garde.6b4edd4b.webp') },
+  'shengbai-zhang': { thumb: require('../../assets/images/faculty/thumb/shengbai-zhang.06906f13.webp'), detail: require('../../assets/images/faculty/detail/shengbai-zhang.b314ff30.webp') },
+  'shun-uchida': { thumb: require('../../assets/images/faculty/thumb/shun-uchida.df88043c.webp'), detail: require('../../assets/images/faculty/detail/shun-uchida.db6b062a.webp') },
+  'shyam-kumar': { thumb: require('../../assets/images/faculty/thumb/shyam-kumar.101605a6.webp'), detail: require('../../assets/images/faculty/detail/shyam-kumar.8de0a3ed.webp') },
+  'sibel-adali': { thumb: require('../../assets/images/faculty/thumb/sibel-adali.5ba3534d.webp'), detail: require('../../assets/images/faculty/detail/sibel-adali.65480105.webp') },
+  'silvia-ruzanka': { thumb: require('../../assets/images/faculty/thumb/silvia-ruzanka.3fa82e7d.webp'), detail: require('../../assets/images/faculty/detail/silvia-ruzanka.79a12c55.webp') },
+  'skye-anicca': { thumb: require('../../assets/images/faculty/thumb/skye-anicca.3d5774f0.webp'), detail: require('../../assets/images/faculty/detail/skye-anicca.c309a56e.webp') },
+  'stephanie-loveless': { thumb: require('../../assets/images/faculty/thumb/stephanie-loveless.f5351c20.webp'), detail: require('../../assets/images/faculty/detail/stephanie-loveless.96172875.webp') },
+  'steven-cramer': { thumb: require('../../assets/images/faculty/thumb/steven-cramer.63b8676e.webp'), detail: require('../../assets/images/faculty/detail/steven-cramer.d8af9863.webp') },
+};
+
+export default shard;
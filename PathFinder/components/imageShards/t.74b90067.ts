@@ -0,0 +1,25 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  't-ravichandran': { thumb: require('../../assets/images/faculty/thumb/t-ravichandran.42315b24.webp'), detail: require('../../assets/images/faculty/detail/t-ravichandran.f51bad5d.webp') },
+  'tahseen-hasan': { thumb: require('../../assets/images/faculty/thumb/tahseen-hasan.b470900e.webp'), detail: require('../../assets/images/faculty/detail/tahseen-hasan.d39f6e0c.webp') },
+  'tamar-gordon': { thumb: require('../../assets/images/faculty/thumb/tamar-gordon.e841a33d.webp'), detail: require('../../assets/images/faculty/detail/tamar-gordon.0054cf7b.webp') },
+  'tankut-atuk': { thumb: require('../../assets/images/faculty/thumb/tankut-atuk.c6c4c3c9.webp'), detail: require('../../assets/images/faculty/detail/tankut-atuk.69a33110.webp') },
+  'tanya-singh': { thumb: require('../../assets/images/faculty/thumb/tanya-singh.67b43f33.webp'), detail: require('../../assets/images/faculty/detail/tanya-singh.58d679b1.webp') },
+  'tara-cohen': { thumb: require('../../assets/images/faculty/thumb/tara-cohen.e20a1119.webp'), detail: require('../../assets/images/faculty/detail/tara-cohen.0e119c5c.webp') },
+  'tathagata-bhaduri': { thumb: require('../../assets/images/faculty/thumb/tathagata-bhaduri.bfd21b55.webp'), detail: require('../../assets/images/faculty/detail/tathagata-bhaduri.02482f6e.webp') },
+  'theodorian-borca-tasciuc': { thumb: require('../../assets/images/faculty/thumb/theodorian-borca-tasciuc.d584a587.webp'), detail: require('../../assets/images/faculty/detail/theodorian-borca-tasciuc.c9ff5f65.webp') },
+  'thierry-blanchet': { thumb: require('../../assets/images/faculty/thumb/thierry-blanchet.502a5feb.webp'), detail: require('../../assets/images/faculty/detail/thierry-blanchet.95b75ba1.webp') },
+  'thomas-ferguson': { thumb: require('../../assets/images/faculty/thumb/thomas-ferguson.59eb601e.webp'), detail: require('../../assets/images/faculty/detail/thomas-ferguson.afdd5218.webp') },
+  'tianyi-chen': { thumb: require('../../assets/images/faculty/thumb/tianyi-chen.11963773.webp'), detail: require('../../assets/images/faculty/detail/tianyi-chen.4f8ceded.webp') },
+  'timothy-golden': { thumb: require('../../assets/images/faculty/thumb/timothy-golden.050a3bb7.webp'), detail: require('../../assets/images/faculty/detail/timothy-golden.02353c7b.webp') },
+  'todd-przybycien': { thumb: require('../../assets/images/faculty/thumb/todd-przybycien.cda4078d.webp'), detail: require('../../assets/images/faculty/detail/todd-przybycien.6549b9a1.webp') },
+  'tom-haley': { thumb: require('../../assets/images/faculty/thumb/tom-haley.6a5fb688.webp'), detail: require('../../assets/images/faculty/detail/tom-haley.e858132a.webp') },
+  'tomek-strzalkowski': { thumb: require('../../assets/images/faculty/thumb/tomek-strzalkowski.560f4e78.webp'), detail: require('../../assets/images/faculty/detail/tomek-strzalkowski.06ca2f38.webp') },
+  'tong-zhang': { thumb: require('../../assets/images/faculty/thumb/tong-zhang.57c9da7f.webp'), detail: require('../../assets/images/faculty/detail/tong-zhang.5e974656.webp') },
+  'trevor-rhone': { thumb: require('../../assets/images/faculty/thumb/trevor-rhone.d3336597.webp'), detail: require('../../assets/images/faculty/detail/trevor-rhone.16086e6f.webp') },
+};
+
+export default shard;
@@ -0,0 +1,12 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'ukwatte-lokuliyanage-indika-perera': { thumb: require('../../assets/images/faculty/thumb/ukwatte-lokuliyanage-indika-perera.7d8f0c12.webp'), detail: require('../../assets/images/faculty/detail/ukwatte-lokuliyanage-indika-perera.5e25397a.webp') },
+  'ute-besenecker': { thumb: require('../../assets/images/faculty/thumb/ute-besenecker.33787a44.webp'), detail: require('../../assets/images/faculty/detail/ute-besenecker.27ff7930.webp') },
+  'uwe-kruger': { thumb: require('../../assets/images/faculty/thumb/uwe-kruger.563238ed.webp'), detail: require('../../assets/images/faculty/detail/uwe-kruger.3bd01c1b.webp') },
+  'uzma-mushtaque': { thumb: require('../../assets/images/faculty/thumb/uzma-mushtaque.52769719.webp'), detail: require('../../assets/images/faculty/detail/uzma-mushtaque.0241c31a.webp') },
+};
+
+export default shard;
@@ -0,0 +1,12 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'victor-robles-sanchez': { thumb: require('../../assets/images/faculty/thumb/victor-robles-sanchez.386c9fb0.webp'), detail: require('../../assets/images/faculty/detail/victor-robles-sanchez.f1082326.webp') },
+  'victoria-bennett': { thumb: require('../../assets/images/faculty/thumb/victoria-bennett.20af3c09.webp'), detail: require('../../assets/images/faculty/detail/victoria-bennett.25bf92bb.webp') },
+  'vidhya-chakrapani': { thumb: require('../../assets/images/faculty/thumb/vidhya-chakrapani.cf7c0d5d.webp'), detail: require('../../assets/images/faculty/detail/vidhya-chakrapani.1e4e2f30.webp') },
+  'vivek-ghosal': { thumb: require('../../assets/images/faculty/thumb/vivek-ghosal.0ba17ec0.webp'), detail: require('../../assets/images/faculty/detail/vivek-ghosal.53315a24.webp') },
+};
+
+export default shard;
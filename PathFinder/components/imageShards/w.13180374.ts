@@ -0,0 +1,17 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'walaid-sehwail': { thumb: require('../../assets/images/faculty/thumb/walaid-sehwail.0e01f323.webp'), detail: require('../../assets/images/faculty/detail/walaid-sehwail.813f8b22.webp') },
+  'wei-bao': { thumb: require('../../assets/images/faculty/thumb/wei-bao.954ecebf.webp'), detail: require('../../assets/images/faculty/detail/wei-bao.7fe99018.webp') },
+  'wei-ji': { thumb: require('../../assets/images/faculty/thumb/wei-ji.59ecc9bf.webp'), detail: require('../../assets/images/faculty/detail/wei-ji.f58527e6.webp') },
+  'weina-ran': { thumb: require('../../assets/images/faculty/thumb/weina-ran.23b21ee6.webp'), detail: require('../../assets/images/faculty/detail/weina-ran.77e42298.webp') },
+  'wes-turner': { thumb: require('../../assets/images/faculty/thumb/wes-turner.7ae02091.webp'), detail: require('../../assets/images/faculty/detail/wes-turner.a38b9861.webp') },
+  'wilfredo-colon': { thumb: require('../../assets/images/faculty/thumb/wilfredo-colon.945e9dcd.webp'), detail: require('../../assets/images/faculty/detail/wilfredo-colon.8f0fcb65.webp') },
+  'william-gibbons': { thumb: require('../../assets/images/faculty/thumb/william-gibbons.f2ea142b.webp'), detail: require('../../assets/images/faculty/detail/william-gibbons.b48cd20e.webp') },
+  'william-henshaw': { thumb: require('../../assets/images/faculty/thumb/william-henshaw.46cbd693.webp'), detail: require('../../assets/images/faculty/detail/william-henshaw.adc1b736.webp') },
+  'wint-thu': { thumb: require('../../assets/images/faculty/thumb/wint-thu.27bf3f60.webp'), detail: require('../../assets/images/faculty/detail/wint-thu.102d5ed0.webp') },
+};
+
+export default shard;
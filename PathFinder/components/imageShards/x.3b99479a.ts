@@ -0,0 +1,11 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'xavier-intes': { thumb: require('../../assets/images/faculty/thumb/xavier-intes.d1201058.webp'), detail: require('../../assets/images/faculty/detail/xavier-intes.5ffb4515.webp') },
+  'xiangyi-meng': { thumb: require('../../assets/images/faculty/thumb/xiangyi-meng.15ee953d.webp'), detail: require('../../assets/images/faculty/detail/xiangyi-meng.90536d2a.webp') },
+  'xun-wang': { thumb: require('../../assets/images/faculty/thumb/xun-wang.be7d5169.webp'), detail: require('../../assets/images/faculty/detail/xun-wang.9bcee59c.webp') },
+};
+
+export default shard;
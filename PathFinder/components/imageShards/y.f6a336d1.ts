@@ -0,0 +1,19 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'yael-erel': { thumb: require('../../assets/images/faculty/thumb/yael-erel.6daf771b.webp'), detail: require('../../assets/images/faculty/detail/yael-erel.89e6254f.webp') },
+  'yangyang-xu': { thumb: require('../../assets/images/faculty/thumb/yangyang-xu.c03e1ab1.webp'), detail: require('../../assets/images/faculty/detail/yangyang-xu.2bc8cded.webp') },
+  'yao-ma': { thumb: require('../../assets/images/faculty/thumb/yao-ma.1848d7fc.webp'), detail: require('../../assets/images/faculty/detail/yao-ma.6a043683.webp') },
+  'yaron-danon': { thumb: require('../../assets/images/faculty/thumb/yaron-danon.82328a55.webp'), detail: require('../../assets/images/faculty/detail/yaron-danon.2c0d95fe.webp') },
+  'yinan-wang': { thumb: require('../../assets/images/faculty/thumb/yinan-wang.a05057ab.webp'), detail: require('../../assets/images/faculty/detail/yinan-wang.f6977118.webp') },
+  'yingrui-yang': { thumb: require('../../assets/images/faculty/thumb/yingrui-yang.fcc5a8b4.webp'), detail: require('../../assets/images/faculty/detail/yingrui-yang.25db5461.webp') },
+  'yong-sung-kim': { thumb: require('../../assets/images/faculty/thumb/yong-sung-kim.2ed15c80.webp'), detail: require('../../assets/images/faculty/detail/yong-sung-kim.1a3be70c.webp') },
+  'yong-zheng': { thumb: require('../../assets/images/faculty/thumb/yong-zheng.8b5f3a83.webp'), detail: require('../../assets/images/faculty/detail/yong-zheng.6f16125c.webp') },
+  'yujie-ruan': { thumb: require('../../assets/images/faculty/thumb/yujie-ruan.c9a959f0.webp'), detail: require('../../assets/images/faculty/detail/yujie-ruan.a04ee557.webp') },
+  'yunfeng-shi': { thumb: require('../../assets/images/faculty/thumb/yunfeng-shi.803448fc.webp'), detail: require('../../assets/images/faculty/detail/yunfeng-shi.efe30726.webp') },
+  'yuri-lvov': { thumb: require('../../assets/images/faculty/thumb/yuri-lvov.2352fe15.webp'), detail: require('../../assets/images/faculty/detail/yuri-lvov.8a01e029.webp') },
+};
+
+export default shard;
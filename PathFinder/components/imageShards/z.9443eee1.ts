@@ -0,0 +1,10 @@
+// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+import type { ImageShard } from '../ImageMap';
+
+const shard: ImageShard = {
+  'zack-ward': { thumb: require('../../assets/images/faculty/thumb/zack-ward.a046e17a.webp'), detail: require('../../assets/images/faculty/detail/zack-ward.9474b263.webp') },
+  'zheyu-zhang': { thumb: require('../../assets/images/faculty/thumb/zheyu-zhang.a6a234b5.webp'), detail: require('../../assets/images/faculty/detail/zheyu-zhang.884f8a54.webp') },
+};
+
+export default shard;
@@ -0,0 +1,10 @@
+-- One-off migration: the unique key temps/batch_upsert.sql's
+-- INSERT ... ON CONFLICT (prof_name, class_code) needs on ratings.
+-- Run it once in the Supabase SQL editor before the first batch upsert.
+--
+-- It fails if ratings already has duplicate rows; list them with
+--   SELECT prof_name, class_code, COUNT(*) FROM ratings
+--   GROUP BY prof_name, class_code HAVING COUNT(*) > 1;
+-- and delete the extra rows first.
+
+CREATE UNIQUE INDEX IF NOT EXISTS "ratings_prof_name_class_code_key" ON "ratings" ("prof_name", "class_code");
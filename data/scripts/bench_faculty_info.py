@@ -0,0 +1,99 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from faculty_info import DEPT_MAP, DEPT_MATCHER, classify_department, faculty_entries, get_departments
+
+# Benchmark for faculty_info.classify_department (one Aho-Corasick pass per
+# entry) against the old loop over every DEPT_MAP key. Runs on the full
+# faculty catalog, and on the catalog repeated a few times to see how both
+# scale with the number of entries. The second table compares the streaming
+# catalog parser with the full BeautifulSoup parse on catalogs grown by
+# repeating their faculty paragraphs (time and peak traced memory).
+#
+#   python bench_faculty_info.py [catalog.html] [copies ...]
+
+CATALOG_FILE = "../professor_data/catalog.html"
+COPIES = [1, 10, 50]
+
+
+def legacy_classify_department(info_string):
+    # the previous get_departments inner loop, kept here only to compare
+    # speed and output
+    found_dept = 'unknown'
+    max_len = 0
+    for dept in DEPT_MAP.keys():
+        if dept.lower() in info_string.lower():
+            if len(dept) > max_len:
+                max_len = len(dept)
+                found_dept = DEPT_MAP[dept]
+    return found_dept
+
+
+def scale_catalog(html, copies):
+    # repeat everything between the first <p> and the last </p>
+    start = html.find("<p")
+    end = html.rfind("</p>") + len("</p>")
+    return html[:start] + html[start:end] * copies + html[end:]
+
+
+def parse_run(catalog_file, streaming):
+    # -> (seconds, peak traced bytes, records)
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = get_departments(catalog_file, streaming=streaming)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, records
+
+
+def best_time(func, texts, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    catalog_file = CATALOG_FILE
+    copies = COPIES
+    if len(sys.argv) > 1:
+        catalog_file = sys.argv[1]
+    if len(sys.argv) > 2:
+        copies = [int(n) for n in sys.argv[2:]]
+
+    with open(catalog_file, "r", encoding="utf-16") as f:
+        html = f.read()
+    start = time.perf_counter()
+    entries = list(faculty_entries(html))
+    parse_time = time.perf_counter() - start
+    texts = [info for _, info in entries]
+
+    print(f"{len(entries)} faculty entries ({parse_time * 1000:.0f} ms to parse the catalog), "
+          f"{len(DEPT_MAP)} department keys, {len(DEPT_MATCHER.goto)} automaton states")
+    print(f"{'entries':>8} {'legacy ms':>10} {'matcher ms':>11} {'speedup':>8}  same output")
+    for n in copies:
+        batch = texts * n
+        same = all(legacy_classify_department(t) == classify_department(t) for t in texts)
+        legacy = best_time(legacy_classify_department, batch)
+        matcher = best_time(classify_department, batch)
+        print(f"{len(batch):>8} {legacy * 1000:>10.2f} {matcher * 1000:>11.2f} {legacy / matcher:>7.1f}x  {same}")
+
+    print()
+    print(f"{'copies':>8} {'soup ms':>9} {'soup MB':>8} {'stream ms':>10} {'stream MB':>10}  same output")
+    for n in copies:
+        with tempfile.NamedTemporaryFile("w", encoding="utf-16", suffix=".html", delete=False) as f:
+            f.write(scale_catalog(html, n))
+        try:
+            soup_time, soup_peak, soup_records = parse_run(f.name, streaming=False)
+            stream_time, stream_peak, stream_records = parse_run(f.name, streaming=True)
+        finally:
+            os.remove(f.name)
+        print(f"{n:>8} {soup_time * 1000:>9.0f} {soup_peak / 2**20:>8.1f} {stream_time * 1000:>10.0f} "
+              f"{stream_peak / 2**20:>10.1f}  {soup_records == stream_records}")
@@ -0,0 +1,120 @@
+import glob
+import os
+import re
+import sys
+import time
+
+from rmp_script import parse_reviews
+from course_codes import resolve
+
+# Benchmark for rmp_script.parse_reviews, the card-by-card parser, against
+# the original str.find walk it replaced (legacy_parse_reviews below, with its
+# count < 6 and "v></di" offset cases). First every saved pane -- the default
+# ../temps/ratings.txt plus the pages rmp_batch.py reads -- is parsed both ways
+# and must give the same reviews. Then the first pane's review cards are
+# repeated until the page holds a few hundred reviews, the size of the pages
+# for professors who have been rated for years, and both parsers are timed.
+#
+#   python bench_rmp_script.py [page.html] [reviews ...]
+
+RATINGS_FILE = "../temps/ratings.txt"
+PAGES_DIR = "../temps/pages"
+REVIEW_COUNTS = [10, 100, 500, 2000]
+
+
+def legacy_parse_reviews(file_content_string):
+    # the original extract_class_info loop (minus the prints), kept here to
+    # compare speed and output
+    prof_num_index = file_content_string.find("/flag/professor-rating/")
+    prof_num = (file_content_string[prof_num_index+23:file_content_string.find("/", prof_num_index+23)])
+
+    class_name_index = file_content_string.find("RatingHeader__StyledClass")
+    count_num_reviews = 0
+    reviews = []
+
+    while(class_name_index > 5):
+        count_num_reviews = count_num_reviews + 1
+        class_name_index = file_content_string.find(">", class_name_index)
+        old_index_here = class_name_index
+
+        if(file_content_string[class_name_index:class_name_index+5] == "><img"):
+            class_name_index = file_content_string.find("currentitem", class_name_index + 1)
+            class_name_index = file_content_string.find(">", class_name_index + 1)
+
+        if(count_num_reviews < 6): class_name_index = file_content_string.find(">", class_name_index + 1)
+        if(file_content_string[class_name_index-1:class_name_index+5] == "v></di"):
+            class_name_index = old_index_here
+
+        class_name = (file_content_string[class_name_index+1:file_content_string.find("<", class_name_index+1)]).strip().upper()
+        if(len(class_name) == 8):
+            class_name = class_name[:4] + "-" + class_name[4:]
+
+        ratingindex = file_content_string.find("CardNumRating__CardNumRatingNumber", class_name_index)
+        ratingindex = file_content_string.find(">", ratingindex)
+        user_rating = float(file_content_string[ratingindex+1:file_content_string.find("<", ratingindex)])
+
+        diffindex = file_content_string.find("CardNumRating__CardNumRatingNumber", ratingindex)
+        diffindex = file_content_string.find(">", diffindex)
+        user_diff = float(file_content_string[diffindex+1:file_content_string.find("<", diffindex)])
+
+        reviews.append((class_name, user_rating, user_diff))
+
+        class_name_index = file_content_string.find("RatingHeader__StyledClass", diffindex)
+        class_name_index = file_content_string.find("RatingHeader__StyledClass", class_name_index+5)
+
+    return prof_num, reviews
+
+
+def scale_page(html, num_reviews):
+    # repeat the <li> review cards of a saved pane until it has num_reviews
+    start = html.find("<li>")
+    end = html.rfind("</li>") + len("</li>")
+    cards = re.findall(r"<li>.*?</li>(?=<li>|$)", html[start:end], re.S)
+    cards = [c for c in cards if "Rating__StyledRating" in c]
+    repeated = (cards * (num_reviews // len(cards) + 1))[:num_reviews]
+    return html[:start] + "".join(repeated) + html[end:]
+
+
+def best_time(func, arg, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def same_output(html):
+    # the parser also folds codes through the shared resolver
+    prof_num, legacy_reviews = legacy_parse_reviews(html)
+    return (prof_num, [(resolve(c), r, d) for c, r, d in legacy_reviews]) == parse_reviews(html)
+
+
+if __name__ == "__main__":
+    page_files = [RATINGS_FILE] + sorted(glob.glob(os.path.join(PAGES_DIR, "*.html"))
+                                         + glob.glob(os.path.join(PAGES_DIR, "*.txt")))
+    counts = REVIEW_COUNTS
+    if len(sys.argv) > 1:
+        page_files = [sys.argv[1]]
+    if len(sys.argv) > 2:
+        counts = [int(n) for n in sys.argv[2:]]
+
+    pages = []
+    for page_file in page_files:
+        with open(page_file, "r", encoding="utf-8") as f:
+            pages.append(f.read())
+    mismatched = [f for f, html in zip(page_files, pages) if not same_output(html)]
+    print(f"Saved panes with the same output: {len(pages) - len(mismatched)} of {len(pages)}")
+    for page_file in mismatched:
+        print(f"  differs: {page_file}")
+
+    html = pages[0]
+    print(f"{'reviews':>8} {'page KB':>9} {'legacy ms':>10} {'parser ms':>10} {'speedup':>8}  same output")
+    for n in counts:
+        page = scale_page(html, n)
+        same = same_output(page)
+        legacy = best_time(legacy_parse_reviews, page)
+        single = best_time(parse_reviews, page)
+        print(f"{n:>8} {len(page) / 1024:>9.0f} {legacy * 1000:>10.2f} {single * 1000:>10.2f} {legacy / single:>7.1f}x  {same}")
+    if mismatched:
+        sys.exit(1)
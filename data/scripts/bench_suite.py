@@ -0,0 +1,463 @@
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import instrument
+
+# Benchmark suite for the data-processing hot paths, on synthetic inputs at
+# 1x, 10x and 100x RPI's size:
+#   compact_courses         QuACS semester dump (subjects -> courses -> sections)
+#   build_professor_index   the compact_classes history
+#   compact_rmp_data        RMP Relay stores, one at a time
+#   rmp_ingest              the same stores as one NDJSON dump (rmp_compacter)
+#   extract_class_info      copied RMP review panes
+#   rmp_csv                 prof_rate.json with every review
+#   get_departments         faculty catalog HTML (UTF-16), streaming and soup
+# Inputs are generated up front from a fixed seed, so every run measures the
+# same bytes. Each (benchmark, scale) runs in a fresh process: the best of
+# --repeat runs is the time, and peak memory is the highest RSS sampled while
+# the function ran (instrument.timer) above what the process held once its
+# input was loaded.
+#
+# Results go to temps/bench_results.json; --save-baseline also stores them as
+# the baseline, and later runs are compared with it (time or memory more
+# than TOLERANCE worse is a regression, and the exit code is 1). Baselines
+# are per machine, so save one before changing anything. Both files are
+# gitignored.
+#
+#   python bench_suite.py [benchmarks ...] [--scales 1 10 100] [--repeat N]
+#                         [--max-mb N] [--save-baseline] [--baseline file]
+
+SCALES = [1, 10, 100]
+REPEAT = 3
+# inputs bigger than this are skipped (build_professor_index at 100x would
+# be well over a gigabyte of term files)
+MAX_INPUT_MB = 512
+TOLERANCE = 0.15
+# memory differences below this are noise
+MIN_MEMORY_DELTA_MB = 2.0
+SEED = 2026
+
+BASELINE_FILE = "../temps/bench_baseline.json"
+RESULTS_FILE = "../temps/bench_results.json"
+
+# 1x, measured from data/: courses in a fall/spring term, subjects, terms in
+# class_data, instructors in professor_courses.json, faculty in the catalog
+COURSES_PER_TERM = 1000
+SUBJECTS = 43
+TERMS = 79
+INSTRUCTORS = 2726
+CATALOG_FACULTY = 478
+# one RMP page per catalog faculty member; reviews per page between the
+# saved panes (10) and the long-rated professors (77)
+RMP_PROFESSORS = CATALOG_FACULTY
+REVIEWS_PER_PROFESSOR = 20
+SECTIONS_PER_COURSE = 3
+
+FIRST_NAMES = ["Alex", "Barbara", "Chen", "Dawn", "Elena", "Farid", "Grace", "Hiro", "Ines", "James",
+               "Kavya", "Luis", "Maurice", "Nadia", "Omar", "Priya", "Quinn", "Rosa", "Sibel", "Tomas"]
+LAST_NAMES = ["Adali", "Cutler", "Goldschmidt", "Kilduff", "Suckling", "Korolov", "Sturman", "Abdoun",
+              "Nguyen", "Okafor", "Petrov", "Ramirez", "Schmidt", "Tanaka", "Underwood", "Volkov"]
+SUBJECT_CODES = ["ARCH", "BMED", "CHME", "CIVL", "ECSE", "ISYE", "MTLE", "MANE", "ARTS", "COGS", "COMM",
+                 "ECON", "GSAS", "STSO", "MGMT", "BIOL", "CHEM", "CSCI", "ERTH", "MATH", "PHYS", "PSYC",
+                 "PHIL", "LITR", "WRIT", "LANG", "ITWS", "ENGR", "ADMN", "ASTR", "BCBP", "ENVE", "ESCI",
+                 "IHSS", "INQR", "MUSC", "NSST", "STSH", "USAF", "USAR", "USNA", "DSES", "EPOW"]
+DEPARTMENTS = ["Architecture", "Biomedical Engineering", "Chemical and Biological Engineering",
+               "Civil and Environmental Engineering", "Electrical, Computer, and Systems Engineering",
+               "Industrial and Systems Engineering", "Materials Science and Engineering", "Arts",
+               "Cognitive Science", "Communication and Media", "Economics", "Management",
+               "Biological Sciences", "Chemistry and Chemical Biology", "Computer Science",
+               "Mathematical Sciences", "Physics, Applied Physics, and Astronomy"]
+
+
+def person(n):
+    # distinct, name-shaped names for any n
+    return (f"{FIRST_NAMES[n % len(FIRST_NAMES)]}",
+            f"{LAST_NAMES[(n // len(FIRST_NAMES)) % len(LAST_NAMES)]}{n // (len(FIRST_NAMES) * len(LAST_NAMES)) or ''}")
+
+
+def course_code(rng):
+    return f"{rng.choice(SUBJECT_CODES)}{rng.randrange(1000, 7000):04d}"
+
+
+# --- Generators ---
+# each writes its input into work_dir and returns (path, records)
+
+def gen_quacs_semester(work_dir, scale, rng):
+    courses = COURSES_PER_TERM * scale
+    instructors = INSTRUCTORS * scale
+    subjects = []
+    for s in range(SUBJECTS):
+        code = SUBJECT_CODES[s % len(SUBJECT_CODES)]
+        subject = {"name": f"Subject {code}", "code": code, "courses": []}
+        for c in range(s, courses, SUBJECTS):
+            sections = []
+            for k in range(SECTIONS_PER_COURSE):
+                names = ", ".join(" ".join(person(rng.randrange(instructors))) for _ in range(rng.choice((1, 1, 2))))
+                sections.append({
+                    "crn": 10000 + c * SECTIONS_PER_COURSE + k, "sec": f"{k + 1:02d}", "act": rng.randrange(60),
+                    "cap": 60, "rem": 0, "credMin": 4, "credMax": 4,
+                    "timeslots": [{"days": ["M", "R"], "timeStart": 1000, "timeEnd": 1150, "instructor": names,
+                                   "location": "DCC 308", "dateStart": "01/08", "dateEnd": "04/22"},
+                                  {"days": ["W"], "timeStart": 1400, "timeEnd": 1550, "instructor": names,
+                                   "location": "Lally 102", "dateStart": "01/08", "dateEnd": "04/22"}]
+                })
+            subject["courses"].append({"id": f"{code}-{1000 + c // SUBJECTS:04d}", "title": f"Course {c}",
+                                       "crse": 1000 + c // SUBJECTS, "subj": code, "sections": sections})
+        subjects.append(subject)
+    path = os.path.join(work_dir, "courses.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(subjects, f)
+    return path, courses
+
+
+def gen_compact_terms(work_dir, scale, rng):
+    courses = COURSES_PER_TERM * scale
+    instructors = INSTRUCTORS * scale
+    terms_dir = os.path.join(work_dir, "class_data")
+    os.makedirs(terms_dir)
+    terms = [f"{2000 + t // 3}{('01', '05', '09')[t % 3]}" for t in range(TERMS)]
+    for term in terms:
+        records = [{"id": f"{SUBJECT_CODES[c % len(SUBJECT_CODES)]}-{1000 + c // len(SUBJECT_CODES):04d}",
+                    "title": f"Course {c}", "act": rng.randrange(60), "cap": 60,
+                    "instructors": sorted({" ".join(person(rng.randrange(instructors)))
+                                           for _ in range(rng.choice((1, 2, 3)))})}
+                   for c in range(courses)]
+        with open(os.path.join(terms_dir, f"compact_classes{term}.json"), "w") as f:
+            json.dump(records, f, indent=2)
+    return terms_dir, courses * TERMS
+
+
+def professor_ratings(n, rng):
+    return [(course_code(rng), rng.randrange(1, 6), rng.randrange(1, 6))
+            for _ in range(max(1, int(rng.expovariate(1 / REVIEWS_PER_PROFESSOR))))]
+
+
+def gen_relay_payloads(work_dir, scale, rng):
+    from rmp_compacter import synthetic_store
+    path = os.path.join(work_dir, "stores.ndjson")
+    professors = RMP_PROFESSORS * scale
+    with open(path, "w", encoding="utf-8") as f:
+        for n in range(professors):
+            first, last = person(n)
+            f.write(json.dumps(synthetic_store(100000 + n, first, last, professor_ratings(n, rng))) + "\n")
+    return path, professors
+
+
+REVIEW_CARD = (
+    '<li><div class="Rating__StyledRating-sc-1rhvpxz-1 jOZHgV"><div class="Rating__RatingBody-sc-1rhvpxz-0 hRXbIu">'
+    '<div class="RatingHeader__StyledHeader-sc-1dlkqw1-1 gLgcuk"><div class="RatingHeader__ClassInfoWrapper-sc-1dlkqw1-2 iMnRfp">'
+    '<div class="RatingHeader__StyledClass-sc-1dlkqw1-3 gldlxh">{course}</div></div>'
+    '<div class="TimeStamp__StyledTimeStamp-sc-9q2r30-0 czvMwn">Apr 30th, 2024</div></div>'
+    '<div class="RatingValues__StyledRatingValues-sc-6dc747-0 btjPzw"><div class="CardNumRating__StyledCardNumRating-sc-17t4b9u-0 cSNjdE">'
+    '<div class="CardNumRating__CardNumRatingHeader-sc-17t4b9u-1 lhHpkk">Quality</div>'
+    '<div class="CardNumRating__CardNumRatingNumber-sc-17t4b9u-2 ERCLc">{quality}.0</div></div>'
+    '<div class="CardNumRating__StyledCardNumRating-sc-17t4b9u-0 cSNjdE">'
+    '<div class="CardNumRating__CardNumRatingHeader-sc-17t4b9u-1 lhHpkk">Difficulty</div>'
+    '<div class="CardNumRating__CardNumRatingNumber-sc-17t4b9u-2 eBKGNg">{difficulty}.0</div></div></div>'
+    '<div class="Rating__RatingInfo-sc-1rhvpxz-3 kfdAAu"><div class="RatingHeader__StyledHeader-sc-1dlkqw1-1 lnatBH">'
+    '<div class="RatingHeader__StyledClass-sc-1dlkqw1-3 gldlxh">{course}</div></div>'
+    '<div class="Comments__StyledComments-dzzyvm-0 jpfwLX">{comment}</div>'
+    '<a class="RatingFooter__StyledFlag" href="/flag/professor-rating/{prof_num}/{rating_num}">Report</a>'
+    '</div></div></div></li>'
+)
+
+
+def review_page(prof_num, ratings):
+    cards = "".join(REVIEW_CARD.format(course=course, quality=quality, difficulty=difficulty,
+                                       comment="Lectures were clear and the projects were fair. " * 4,
+                                       prof_num=prof_num, rating_num=prof_num * 1000 + i)
+                    for i, (course, quality, difficulty) in enumerate(ratings))
+    return f'<div class="RatingsList__RatingsWrapper"><ul class="RatingsList__RatingsUL">{cards}</ul></div>'
+
+
+def gen_review_pages(work_dir, scale, rng):
+    path = os.path.join(work_dir, "panes.ndjson")
+    reviews = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for n in range(RMP_PROFESSORS * scale):
+            ratings = professor_ratings(n, rng)
+            reviews += len(ratings)
+            f.write(json.dumps(review_page(100000 + n, ratings)) + "\n")
+    return path, reviews
+
+
+def gen_prof_rate(work_dir, scale, rng):
+    # the "old" shape: CODE -> [[rating, diff], ...] per review
+    data = {}
+    reviews = 0
+    for n in range(RMP_PROFESSORS * scale):
+        entry = {"temp": "temp"}
+        for course, quality, difficulty in professor_ratings(n, rng):
+            entry.setdefault(course, []).append([quality, difficulty])
+            reviews += 1
+        data[" ".join(person(n))] = entry
+    path = os.path.join(work_dir, "prof_rate.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path, reviews
+
+
+def gen_catalog(work_dir, scale, rng):
+    entries = CATALOG_FACULTY * scale
+    paragraphs = []
+    for n in range(entries):
+        first, last = person(n)
+        title = rng.choice(["Professor", "Associate Professor", "Assistant Professor", "Senior Lecturer"])
+        extra = rng.choice(["", " • ►&#160;&#160; Associate Dean for Research,"])
+        paragraphs.append(f"<p><strong>{last}, {first}</strong>{extra} {title} of {rng.choice(DEPARTMENTS)}, "
+                          f"Ph.D. (University of Somewhere)</p>\n\n")
+    html = ("<!DOCTYPE html><html><head><title>The Faculty</title></head><body><table><tr><td>\n"
+            + "<p>&#160;</p>\n" + "".join(paragraphs) + "</td></tr></table></body></html>\n")
+    path = os.path.join(work_dir, "catalog.html")
+    with open(path, "w", encoding="utf-16") as f:
+        f.write(html)
+    return path, entries
+
+
+# --- Benchmarks ---
+# prepare(path) loads what the function gets in memory and runs before the
+# memory baseline; run(prepared, work_dir) -> records processed
+
+def prepare_path(path):
+    return path
+
+
+def prepare_lines(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) if line.startswith('"') else line for line in f]
+
+
+def run_compact_courses(path, work_dir):
+    from parse import compact_courses
+    return compact_courses(path, os.path.join(work_dir, "compact.json"))
+
+
+def run_build_professor_index(path, work_dir):
+    # courses read, as counted by combine_prof itself
+    from combine_prof import build_professor_index
+    before = instrument.RECORDER.counters.get("courses", 0)
+    build_professor_index(path, os.path.join(work_dir, "professor_courses.json"), incremental=False)
+    return instrument.RECORDER.counters.get("courses", 0) - before
+
+
+def run_compact_rmp_data(stores, work_dir):
+    from rmp_compacter import compact_rmp_data
+    return sum(len(compact_rmp_data(store)) for store in stores)
+
+
+def run_rmp_ingest(path, work_dir):
+    from rmp_compacter import ingest_file
+    return len(ingest_file(path)[0])
+
+
+def run_extract_class_info(pages, work_dir):
+    # extract_class_info reads and writes ../temps next to its cwd
+    from rmp_script import extract_class_info
+    sandbox = os.path.join(work_dir, "sandbox")
+    os.makedirs(os.path.join(sandbox, "scripts"), exist_ok=True)
+    os.makedirs(os.path.join(sandbox, "temps"), exist_ok=True)
+    with open(os.path.join(sandbox, "temps", "full_names.txt"), "w", encoding="utf-8") as f:
+        f.write("Bench Professor\n")
+    cwd = os.getcwd()
+    os.chdir(os.path.join(sandbox, "scripts"))
+    try:
+        reviews = 0
+        for page in pages:
+            with open("../temps/sql_insert.sql", "w", encoding="utf-8") as f:
+                f.write("https://faculty.rpi.edu/bench-professor\n")
+            result = extract_class_info(page, "new", verbose=False)
+            reviews += sum(v[2] for v in result["Bench Professor"].values() if isinstance(v, list))
+        return reviews
+    finally:
+        os.chdir(cwd)
+
+
+def run_rmp_csv(path, work_dir):
+    from rmp_csv_convert import rmp_csv
+    output_csv = os.path.join(work_dir, "ratings.csv")
+    rmp_csv([], input_json_file=path, output_csv_file=output_csv,
+            stats_csv_file=os.path.join(work_dir, "stats.csv"), alias_file=os.path.join(work_dir, "aliases.csv"))
+    import pandas as pd
+    return int(pd.read_csv(output_csv)["num_ratings"].sum())
+
+
+def run_get_departments(path, work_dir):
+    from faculty_info import get_departments
+    return len(get_departments(path, streaming=True))
+
+
+def run_get_departments_soup(path, work_dir):
+    from faculty_info import get_departments
+    return len(get_departments(path, streaming=False))
+
+
+BENCHMARKS = {
+    # name: (generator, prepare, run, input MB at 1x)
+    "compact_courses": (gen_quacs_semester, prepare_path, run_compact_courses, 1.3),
+    "build_professor_index": (gen_compact_terms, prepare_path, run_build_professor_index, 12.2),
+    "compact_rmp_data": (gen_relay_payloads, prepare_lines, run_compact_rmp_data, 8.9),
+    "rmp_ingest": (gen_relay_payloads, prepare_path, run_rmp_ingest, 8.9),
+    "extract_class_info": (gen_review_pages, prepare_lines, run_extract_class_info, 13.5),
+    "rmp_csv": (gen_prof_rate, prepare_path, run_rmp_csv, 0.2),
+    "get_departments": (gen_catalog, prepare_path, run_get_departments, 0.13),
+    "get_departments_soup": (gen_catalog, prepare_path, run_get_departments_soup, 0.13),
+}
+
+
+def input_size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
+
+
+def measure(name, path, work_dir, repeat):
+    # fresh process job: -> (best seconds, peak MB above the loaded input, records)
+    _, prepare, run, _ = BENCHMARKS[name]
+    instrument.set_quiet()
+    prepared = prepare(path)
+    before = instrument.current_rss()
+    best = float("inf")
+    records = 0
+    for _ in range(repeat):
+        # the timer samples RSS while the function runs (ru_maxrss would also
+        # count the process start)
+        with contextlib.redirect_stdout(io.StringIO()), instrument.timer(name):
+            start = time.perf_counter()
+            records = run(prepared, work_dir)
+            best = min(best, time.perf_counter() - start)
+    peak = instrument.RECORDER.timers[name]["peak_rss"]
+    return best, max(0, peak - before) / 2**20 if peak and before else None, records
+
+
+def run_suite(names=None, scales=SCALES, repeat=REPEAT, max_mb=MAX_INPUT_MB):
+    # -> {"<benchmark>@<scale>x": result}
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for name in names or list(BENCHMARKS):
+        generate, _, _, mb_1x = BENCHMARKS[name]
+        for scale in scales:
+            key = f"{name}@{scale}x"
+            if mb_1x * scale > max_mb:
+                print(f"  {key}: skipped (about {mb_1x * scale:.0f} MB of input, over --max-mb {max_mb})")
+                continue
+            work_dir = tempfile.mkdtemp(prefix="bench_")
+            try:
+                rng = random.Random(f"{SEED}:{generate.__name__}:{scale}")
+                path, expected = generate(work_dir, scale, rng)
+                size = input_size(path)
+                # big inputs once, small ones best of repeat
+                runs = repeat if size < 64 * 2**20 else 1
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    seconds, peak_mb, records = pool.submit(measure, name, path, work_dir, runs).result()
+            finally:
+                shutil.rmtree(work_dir, ignore_errors=True)
+            if records != expected:
+                print(f"  {key}: processed {records} records, generated {expected}")
+            results[key] = {
+                "benchmark": name, "scale": scale, "records": records, "input_mb": round(size / 2**20, 2),
+                "seconds": round(seconds, 4), "records_per_s": round(records / seconds, 1),
+                "mb_per_s": round(size / 2**20 / seconds, 2),
+                "peak_mb": round(peak_mb, 1) if peak_mb is not None else None
+            }
+            print_result(key, results[key])
+    return results
+
+
+def print_result(key, r):
+    print(f"  {key:<28} {r['records']:>9} rec {r['input_mb']:>8.1f} MB {r['seconds']:>9.3f}s "
+          f"{r['records_per_s']:>11.0f} rec/s {r['mb_per_s']:>8.1f} MB/s  peak +{r['peak_mb']} MB")
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    # -> regressions; prints one line per benchmark present in both
+    regressions = []
+    print(f"{'benchmark':<28} {'time':>8} {'memory':>8}  vs baseline")
+    for key, r in results.items():
+        base = baseline.get(key)
+        if not base:
+            print(f"{key:<28} {'':>8} {'':>8}  new")
+            continue
+        time_ratio = r["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        notes = []
+        if time_ratio > 1 + tolerance:
+            notes.append("slower")
+        elif time_ratio < 1 - tolerance:
+            notes.append("faster")
+        memory = ""
+        if r["peak_mb"] is not None and base.get("peak_mb") is not None:
+            delta = r["peak_mb"] - base["peak_mb"]
+            memory = f"{delta:+.1f}MB"
+            if abs(delta) >= MIN_MEMORY_DELTA_MB and base["peak_mb"]:
+                if r["peak_mb"] > base["peak_mb"] * (1 + tolerance):
+                    notes.append("more memory")
+                elif r["peak_mb"] < base["peak_mb"] * (1 - tolerance):
+                    notes.append("less memory")
+        if "slower" in notes or "more memory" in notes:
+            regressions.append(key)
+        print(f"{key:<28} {time_ratio:>7.2f}x {memory:>8}  {', '.join(notes) or 'same'}")
+    return regressions
+
+
+def save_results(results, results_file):
+    os.makedirs(os.path.dirname(os.path.abspath(results_file)), exist_ok=True)
+    with open(results_file, "w", encoding="utf-8") as f:
+        json.dump({"created": time.strftime("%Y-%m-%d %H:%M:%S"), "python": platform.python_version(),
+                   "machine": platform.platform(), "results": results}, f, indent=2)
+
+
+def load_results(results_file):
+    if not os.path.exists(results_file):
+        return {}
+    with open(results_file, "r", encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def option(args, flag, default, convert, many=False):
+    # --flag value (or --flag v1 v2 ... with many) pulled out of args
+    if flag not in args:
+        return default
+    i = args.index(flag)
+    end = i + 2
+    if many:
+        while end < len(args) and not args[end].startswith("--"):
+            end += 1
+    values = [convert(v) for v in args[i + 1:end]]
+    del args[i:end]
+    return values if many else values[0]
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    scales = option(args, "--scales", SCALES, int, many=True)
+    repeat = option(args, "--repeat", REPEAT, int)
+    max_mb = option(args, "--max-mb", MAX_INPUT_MB, float)
+    baseline_file = option(args, "--baseline", BASELINE_FILE, str)
+    save_baseline = "--save-baseline" in args
+    names = [a for a in args if not a.startswith("--")]
+    for name in names:
+        if name not in BENCHMARKS:
+            sys.exit(f"Unknown benchmark {name}, one of: {', '.join(BENCHMARKS)}")
+
+    print(f"Benchmarks at {', '.join(f'{s}x' for s in scales)} (best of {repeat})")
+    results = run_suite(names, scales, repeat, max_mb)
+    save_results(results, RESULTS_FILE)
+
+    regressions = []
+    baseline = load_results(baseline_file)
+    if baseline:
+        print()
+        regressions = compare(results, baseline)
+    if save_baseline:
+        save_results({**baseline, **results}, baseline_file)
+        print(f"Baseline saved to {baseline_file}")
+    sys.exit(1 if regressions else 0)
@@ -0,0 +1,181 @@
+import sqlite3
+import json
+import glob
+import os
+import sys
+
+import instrument
+
+# Single-file store for the whole class_data history.
+# Every compact_classes<term>.json is folded into one SQLite file where course
+# ids, titles and instructor names are interned once and each offering is a
+# row of small integers (term, course, title, act, cap). Cross-term questions
+# like "enrollment trend for CSCI-1200" become one indexed query instead of
+# json.load-ing 79 files.
+
+INPUT_DIR = "../class_data"
+STORE_FILE = "../class_data/class_store.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS courses (id INTEGER PRIMARY KEY, code TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS titles (id INTEGER PRIMARY KEY, title TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS instructors (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS offerings (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL,
+    course INTEGER NOT NULL REFERENCES courses(id),
+    title INTEGER NOT NULL REFERENCES titles(id),
+    act INTEGER NOT NULL,
+    cap INTEGER NOT NULL,
+    position INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS offering_instructors (
+    offering INTEGER NOT NULL REFERENCES offerings(id),
+    instructor INTEGER NOT NULL REFERENCES instructors(id),
+    PRIMARY KEY (offering, instructor)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS offerings_term ON offerings(term, position);
+CREATE INDEX IF NOT EXISTS offerings_course ON offerings(course, term);
+CREATE INDEX IF NOT EXISTS offering_instructors_instructor ON offering_instructors(instructor);
+"""
+
+
+def open_store(store_file=STORE_FILE):
+    conn = sqlite3.connect(store_file)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def term_from_path(filepath):
+    # "compact_classes202501.json" -> "202501"
+    return os.path.basename(filepath).replace("compact_classes", "").replace(".json", "")
+
+
+def intern(conn, cache, table, column, value):
+    # look a string up once per build, insert it the first time it is seen
+    if value in cache:
+        return cache[value]
+    conn.execute(f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)", (value,))
+    row_id = conn.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,)).fetchone()[0]
+    cache[value] = row_id
+    return row_id
+
+
+def store_term(conn, term, courses, caches=None):
+    # replace everything stored for one term with the given compact records
+    if caches is None:
+        caches = ({}, {}, {})
+    course_ids, title_ids, instructor_ids = caches
+
+    delete_term(conn, term)
+    for position, course in enumerate(courses):
+        course_id = intern(conn, course_ids, "courses", "code", course["id"])
+        title_id = intern(conn, title_ids, "titles", "title", course["title"])
+        offering = conn.execute(
+            "INSERT INTO offerings (term, course, title, act, cap, position) VALUES (?, ?, ?, ?, ?, ?)",
+            (term, course_id, title_id, course["act"], course["cap"], position)
+        ).lastrowid
+        conn.executemany(
+            "INSERT OR IGNORE INTO offering_instructors (offering, instructor) VALUES (?, ?)",
+            [(offering, intern(conn, instructor_ids, "instructors", "name", name))
+             for name in course.get("instructors", [])]
+        )
+
+
+def delete_term(conn, term):
+    conn.execute(
+        "DELETE FROM offering_instructors WHERE offering IN (SELECT id FROM offerings WHERE term = ?)",
+        (term,)
+    )
+    conn.execute("DELETE FROM offerings WHERE term = ?", (term,))
+
+
+def build_class_store(input_dir=INPUT_DIR, store_file=STORE_FILE):
+    conn = open_store(store_file)
+    caches = ({}, {}, {})
+
+    files = sorted(glob.glob(os.path.join(input_dir, "compact_classes*.json")))
+    with conn:
+        for filepath in files:
+            with open(filepath, "r") as f:
+                courses = json.load(f)
+            with instrument.timer("store_term"):
+                store_term(conn, term_from_path(filepath), courses, caches)
+            instrument.count("courses", len(courses))
+    conn.execute("VACUUM")
+
+    print(f"Stored {len(files)} terms in {store_file}")
+    return conn
+
+
+# --- Loader API ---
+
+def terms(conn):
+    return [row[0] for row in conn.execute("SELECT DISTINCT term FROM offerings ORDER BY term")]
+
+
+def load_term(conn, term):
+    # same list of dicts json.load gives for compact_classes<term>.json
+    rows = conn.execute("""
+        SELECT o.id, c.code, t.title, o.act, o.cap
+        FROM offerings o
+        JOIN courses c ON c.id = o.course
+        JOIN titles t ON t.id = o.title
+        WHERE o.term = ?
+        ORDER BY o.position
+    """, (term,)).fetchall()
+
+    names = {}
+    for offering, name in conn.execute("""
+        SELECT oi.offering, i.name
+        FROM offering_instructors oi
+        JOIN instructors i ON i.id = oi.instructor
+        JOIN offerings o ON o.id = oi.offering
+        WHERE o.term = ?
+    """, (term,)):
+        names.setdefault(offering, []).append(name)
+
+    return [
+        {
+            "id": code,
+            "title": title,
+            "act": act,
+            "cap": cap,
+            "instructors": sorted(names.get(offering, []))
+        }
+        for offering, code, title, act, cap in rows
+    ]
+
+
+def enrollment_trend(conn, course_code):
+    # [(term, act, cap), ...] in chronological order
+    return conn.execute("""
+        SELECT o.term, SUM(o.act), SUM(o.cap)
+        FROM offerings o
+        JOIN courses c ON c.id = o.course
+        WHERE c.code = ?
+        GROUP BY o.term
+        ORDER BY o.term
+    """, (course_code,)).fetchall()
+
+
+def iter_instructor_courses(conn):
+    # (instructor, term, course_id) triples in the order the JSON files list them
+    return conn.execute("""
+        SELECT i.name, o.term, c.code
+        FROM offering_instructors oi
+        JOIN offerings o ON o.id = oi.offering
+        JOIN instructors i ON i.id = oi.instructor
+        JOIN courses c ON c.id = o.course
+        ORDER BY o.term, o.position
+    """)
+
+
+if __name__ == "__main__":
+    conn = build_class_store()
+
+    # python class_store.py CSCI-1200 -> print its enrollment trend
+    for code in sys.argv[1:]:
+        print(code)
+        for term, act, cap in enrollment_trend(conn, code):
+            print(f"  {term}: {act}/{cap}")
@@ -1,31 +1,106 @@
 import json
 import glob
+import hashlib
 import os
+import sys
 from collections import defaultdict
 import pandas as pd
 
-def build_professor_index(input_dir, output_file):
+import instrument
+
+
+def term_from_path(filepath):
+    # Extract term code like "202501" from filename
+    filename = os.path.basename(filepath)
+    return filename.replace("compact_classes", "").replace(".json", "")
+
+
+def file_hash(filepath):
+    with open(filepath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def fold_term(instructor_map, term, courses):
+    # Go through each course
+    for course in courses:
+        course_id = course.get("id")
+        instructors = course.get("instructors", [])
+
+        for instr in instructors:
+            instructor_map[instr][term].append(course_id)
+
+
+def remove_term(instructor_map, term):
+    # drop a term's contributions, and any instructor left with no terms
+    for instr in list(instructor_map):
+        terms = instructor_map[instr]
+        if term in terms:
+            del terms[term]
+            if not terms:
+                del instructor_map[instr]
+
+
+def manifest_path(output_file):
+    # professor_courses.json -> professor_courses_manifest.json
+    return os.path.splitext(output_file)[0] + "_manifest.json"
+
+
+def build_professor_index(input_dir, output_file, incremental=False):
     # This will hold instructor -> { semester: [course_ids] }
     instructor_map = defaultdict(lambda: defaultdict(list))
 
+    # The manifest records each term file folded into the index by mtime and
+    # hash, so an incremental run only re-reads the files that changed
+    manifest_file = manifest_path(output_file)
+    manifest = {}
+    if incremental and os.path.exists(output_file) and os.path.exists(manifest_file):
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+        with open(output_file, "r") as f:
+            for instr, terms in json.load(f).items():
+                for term, course_ids in terms.items():
+                    instructor_map[instr][term] = course_ids
+
     # Loop through all compact_classes*.json files
+    seen = set()
+    changed = 0
     for filepath in glob.glob(os.path.join(input_dir, "compact_classes*.json")):
-        filename = os.path.basename(filepath)
+        term = term_from_path(filepath)
+        seen.add(term)
+
+        mtime = os.path.getmtime(filepath)
+        entry = manifest.get(term)
+        if entry and entry["mtime"] == mtime:
+            continue
 
-        # Extract term code like "202501" from filename
-        term = filename.replace("compact_classes", "").replace(".json", "")
+        digest = file_hash(filepath)
+        if entry and entry["hash"] == digest:
+            # touched but not changed
+            entry["mtime"] = mtime
+            continue
 
         # Load JSON file
-        with open(filepath, "r") as f:
+        with instrument.timer("read_term_files"), open(filepath, "r") as f:
             courses = json.load(f)
+        instrument.count("term_files_read")
+        instrument.count("courses", len(courses))
 
-        # Go through each course
-        for course in courses:
-            course_id = course.get("id")
-            instructors = course.get("instructors", [])
+        remove_term(instructor_map, term)
+        fold_term(instructor_map, term, courses)
+        manifest[term] = {"file": os.path.basename(filepath), "mtime": mtime, "hash": digest}
+        changed += 1
 
-            for instr in instructors:
-                instructor_map[instr][term].append(course_id)
+    # term files that were deleted since the last run
+    for term in set(manifest) - seen:
+        remove_term(instructor_map, term)
+        del manifest[term]
+        changed += 1
+
+    if manifest and changed == 0:
+        with open(manifest_file, "w") as f:
+            json.dump(dict(sorted(manifest.items())), f, indent=2)
+        print(f"{output_file} is up to date")
+        return
 
     # Sort each instructor's term keys chronologically
     sorted_data = {
@@ -36,8 +111,21 @@ def build_professor_index(input_dir, output_file):
     with open(output_file, "w") as f:
         json.dump(sorted_data, f, indent=2)
 
-    print(f"Professor-course mapping saved to {output_file}")
+    with open(manifest_file, "w") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+
+    print(f"Professor-course mapping saved to {output_file} ({changed} term file(s) updated)")
 
 
 # Example usage:
-build_professor_index("class", "professor_courses.json")
+# python combine_prof.py              -> full rebuild
+# python combine_prof.py incremental  -> only fold in new/changed term files
+# python combine_prof.py [incremental] <class dir> <output file>
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    incremental = "incremental" in args
+    args = [a for a in args if a != "incremental"]
+    input_dir = args[0] if args else "class"
+    output_file = args[1] if len(args) > 1 else "professor_courses.json"
+    with instrument.timer("build_professor_index"):
+        build_professor_index(input_dir, output_file, incremental=incremental)
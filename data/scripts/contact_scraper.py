@@ -0,0 +1,317 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+import instrument
+from directory_lookup import CachedDirectory, LdifDirectory
+
+# Concurrent contact info scraper for faculty_info.py.
+# Per professor: one Custom Search call for the faculty page, the page
+# itself (email + phone) and one Custom Search call for LinkedIn; offices
+# are then resolved for every email at once through a directory backend
+# (directory_lookup.py). Names are worked on by a thread pool sharing one pooled
+# session; every request waits on a token bucket (the search API quota is
+# per second), is retried with exponential backoff on connection errors,
+# 429 and 5xx, and successful responses are kept in an on-disk cache keyed
+# by URL + query so a rerun only does what is missing. One professor failing
+# is recorded in their entry instead of stopping the run.
+#
+# Paths are relative to data/, like the rest of faculty_info.py.
+
+SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
+CACHE_DIR = "professor_data/contact_cache"
+
+WORKERS = 8
+RATE = 5          # requests per second, shared by all workers
+BURST = 10
+RETRIES = 3       # more attempts after the first one
+BACKOFF = 0.5     # seconds, doubled after every failed attempt
+TIMEOUT = 20
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'
+}
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    # refills `rate` tokens per second up to `capacity`; acquire() blocks
+    # until a token is free
+
+    def __init__(self, rate=RATE, capacity=BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class ResponseCache:
+    # one JSON file per response body, named by a hash of the cache key;
+    # written to a temp file first so a killed run never leaves a bad entry
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key):
+        try:
+            with open(self.path(key), "r", encoding="utf-8") as f:
+                return json.load(f)["body"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def put(self, key, body):
+        path = self.path(key)
+        temp_file = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "body": body}, f)
+        os.replace(temp_file, path)
+
+
+def cache_key(url, params=None):
+    # the API key is left out so rotating it doesn't invalidate the cache
+    params = {k: v for k, v in (params or {}).items() if k != "key"}
+    return url + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+
+
+class ContactScraper:
+
+    def __init__(self, api_key=None, cx=None, search_url=SEARCH_URL, cache_dir=CACHE_DIR,
+                 workers=WORKERS, rate=RATE, burst=BURST, retries=RETRIES, backoff=BACKOFF,
+                 directory=None):
+        self.api_key = api_key
+        self.cx = cx
+        self.search_url = search_url
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        # a directory_lookup backend, or None to leave offices blank
+        self.directory = directory
+        self.cache = ResponseCache(cache_dir)
+        self.bucket = TokenBucket(rate, burst)
+        self.stats = {"requests": 0, "cached": 0, "retries": 0}
+        self.stats_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(HEADERS)
+
+    def count(self, stat):
+        with self.stats_lock:
+            self.stats[stat] += 1
+        instrument.count(f"contact_{stat}")
+
+    def fetch(self, url, params=None):
+        # -> response text, from the cache when we have it
+        key = cache_key(url, params)
+        body = self.cache.get(key)
+        if body is not None:
+            self.count("cached")
+            return body
+
+        delay = self.backoff
+        # the first request plus up to self.retries more
+        for attempt in range(self.retries + 1):
+            self.bucket.acquire()
+            self.count("requests")
+            try:
+                resp = self.session.get(url, params=params, timeout=TIMEOUT)
+            except requests.RequestException:
+                if attempt == self.retries:
+                    raise
+            else:
+                if resp.status_code not in RETRY_STATUS:
+                    resp.raise_for_status()
+                    instrument.count("bytes_fetched", len(resp.content))
+                    self.cache.put(key, resp.text)
+                    return resp.text
+                if attempt == self.retries:
+                    resp.raise_for_status()
+                retry_after = resp.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = max(delay, int(retry_after))
+            self.count("retries")
+            time.sleep(delay)
+            delay *= 2
+
+    def search_query(self, query):
+        # first result link for a Custom Search query, or None
+        params = {"key": self.api_key, "cx": self.cx, "q": query, "num": 1}
+        items = json.loads(self.fetch(self.search_url, params)).get("items", [])
+        return items[0]["link"] if items else None
+
+    def get_contact_info(self, name):
+        faculty_page_url = self.search_query(f"{name} rpi faculty")
+        email_link = phone_num = ""
+        if faculty_page_url:
+            soup = BeautifulSoup(self.fetch(faculty_page_url), 'html.parser')
+            email_html = soup.select_one("a[href^='mailto:']")
+            phone_html = soup.select_one("a[href^='tel:']")
+            email_link = email_html.text.strip() if email_html else ""
+            phone_num = phone_html.text.strip() if phone_html else ""
+
+        return {
+            'Email': email_link,
+            'Phone': phone_num,
+            # filled in for the whole batch by scrape()
+            'Office': "",
+            'RPI_Page': faculty_page_url,
+            'Linkedin': self.search_query(f"{name} rpi Linkedin profile page")
+        }
+
+    def scrape_one(self, name):
+        try:
+            return {name: self.get_contact_info(name)}
+        except Exception as e:
+            print(f"  > {name}: {e}")
+            return {name: {'Error': str(e)}}
+
+    def scrape(self, names):
+        # -> [{name: info}] in the order of names
+        with instrument.timer("scrape_contacts"), ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = list(pool.map(self.scrape_one, names))
+        instrument.count("professors", len(names))
+
+        if self.directory:
+            infos = [info for result in results for info in result.values() if info.get('Email')]
+            with instrument.timer("office_lookup"):
+                offices = self.directory.lookup_many([info['Email'] for info in infos])
+            for info in infos:
+                info['Office'] = offices.get(info['Email'], "")
+        return results
+
+
+# --- Local stub ---
+# Stands in for the Custom Search API and the faculty pages so the scraper
+# can be exercised offline:  python contact_scraper.py  runs it twice against
+# the stub (the second run has to come entirely from the cache).
+
+class StubHandler(BaseHTTPRequestHandler):
+    # every path fails once with a 503 before answering, to exercise retries
+    seen = set()
+    hits = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body, content_type):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        with StubHandler.lock:
+            StubHandler.hits += 1
+            first = self.path not in StubHandler.seen
+            StubHandler.seen.add(self.path)
+        if first:
+            self.send_body(503, "try again", "text/plain")
+            return
+
+        if url.path == "/customsearch/v1":
+            query = parse_qs(url.query)["q"][0]
+            slug = "-".join(query.split(" rpi ")[0].lower().split())
+            if slug.startswith("nobody"):
+                items = []
+            elif "linkedin" in query.lower():
+                items = [{"link": f"https://www.linkedin.com/in/{slug}"}]
+            else:
+                items = [{"link": f"http://{self.headers['Host']}/faculty/{slug}"}]
+            self.send_body(200, json.dumps({"items": items}), "application/json")
+        elif url.path.startswith("/faculty/"):
+            slug = url.path.rsplit("/", 1)[-1]
+            page = (f"<html><body><h1>{slug}</h1><a href='mailto:{slug}@rpi.edu'>{slug}@rpi.edu</a>"
+                    f"<a href='tel:5182760000'>(518) 276-0000</a></body></html>")
+            self.send_body(200, page, "text/html")
+        else:
+            self.send_body(404, "not found", "text/plain")
+
+
+def write_stub_directory(names, ldif_file):
+    # LDAP stand-in with an office for every other stub professor
+    with open(ldif_file, "w", encoding="utf-8") as f:
+        for i, name in enumerate(names):
+            slug = "-".join(name.lower().split())
+            f.write(f"dn: cn={name},ou=faculty,dc=rpi,dc=edu\nmail: {slug}@rpi.edu\n")
+            if i % 2 == 0:
+                f.write(f"physicalDeliveryOfficeName: Amos Eaton {100 + i}\n")
+            f.write("\n")
+
+
+def run_stub_check(names, cache_dir):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    search_url = f"http://127.0.0.1:{server.server_address[1]}/customsearch/v1"
+    ldif_file = os.path.join(cache_dir, "directory.ldif")
+    snapshot_file = os.path.join(cache_dir, "office_directory.csv")
+    write_stub_directory(names, ldif_file)
+    try:
+        directory = CachedDirectory(LdifDirectory(ldif_file), snapshot_file)
+        first = ContactScraper("stub-key", "stub-cx", search_url, cache_dir, backoff=0.01, rate=50,
+                               directory=directory)
+        results = first.scrape(names)
+        hits = StubHandler.hits
+
+        # second run: pages from the response cache, offices from the
+        # snapshot; only the emails without an office go to the directory
+        backend = LdifDirectory(ldif_file)
+        asked = []
+        lookup_many = backend.lookup_many
+        backend.lookup_many = lambda emails: asked.extend(emails) or lookup_many(emails)
+        second = ContactScraper("stub-key", "stub-cx", search_url, cache_dir, backoff=0.01, rate=50,
+                                directory=CachedDirectory(backend, snapshot_file))
+        assert second.scrape(names) == results, "cached run differs"
+        assert StubHandler.hits == hits and second.stats["requests"] == 0, "cached run hit the server"
+        with_office = {r[n]["Email"] for r in results for n in r if r[n]["Office"]}
+        assert asked and not with_office & set(asked), "snapshot offices were looked up again"
+    finally:
+        server.shutdown()
+
+    offices = 0
+    for i, result in enumerate(results):
+        for name, info in result.items():
+            found = not name.startswith("Nobody")
+            assert not found or info['Email'].endswith("@rpi.edu"), (name, info)
+            assert bool(info['Office']) == (found and i % 2 == 0), (name, info)
+            offices += bool(info['Office'])
+    print(f"Stub run OK: {len(names)} names, {first.stats['requests']} requests "
+          f"({first.stats['retries']} retried), {offices} offices, second run {second.stats['cached']} cache hits")
+
+
+if __name__ == "__main__":
+    names = ["Sibel Adali", "Pat O'Brien", "Nobody Here"] + [f"Test Person{i}" for i in range(20)]
+    with tempfile.TemporaryDirectory() as cache_dir:
+        run_stub_check(names, cache_dir)
@@ -0,0 +1,196 @@
+import csv
+import glob
+import json
+import os
+import re
+import sys
+
+# Course code resolver shared by the QuACS, catalog and RMP pipelines.
+#   canonical_code("csci1200") / ("CSCI 1200") / (" CSCI-1200 ") -> "CSCI-1200"
+#   resolve(code) also folds cross-listings and renumbered courses onto one
+#   canonical id, using a variant -> canonical table precomputed once from
+#   catalog.json and the class_data term history (build_resolver below).
+# Everything that joins RMP data to QuACS data should go through resolve()
+# instead of fixing up codes by hand.
+
+CATALOG_FILE = "../class/catalog.json"
+CLASS_DATA_DIR = "../class_data"
+ALIAS_FILE = "../temps/class_aliases.csv"
+RESOLVER_FILE = "../class/course_aliases.json"
+
+CODE = re.compile(r"^([A-Z]{4})[\s\-_]*(\d{4})$")
+
+# cross-listed pairs have to show up together in at least this many terms
+MIN_SHARED_TERMS = 2
+# codes that carried more titles than this are topics/placeholder numbers
+# and are never merged with anything; neither are x96x special topics codes,
+# which get a new title every time they're reused even if the catalog
+# history only shows one or two so far
+MAX_TITLES = 2
+TOPICS_CODE = re.compile(r"^[A-Z]{4}-\d96\d$")
+
+
+def canonical_code(code):
+    # format only: upper case, no spaces, SUBJ-NNNN when it looks like a code
+    code = code.strip().upper()
+    m = CODE.match(code)
+    if m:
+        return f"{m.group(1)}-{m.group(2)}"
+    return code.replace(" ", "")
+
+
+def load_history(class_data_dir=CLASS_DATA_DIR):
+    # code -> {term: (title, instructors)}
+    history = {}
+    for filepath in sorted(glob.glob(os.path.join(class_data_dir, "compact_classes*.json"))):
+        term = os.path.basename(filepath).replace("compact_classes", "").replace(".json", "")
+        with open(filepath, "r") as f:
+            for course in json.load(f):
+                history.setdefault(course["id"], {})[term] = (
+                    course["title"].strip().lower(), tuple(course.get("instructors", []))
+                )
+    return history
+
+
+def find(parent, code):
+    while parent.setdefault(code, code) != code:
+        parent[code] = parent[parent[code]]
+        code = parent[code]
+    return code
+
+
+def union(parent, a, b):
+    parent[find(parent, a)] = find(parent, b)
+
+
+def stable_codes(history):
+    return {
+        code for code, terms in history.items()
+        if len({title for title, _ in terms.values()}) <= MAX_TITLES and not TOPICS_CODE.match(code)
+    }
+
+
+def cross_listings(history):
+    # same term, same title, same (named) instructors, different subject
+    stable = stable_codes(history)
+    sections = {}
+    for code, terms in history.items():
+        if code not in stable:
+            continue
+        for term, (title, instructors) in terms.items():
+            if instructors and instructors != ("TBA",):
+                sections.setdefault((term, title, instructors), []).append(code)
+
+    shared = {}
+    for codes in sections.values():
+        if len({c[:4] for c in codes}) < 2:
+            continue
+        codes = sorted(codes)
+        for i, a in enumerate(codes):
+            for b in codes[i + 1:]:
+                if a[:4] != b[:4]:
+                    shared[(a, b)] = shared.get((a, b), 0) + 1
+    return [pair for pair, count in shared.items() if count >= MIN_SHARED_TERMS]
+
+
+def renumberings(history):
+    # same subject and title, never offered in the same term, one code stops
+    # before the other starts; titles used by more than two codes in a
+    # subject ("Independent Study", "Topics In ...") are left alone
+    stable = stable_codes(history)
+    by_title = {}
+    for code, terms in history.items():
+        if code not in stable:
+            continue
+        titles = {title for title, _ in terms.values()}
+        for title in titles:
+            by_title.setdefault((code[:4], title), []).append(code)
+
+    pairs = []
+    for codes in by_title.values():
+        if len(codes) != 2:
+            continue
+        old, new = sorted(codes, key=lambda c: min(history[c]))
+        if max(history[old]) < min(history[new]):
+            pairs.append((old, new))
+    return pairs
+
+
+def load_shared_aliases(alias_file=ALIAS_FILE):
+    # the alias table rmp_csv_convert keeps; only entries shared by everyone
+    if not os.path.exists(alias_file):
+        return []
+    with open(alias_file, "r", encoding="utf-8", newline="") as f:
+        return [(row["alias"], row["class_code"]) for row in csv.DictReader(f) if not row["prof_name"]]
+
+
+def build_resolver(catalog_file=CATALOG_FILE, class_data_dir=CLASS_DATA_DIR, alias_file=ALIAS_FILE):
+    with open(catalog_file, "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+    history = load_history(class_data_dir)
+
+    parent = {}
+    for code in set(catalog) | set(history):
+        find(parent, code)
+    for a, b in cross_listings(history) + renumberings(history):
+        union(parent, a, b)
+
+    groups = {}
+    for code in parent:
+        groups.setdefault(find(parent, code), []).append(code)
+
+    # canonical id of a group: in the catalog, then most recently offered,
+    # then most offered, then alphabetical
+    def rank(code):
+        terms = history.get(code, {})
+        return (code in catalog, max(terms, default=""), len(terms), [-ord(c) for c in code])
+
+    resolver = {}
+    for codes in groups.values():
+        canonical = max(codes, key=rank)
+        for code in codes:
+            if code != canonical:
+                resolver[code] = canonical
+
+    for alias, code in load_shared_aliases(alias_file):
+        alias, code = canonical_code(alias), canonical_code(code)
+        resolver[alias] = resolver.get(code, code)
+
+    return resolver
+
+
+def save_resolver(resolver, resolver_file=RESOLVER_FILE):
+    with open(resolver_file, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(resolver.items())), f, indent=2)
+
+
+resolver_table = None
+
+
+def load_resolver(resolver_file=RESOLVER_FILE):
+    # the precomputed table is loaded once per process; missing means only
+    # formatting is applied
+    global resolver_table
+    if resolver_table is None:
+        resolver_table = {}
+        if os.path.exists(resolver_file):
+            with open(resolver_file, "r", encoding="utf-8") as f:
+                resolver_table = json.load(f)
+    return resolver_table
+
+
+def resolve(code):
+    code = canonical_code(code)
+    return load_resolver().get(code, code)
+
+
+if __name__ == "__main__":
+    # python course_codes.py          -> rebuild course_aliases.json
+    # python course_codes.py <codes>  -> show what each code resolves to
+    if len(sys.argv) > 1:
+        for code in sys.argv[1:]:
+            print(f"{code} -> {resolve(code)}")
+    else:
+        resolver = build_resolver()
+        save_resolver(resolver)
+        print(f"Saved {len(resolver)} course code aliases to {RESOLVER_FILE}")
@@ -0,0 +1,211 @@
+import base64
+import csv
+import json
+import os
+import sys
+from abc import ABC, abstractmethod
+
+# Office location lookup by email, for contact_scraper.py.
+# Every backend answers lookup_many(emails) -> {email: office} in one call,
+# so the scraper resolves a whole run at once instead of one COM round trip
+# per professor:
+#   SnapshotDirectory  email -> office from a CSV or JSON snapshot file
+#   LdifDirectory      LDAP-style stand-in: directory entries exported as
+#                      LDIF (mail / physicalDeliveryOfficeName attributes)
+#   OutlookDirectory   Exchange through Outlook (Windows, pywin32); the
+#                      Outlook application and MAPI namespace are created
+#                      once per run
+#   CachedDirectory    wraps any of them with a snapshot so only emails it
+#                      hasn't seen go to the slow backend
+# Emails are matched case-insensitively; unknown emails are left out of the
+# result.
+#
+# Paths are relative to data/, like the rest of faculty_info.py.
+
+SNAPSHOT_FILE = "professor_data/office_directory.json"
+LDIF_FILE = "professor_data/directory.ldif"
+
+MAIL_ATTRIBUTE = "mail"
+OFFICE_ATTRIBUTE = "physicalDeliveryOfficeName"
+
+
+def normalize_email(email):
+    return email.strip().lower()
+
+
+class DirectoryBackend(ABC):
+
+    @abstractmethod
+    def lookup_many(self, emails):
+        ...
+
+    def lookup(self, email):
+        return self.lookup_many([email]).get(email, "")
+
+    def close(self):
+        pass
+
+
+class SnapshotDirectory(DirectoryBackend):
+    # .json: {"email": "office"}; .csv: email,office columns
+
+    def __init__(self, snapshot_file=SNAPSHOT_FILE):
+        self.snapshot_file = snapshot_file
+        self.offices = load_snapshot(snapshot_file)
+
+    def lookup_many(self, emails):
+        return {email: self.offices[normalize_email(email)]
+                for email in emails if normalize_email(email) in self.offices}
+
+
+class LdifDirectory(DirectoryBackend):
+
+    def __init__(self, ldif_file=LDIF_FILE):
+        self.offices = {}
+        for entry in parse_ldif(ldif_file):
+            for mail in entry.get(MAIL_ATTRIBUTE.lower(), []):
+                offices = entry.get(OFFICE_ATTRIBUTE.lower())
+                if offices:
+                    self.offices[normalize_email(mail)] = offices[0]
+
+    def lookup_many(self, emails):
+        return {email: self.offices[normalize_email(email)]
+                for email in emails if normalize_email(email) in self.offices}
+
+
+class OutlookDirectory(DirectoryBackend):
+
+    def __init__(self):
+        import win32com.client
+        self.outlook = win32com.client.Dispatch("Outlook.Application")
+        self.mapi = self.outlook.GetNamespace("MAPI")
+
+    def lookup_many(self, emails):
+        offices = {}
+        for email in emails:
+            # Resolve the recipient and read OfficeLocation off Exchange users
+            recipient = self.mapi.CreateRecipient(email)
+            recipient.Resolve()
+            if not recipient.Resolved:
+                continue
+            addr_entry = recipient.AddressEntry
+            if addr_entry.Type == "EX":
+                exchange_user = addr_entry.GetExchangeUser()
+                if exchange_user.OfficeLocation:
+                    offices[email] = exchange_user.OfficeLocation
+        return offices
+
+    def close(self):
+        self.mapi = None
+        self.outlook = None
+
+
+class CachedDirectory(DirectoryBackend):
+    # offices that were found are kept in the snapshot, so a rerun never asks
+    # the backend about them again; emails it didn't know are only remembered
+    # for this run, so someone added to the directory later is picked up
+
+    def __init__(self, backend, snapshot_file=SNAPSHOT_FILE):
+        self.backend = backend
+        self.snapshot_file = snapshot_file
+        self.offices = load_snapshot(snapshot_file) if os.path.exists(snapshot_file) else {}
+        self.misses = set()
+
+    def lookup_many(self, emails):
+        missing = list(dict.fromkeys(e for e in emails if normalize_email(e) not in self.offices
+                                     and normalize_email(e) not in self.misses))
+        if missing:
+            found = {normalize_email(e): office for e, office in self.backend.lookup_many(missing).items()
+                     if office}
+            self.misses.update(normalize_email(e) for e in missing if normalize_email(e) not in found)
+            if found:
+                self.offices.update(found)
+                save_snapshot(self.offices, self.snapshot_file)
+        return {email: self.offices[normalize_email(email)]
+                for email in emails if normalize_email(email) in self.offices}
+
+    def close(self):
+        self.backend.close()
+
+
+def load_snapshot(snapshot_file):
+    # blank offices (misses saved by older versions) are dropped so they get
+    # asked about again
+    if snapshot_file.endswith(".csv"):
+        with open(snapshot_file, "r", encoding="utf-8", newline="") as f:
+            return {normalize_email(row["email"]): row["office"] for row in csv.DictReader(f) if row["office"]}
+    with open(snapshot_file, "r", encoding="utf-8") as f:
+        return {normalize_email(email): office for email, office in json.load(f).items() if office}
+
+
+def save_snapshot(offices, snapshot_file):
+    temp_file = snapshot_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8", newline="") as f:
+        if snapshot_file.endswith(".csv"):
+            writer = csv.writer(f)
+            writer.writerow(["email", "office"])
+            writer.writerows(sorted(offices.items()))
+        else:
+            json.dump(dict(sorted(offices.items())), f, indent=2)
+    os.replace(temp_file, snapshot_file)
+
+
+def parse_ldif(ldif_file):
+    # -> [{attribute (lower case): [values]}]; handles continuation lines and
+    # comments, which is all a directory export needs here
+    entries = []
+    entry = {}
+    last = None
+    with open(ldif_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\r\n")
+            if not line:
+                if entry:
+                    entries.append(entry)
+                entry, last = {}, None
+            elif line.startswith("#"):
+                continue
+            elif line.startswith(" ") and last:
+                entry[last][-1] += line[1:]
+            elif ":" in line:
+                attribute, _, value = line.partition(":")
+                # "attr:: ..." is base64 (non-ascii office names)
+                if value.startswith(":"):
+                    value = base64.b64decode(value[1:].strip()).decode("utf-8")
+                last = attribute.strip().lower()
+                entry.setdefault(last, []).append(value.strip())
+    if entry:
+        entries.append(entry)
+    return entries
+
+
+def open_directory(kind=None, snapshot_file=SNAPSHOT_FILE, ldif_file=LDIF_FILE):
+    # kind: "outlook", "ldif" or "snapshot"; the default is Outlook where
+    # pywin32 is installed, otherwise whatever snapshot we already have.
+    # Outlook lookups are cached in the snapshot file.
+    if kind is None:
+        try:
+            import win32com.client  # noqa: F401
+            kind = "outlook"
+        except ImportError:
+            kind = "snapshot"
+
+    if kind == "outlook":
+        return CachedDirectory(OutlookDirectory(), snapshot_file)
+    if kind == "ldif":
+        return LdifDirectory(ldif_file)
+    if kind == "snapshot":
+        if not os.path.exists(snapshot_file):
+            print(f"No directory snapshot at {snapshot_file}, offices will be left blank")
+            return None
+        return SnapshotDirectory(snapshot_file)
+    raise ValueError(f"Unknown directory backend: {kind}")
+
+
+if __name__ == "__main__":
+    # python directory_lookup.py <backend> <emails ...>
+    directory = open_directory(sys.argv[1] if len(sys.argv) > 1 else None)
+    if directory:
+        for email, office in directory.lookup_many(sys.argv[2:]).items():
+            print(f"{email}: {office}")
+        directory.close()
@@ -1,28 +1,31 @@
 import os
+import re
+import csv
+import json
+import hashlib
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from PIL import Image
 import io
 import sys
 
-def download_professor_image(page_url, output_dir='.'):
-    # Download HTML
-    resp = requests.get(page_url)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.text, 'html.parser')
-
-    # Extract slug from URL (ex: "mohammed-zaki")
-    prof_dashed = os.path.basename(urlparse(page_url).path)
+import instrument
+from name_match import CROSSWALK_FILE, fold
 
+FACULTY_URL = "https://faculty.rpi.edu/"
+IMAGES_DIR = "../imgs"
+JPEG_QUALITY = 95
 
-    # save url to be used in the sql insert
-    with open("../temps/sql_insert.sql", "w", encoding="utf-8") as f:
-        f.write(page_url)
 
+def find_image_url(page_url, html):
     # -----------------------------
     # Locate correct profile image
     # -----------------------------
+    soup = BeautifulSoup(html, 'html.parser')
     photo_div = soup.find("div", class_="faculty-photo")
     if not photo_div:
         raise RuntimeError("Could not find faculty-photo container")
@@ -31,31 +34,204 @@ def download_professor_image(page_url, output_dir='.'):
     if not img_tag or not img_tag.get("src"):
         raise RuntimeError("Could not find image in faculty-photo container")
 
-    img_url = urljoin(page_url, img_tag["src"])
+    return urljoin(page_url, img_tag["src"])
 
-    # Download the image file
-    img_resp = requests.get(img_url)
-    img_resp.raise_for_status()
 
+def save_image(content, output_path, img_url=""):
     # Try reading with Pillow
     try:
-        img = Image.open(io.BytesIO(img_resp.content))
+        img = Image.open(io.BytesIO(content))
     except Exception as e:
         print("ERROR: Could not decode image!")
         print("URL:", img_url)
         raise
 
-    # Convert to RGB JPG format
+    # Convert to RGB JPG format, swapped in so readers never see half a file
     img = img.convert("RGB")
+    img.save(output_path + ".tmp", "JPEG", quality=JPEG_QUALITY)
+    os.replace(output_path + ".tmp", output_path)
+
+
+def download_professor_image(page_url, output_dir='.'):
+    # Download HTML
+    resp = requests.get(page_url)
+    resp.raise_for_status()
+
+    # Extract slug from URL (ex: "mohammed-zaki")
+    prof_dashed = os.path.basename(urlparse(page_url).path)
+
+    img_url = find_image_url(page_url, resp.text)
+
+    # Download the image file
+    img_resp = requests.get(img_url)
+    img_resp.raise_for_status()
 
     # Save as .jpg
     output_path = os.path.join(output_dir, f"{prof_dashed}.jpg")
-    img.save(output_path, "JPEG", quality=95)
+    save_image(img_resp.content, output_path, img_url)
 
     print(f"Saved: {output_path}")
 
 
+# --- Batch mode ---
+# Refreshes every headshot for the professor crosswalk (name_match.py) in a
+# thread pool over one pooled session. The manifest keeps, per slug, the
+# ETag / Last-Modified of the faculty page and of the image plus the sha256
+# of the last image we saved, so unchanged pages and photos come back as
+# 304s (or the same hash) and are never decoded or re-encoded again; only
+# changed photos are written.
+MANIFEST_FILE = "../professor_data/image_manifest.json"
+WORKERS = 8
+TIMEOUT = 30
+
+
+def slug_for(name):
+    # "Cairns-Weaver, Dawn" / "Dawn Cairns-Weaver" -> "dawn-cairns-weaver"
+    name = fold(name)
+    if "," in name:
+        last, _, first = name.partition(",")
+        name = f"{first} {last}"
+    return "-".join(re.findall(r"[a-z0-9]+", name))
+
+
+def crosswalk_slugs(crosswalk_file=CROSSWALK_FILE):
+    # current faculty only: rows with a catalog entry or an existing headshot
+    with open(crosswalk_file, "r", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    slugs = []
+    for row in rows:
+        if row["image_slug"]:
+            slugs.append(row["image_slug"])
+        elif row["catalog_name"]:
+            slugs.append(slug_for(row["catalog_name"]))
+    return list(dict.fromkeys(slugs))
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    if not os.path.exists(manifest_file):
+        return {}
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, manifest_file=MANIFEST_FILE):
+    temp_file = manifest_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+    os.replace(temp_file, manifest_file)
+
+
+def get_session(pool_size=WORKERS):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=2)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def conditional_get(session, url, entry, prefix):
+    # GET with the validators we stored under <prefix>etag / <prefix>modified
+    # -> (response, new validators); the caller stores them only once the
+    # body has been used, so a failure is retried with a full GET next run
+    headers = {}
+    if entry.get(prefix + "etag"):
+        headers["If-None-Match"] = entry[prefix + "etag"]
+    if entry.get(prefix + "modified"):
+        headers["If-Modified-Since"] = entry[prefix + "modified"]
+    resp = session.get(url, headers=headers, timeout=TIMEOUT)
+    instrument.count("requests")
+    instrument.count("bytes_fetched", len(resp.content))
+    validators = {}
+    if resp.status_code != 304:
+        resp.raise_for_status()
+        validators = {prefix + "etag": resp.headers.get("ETag", ""),
+                      prefix + "modified": resp.headers.get("Last-Modified", "")}
+    return resp, validators
+
+
+def refresh_image(session, slug, entry, output_dir=IMAGES_DIR, base_url=FACULTY_URL):
+    # -> (status, entry); status is "saved", "unchanged" or "error: ..." (the
+    # entry passed in comes back as it was)
+    original = entry
+    entry = dict(entry)
+    output_path = os.path.join(output_dir, f"{slug}.jpg")
+    have_file = os.path.exists(output_path)
+    if not have_file or not entry.get("img_url"):
+        # nothing on disk (or no image url) to fall back on, so don't let a
+        # 304 stand in for it
+        entry = {}
+
+    try:
+        page_url = base_url + slug
+        page, page_validators = conditional_get(session, page_url, entry, "page_")
+        if page.status_code != 304 or not entry.get("img_url"):
+            img_url = find_image_url(page_url, page.text)
+            if img_url != entry.get("img_url"):
+                entry = {k: v for k, v in entry.items() if k.startswith("page_")}
+                entry["img_url"] = img_url
+        entry.update(page_validators)
+
+        image, image_validators = conditional_get(session, entry["img_url"], entry, "img_")
+        if image.status_code == 304:
+            return "unchanged", entry
+
+        digest = hashlib.sha256(image.content).hexdigest()
+        entry.update(image_validators)
+        if digest == entry.get("sha256") and have_file:
+            return "unchanged", entry
+        save_image(image.content, output_path, entry["img_url"])
+        entry["sha256"] = digest
+        return "saved", entry
+    except Exception as e:
+        return f"error: {e}", original
+
+
+def refresh_images(slugs, output_dir=IMAGES_DIR, manifest_file=MANIFEST_FILE,
+                   workers=WORKERS, base_url=FACULTY_URL):
+    manifest = load_manifest(manifest_file)
+    session = get_session(workers)
+    lock = threading.Lock()
+    counts = {}
+
+    def job(slug):
+        status, entry = refresh_image(session, slug, manifest.get(slug, {}), output_dir, base_url)
+        with lock:
+            key = status.split(":")[0]
+            if key != "error":
+                manifest[slug] = entry
+            counts[key] = counts.get(key, 0) + 1
+        if key == "error":
+            print(f"  {slug}: {status[7:]}")
+        return slug, entry
+
+    with instrument.timer("refresh_images"), ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(job, slugs))
+    save_manifest(manifest, manifest_file)
+    for key, n in counts.items():
+        instrument.count(f"images_{key}", n)
+
+    # the same photo under two slugs is usually the site's placeholder
+    by_hash = {}
+    for slug in slugs:
+        if manifest.get(slug, {}).get("sha256"):
+            by_hash.setdefault(manifest[slug]["sha256"], []).append(slug)
+    for same in by_hash.values():
+        if len(same) > 1:
+            instrument.log(f"  same photo: {', '.join(same)}")
+
+    print(f"Headshots: {counts.get('saved', 0)} saved, {counts.get('unchanged', 0)} unchanged, "
+          f"{counts.get('error', 0)} failed of {len(slugs)}")
+    return counts
+
+
 if __name__ == "__main__":
+    # python fac_scrap.py              -> next name in temps/full_names.txt
+    # python fac_scrap.py <page url>   -> that professor
+    # python fac_scrap.py batch [workers] -> every professor in the crosswalk
+
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        refresh_images(crosswalk_slugs(), workers=int(sys.argv[2]) if len(sys.argv) > 2 else WORKERS)
+        sys.exit(0)
 
     fac_url = "new"
     if len(sys.argv) > 1:
@@ -66,7 +242,10 @@ if __name__ == "__main__":
         with open("../temps/full_names.txt", "r", encoding="utf-8") as f:
             name = f.readline().strip()
             urled_name = name.lower().replace(" ", "-")
-            fac_url = "https://faculty.rpi.edu/" + urled_name
+            fac_url = FACULTY_URL + urled_name
 
+    # save url to be used in the sql insert
+    with open("../temps/sql_insert.sql", "w", encoding="utf-8") as f:
+        f.write(fac_url)
 
-    download_professor_image(fac_url, output_dir="../imgs")
+    download_professor_image(fac_url, output_dir=IMAGES_DIR)
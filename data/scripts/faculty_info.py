@@ -1,11 +1,14 @@
 from bs4 import BeautifulSoup
+from html.parser import HTMLParser
 import json
-import pandas as pd
-from googleapiclient.discovery import build
 import os
+import sys
 from dotenv import load_dotenv
-import requests
-import win32com.client
+
+import instrument
+from contact_scraper import ContactScraper
+from directory_lookup import open_directory
+from keyword_matcher import KeywordMatcher
 
 # API KEYS AND ENGINE ID
 # Load the variables from .env into the environment
@@ -58,194 +61,166 @@ DEPT_MAP = {
     "Information Technology and Web Systems": "Information Technology and Web Science", # Variation
 }
 
+# every DEPT_MAP key compiled into one automaton, so each entry is classified
+# in a single pass over its text
+DEPT_KEYS = list(DEPT_MAP)
+DEPT_MATCHER = KeywordMatcher([dept.lower() for dept in DEPT_KEYS])
+
+CATALOG_FILE = 'professor_data/catalog.html'
+# characters decoded and fed to the streaming parser at a time
+CHUNK_SIZE = 64 * 1024
+
+
+def classify_department(info_string):
+    # longest DEPT_MAP key mentioned in the text (case-insensitive), or 'unknown'
+    index = DEPT_MATCHER.longest(info_string.lower())
+    if index is None:
+        return 'unknown'
+    return DEPT_MAP[DEPT_KEYS[index]]
+
+
+def faculty_entries(html_content):
+    # -> (name, info_string) for each <p> that starts with a <strong> name
+    soup = BeautifulSoup(html_content, 'html.parser')
+    for container in soup.find_all('p'):
+        # name_tag is the strong tag within the p tag
+        name_tag = container.find('strong')
+        if not name_tag:
+            continue
+
+        # gets name text
+        name = name_tag.get_text().replace("\u2019", "'").strip().strip(" *+•►♦")
+
+        # Get the *entire* text of the <p> tag
+        full_p_text = container.get_text().replace("\u2019", "'")
+
+        # Get the text of just the <strong> tag (the raw name)
+        raw_name_text = name_tag.get_text().replace("\u2019", "'")
+
+        # Subtract the raw name from the full text to get the rest of the info.
+        # We also strip common leading punctuation.
+        info_string = full_p_text.replace(raw_name_text, "").strip().strip(" ,;•►♦")
+        if info_string:
+            yield name, info_string
+
+class FacultyEntryParser(HTMLParser):
+    # Event-driven version of faculty_entries: feed() it text as it is
+    # decoded and it collects (name, info_string) for every finished <p>,
+    # keeping only the currently open paragraphs in memory.
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        # one frame per open <p>: [text parts, strong parts, strong state]
+        # strong state is 0 before the first <strong>, its depth while inside
+        # it, and -1 once it has closed
+        self.open_paragraphs = []
+        self.entries = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'p':
+            self.open_paragraphs.append([[], [], 0])
+        elif tag == 'strong':
+            for frame in self.open_paragraphs:
+                if frame[2] >= 0:
+                    frame[2] += 1
+
+    def handle_endtag(self, tag):
+        if tag == 'p':
+            if self.open_paragraphs:
+                self.finish(self.open_paragraphs.pop())
+        elif tag == 'strong':
+            for frame in self.open_paragraphs:
+                if frame[2] > 0:
+                    frame[2] = frame[2] - 1 or -1
+
+    def handle_data(self, data):
+        for frame in self.open_paragraphs:
+            frame[0].append(data)
+            if frame[2] > 0:
+                frame[1].append(data)
+
+    def finish(self, frame):
+        text_parts, strong_parts, strong_state = frame
+        if strong_state == 0:
+            return
+        # same cleanup as faculty_entries
+        raw_name_text = "".join(strong_parts).replace("\u2019", "'")
+        name = raw_name_text.strip().strip(" *+•►♦")
+        full_p_text = "".join(text_parts).replace("\u2019", "'")
+        info_string = full_p_text.replace(raw_name_text, "").strip().strip(" ,;•►♦")
+        if info_string:
+            self.entries.append((name, info_string))
+
+    def close(self):
+        super().close()
+        while self.open_paragraphs:
+            self.finish(self.open_paragraphs.pop())
+
+
+def stream_faculty_entries(f, chunk_size=CHUNK_SIZE):
+    # f is the catalog opened in text mode (utf-16 decoding happens as it is
+    # read); entries are yielded as each paragraph closes
+    parser = FacultyEntryParser()
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        yield from parser.entries
+        parser.entries.clear()
+    parser.close()
+    yield from parser.entries
+
+
+def iter_departments(catalog_file=CATALOG_FILE, chunk_size=CHUNK_SIZE):
+    # -> {'Name', 'Department'} records, streamed from the catalog file
+    with open(catalog_file, 'r', encoding='utf-16') as f:
+        for name, info_string in stream_faculty_entries(f, chunk_size):
+            yield {'Name': name, 'Department': classify_department(info_string)}
+
+
 # --- 1. Load your HTML file ---
 # Assumes your HTML file is named 'catalog.html'
-def get_departments():
+def get_departments(catalog_file=CATALOG_FILE, streaming=True):
+    # streaming=False builds the whole BeautifulSoup tree like before
     try:
-        with open('professor_data/catalog.html', 'r', encoding='utf-16') as f:
-            html_content = f.read()
-            #print(html_content)
+        if streaming:
+            all_professors = list(iter_departments(catalog_file))
+        else:
+            with open(catalog_file, 'r', encoding='utf-16') as f:
+                html_content = f.read()
+            # --- 2. Parse the HTML and classify each entry ---
+            all_professors = [
+                {'Name': name, 'Department': classify_department(info_string)}
+                for name, info_string in faculty_entries(html_content)
+            ]
     except FileNotFoundError:
         print("Error: catalog.html not found.")
         print("Please save your HTML file as 'catalog.html' in the same directory.")
         exit()
 
-    # --- 2. Parse the HTML ---
-    # Create the BeautifulSoup "soup" object
-    soup = BeautifulSoup(html_content, 'html.parser')
-
-    # This list will hold all our data
-    all_professors = []
-
-    # Find all the main "container" divs for each professor
-    prof_containers = soup.find_all('p')
-    #print(prof_containers)
-
-    if not prof_containers:
+    if not all_professors:
         print("No professors found. Did you use the correct class for the container?")
         print("Please check your HTML file and update 'class_' in the script.")
-    else:
-        # --- 3. Loop and Extract Data ---
-        for container in prof_containers:
-            # name_tag is the strong tag within the p tag
-            name_tag = container.find('strong')
-
-            if name_tag:
-                # gets name text
-                name = name_tag.get_text().replace("\u2019", "'").strip().strip(" *+•►♦")
-        
-                # gets text immediately after strong tag
-                # Get the *entire* text of the <p> tag
-                full_p_text = container.get_text().replace("\u2019", "'")
-                
-                # Get the text of just the <strong> tag (the raw name)
-                raw_name_text = name_tag.get_text().replace("\u2019", "'")
-
-                # Subtract the raw name from the full text to get the rest of the info.
-                # We also strip common leading punctuation.
-                info_string = full_p_text.replace(raw_name_text, "").strip().strip(" ,;•►♦")
-
-                if info_string:
-
-                    # Loop through every official department
-                    found_dept = 'unknown'
-                    max_len = 0
-                    for dept in DEPT_MAP.keys():
-                    # Check if that department name is in the string
-                        if dept.lower() in info_string.lower():
-                            #print(dept)
-                            # If it is, check if it's the longest one we've found so far
-                            if len(dept) > max_len:
-                                max_len = len(dept)
-                                found_dept = DEPT_MAP[dept]
-                    
-                    # load items into dictionary item
-                    prof_data = {
-                        'Name': name,
-                        'Department': found_dept
-                    }
-                    # put all prof_data dictionary items into list
-                    all_professors.append(prof_data)
-
-        return all_professors
-
-def search_query(service, name, query):
-    try:
-        response = service.cse().list(
-            q=query,
-            cx=PSE_ID,
-            num=1
-        ).execute()
-
-        # Check if the 'items' key exists and has at least one result
-        if 'items' in response and len(response['items']) > 0:
-            link = response['items'][0]['link']
-            print(f"  > Found: {link}")
-            return link
-        else:
-            print(f"  > No result found for {name}")
-            return None
-    
-    except Exception as e:
-        print('ERROR ERROR')
-        print(e)
-        return e
-
-def get_contact_info(service, name, contact_container):
-    # get page
-    faculty_page_query = f"{name} rpi faculty"
-    print(faculty_page_query)
-    faculty_page_url = search_query(service, name, faculty_page_query)
-
-    # replicate browser to parse html
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'
-    }
-    response = requests.get(faculty_page_url, headers=headers)
-    # This will raise an error if the request failed (e.g., 404, 500)
-    response.raise_for_status() 
-    # 'response.text' contains the full HTML content as a string
-    html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
-    
-    # parse email
-    email_html = soup.select_one("a[href^='mailto:']")
-    email_link = email_html.text
-    print(email_link)
-
-    # parse phone number
-    phone_html = soup.select_one("a[href^='tel:']")
-    phone_num = phone_html.text
-    print(phone_num)
-
-    # parse office location
-    outlook = win32com.client.Dispatch("Outlook.Application")
-    mapi = outlook.GetNamespace("MAPI")
-    # 1. Create a Recipient object
-    recipient = mapi.CreateRecipient(email_link)
-    # 2. Resolve it (this is the key step)
-    recipient.Resolve()
-    if recipient.Resolved:
-        # 3. Get the AddressEntry
-        addr_entry = recipient.AddressEntry
-        
-        # 4. Check if it's an Exchange user
-        if addr_entry.Type == "EX": 
-            
-            # 5. Get the ExchangeUser object
-            exchange_user = addr_entry.GetExchangeUser()
-            work_location = ""
-            if exchange_user.OfficeLocation:
-                work_location = exchange_user.OfficeLocation
-            print(f"Work Location (Office): {work_location}")
-
-    # parse linkedin
-    linkedin_query = f"{name} rpi Linkedin profile page"
-    linkedin_url = search_query(service, name, linkedin_query)
-    print(linkedin_url)
-
-    info_data = {
-        'Email': email_link,
-        'Phone': phone_num,
-        'Office': work_location,
-        'RPI_Page': faculty_page_url,
-        'Linkedin': linkedin_url
-    }
-    prof = {
-        name: info_data
-    }
-    contact_container.append(prof)
-    return
+    return all_professors
 
 # --- MAIN ---
-prof_dept_list = get_departments()
-with open('professor_data/departments.json', 'w', encoding='utf-8') as f:
-    json.dump(prof_dept_list, f, indent=4, ensure_ascii=False)
-
-# build query service for contact info scraping using combination of apis and outlook
-try:
-    service = build("customsearch", "v1", developerKey=API_KEY)
-    name_list = pd.DataFrame(prof_dept_list)['Name']
-    # name = name_list[3]
-    all_contact_info = []
-    for n in name_list:
-        get_contact_info(service, n, all_contact_info)
-    with open('professor_data/contact_info.json', 'w', encoding='utf-8') as f:
+if __name__ == "__main__":
+    with instrument.timer("departments"):
+        prof_dept_list = get_departments()
+    instrument.count("faculty_entries", len(prof_dept_list))
+    with open('professor_data/departments.json', 'w', encoding='utf-8') as f:
         json.dump(prof_dept_list, f, indent=4, ensure_ascii=False)
-    # service = build("customsearch", "v1", developerKey=API_KEY)
-
-    # urls = []
-    # name_list = pd.DataFrame(prof_dept_list)['Name']
-    # # testing
-    # name = name_list[2]
-    # print(name)
-    # linkedin_query = f"{name} rpi Linkedin"
-    # #linkedin_url = search_query(service, name, linkedin_query) # WORKS
-
-    # rpi_page_query = f"{name} rpi page"
-    # #rpi_page_url = search_query(service, name, rpi_page_query) # WORKS
-    # #urls.append(url)
-
-except Exception as e:
-    print("LINKEDIN SCRAPING FAILED")
-    print(e)
\ No newline at end of file
+
+    # contact info scraping (search api + faculty pages), see
+    # contact_scraper.py; reruns reuse professor_data/contact_cache.
+    # Offices come from a directory backend, see directory_lookup.py:
+    #   python scripts/faculty_info.py [outlook|ldif|snapshot]
+    directory = open_directory(sys.argv[1] if len(sys.argv) > 1 else None)
+    scraper = ContactScraper(API_KEY, PSE_ID, directory=directory)
+    all_contact_info = scraper.scrape([prof['Name'] for prof in prof_dept_list])
+    if directory:
+        directory.close()
+    with open('professor_data/contact_info.json', 'w', encoding='utf-8') as f:
+        json.dump(all_contact_info, f, indent=4, ensure_ascii=False)
+    print(f"Scraped {len(all_contact_info)} professors: {scraper.stats}")
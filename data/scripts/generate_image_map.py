@@ -1,6 +1,11 @@
+import hashlib
+import json
 import os
+import re
 import sys
 
+import instrument
+
 # Get the directory where the Python script itself is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -8,82 +13,201 @@ SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 
 # 1. DEFINE THE PROJECT ROOT RELATIVE TO THE SCRIPT
 # Example: If MyProject is one level up (..) and then down into MyProjectName
-PROJECT_ROOT_DIR = os.path.join('PathFinder') 
-# You need to adjust '..', 'MyProject' to match your actual structure. 
+PROJECT_ROOT_DIR = os.path.join('PathFinder')
+# You need to adjust '..', 'MyProject' to match your actual structure.
 # For example, if it's two folders away, it might be: os.path.join(SCRIPT_DIR, '..', '..', 'MyProject')
 
 # 2. Use the PROJECT_ROOT_DIR for all subsequent paths
-ASSETS_DIR = os.path.join(PROJECT_ROOT_DIR, 'assets', 'images', 'imgs') 
+# the optimized headshots and manifest.json written by image_pipeline.py
+ASSETS_DIR = os.path.join(PROJECT_ROOT_DIR, 'assets', 'images', 'faculty')
 OUTPUT_FILE = os.path.join(PROJECT_ROOT_DIR, 'components', 'ImageMap.ts') #PathFinder\assets\images\imgs
+SHARD_DIR = os.path.join(PROJECT_ROOT_DIR, 'components', 'imageShards')
 
 # 3. CRUCIAL: Re-calculate the REQUIRE_PATH_PREFIX
-# This path MUST be the path from OUTPUT_FILE (inside the project) to ASSETS_DIR (inside the project).
+# This path MUST be the path from a shard file (inside the project) to ASSETS_DIR (inside the project).
 # This path is relative to the internal project structure, NOT the script location.
-# If OUTPUT_FILE is in 'MyProject/src/constants' and ASSETS_DIR is in 'MyProject/assets/images'
-REQUIRE_PATH_PREFIX = '../assets/images/imgs/'
-
-ALLOWED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+# If the shards are in 'MyProject/components/imageShards' and ASSETS_DIR is in 'MyProject/assets/images/faculty'
+REQUIRE_PATH_PREFIX = '../../assets/images/faculty/'
+
+# which encoding of each variant the app uses (image_pipeline.py also writes "jpeg")
+IMAGE_FORMAT = 'webp'
+VARIANTS = ('thumb', 'detail')
+# a photo shared by this many professors is the faculty site's placeholder;
+# they get the app's default icon instead
+PLACEHOLDER_MIN = 3
 # ----------------------------
 
-# ... rest of your generate_map() function ...
-# ---------------------
+# --- Sharded, lazy map ---
+# ImageMap.ts only holds the key list (one string) and a loader per shard;
+# each shard module in imageShards/ require()s the headshots for the keys
+# starting with one letter and is pulled in with import() the first time one
+# of its keys is shown. Startup therefore only evaluates the key list, no
+# matter how many professors there are. Shard files are named after their
+# letter and a hash of their contents, so a changed shard is a new module.
+
+HEADER = "// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.\n"
 
-def generate_map():
-    # 1. Read the list of files and filter
-    try:
-        files = os.listdir(ASSETS_DIR)
-        image_files = [f for f in files if os.path.splitext(f.lower())[1] in ALLOWED_EXTENSIONS]
-    except FileNotFoundError:
-        print(f"❌ Error: Asset directory not found at {ASSETS_DIR}")
-        return
 
-    # Prepare file content strings
-    type_union = []
-    map_entries = []
+def shard_name(key):
+    # keys are slugs; anything not starting with a letter goes in "_"
+    first = key[:1]
+    return first if re.match(r"[a-z]", first) else "_"
 
-    for file in image_files:
-        # Get the image name without the extension
-        image_name = os.path.splitext(file)[0]
-        
-        # Add to the TypeScript Union Type (e.g., "'apple'")
-        type_union.append(f"  | '{image_name}'")
-        
-        # Add to the map entry (e.g., "'apple': require('../../assets/images/apple.png'),")
-        map_entries.append(f"  '{image_name}': require('{REQUIRE_PATH_PREFIX}{file}'),")
 
-    # 2. Assemble the TypeScript content
-    type_content = "\n".join(type_union)
+def load_manifest():
+    with open(os.path.join(ASSETS_DIR, 'manifest.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
 
-    content = f"""// src/constants/ImageMap.ts
-// THIS FILE IS AUTOMATICALLY GENERATED BY generate_image_map.py. DO NOT EDIT MANUALLY.
+
+def image_keys(manifest):
+    # -> {key: {variant: file}} minus the placeholder photo
+    shared = {}
+    for entry in manifest.values():
+        shared[entry.get('sha256')] = shared.get(entry.get('sha256'), 0) + 1
+
+    keys = {}
+    for key, entry in sorted(manifest.items()):
+        if 'variants' not in entry or shared[entry.get('sha256')] >= PLACEHOLDER_MIN:
+            continue
+        keys[key] = {variant: entry['variants'][variant][IMAGE_FORMAT] for variant in VARIANTS}
+    return keys
+
+
+def shard_content(entries):
+    lines = [HEADER, "import type { ImageShard } from '../ImageMap';\n", "const shard: ImageShard = {"]
+    for key, files in entries.items():
+        sources = ", ".join(f"{variant}: require('{REQUIRE_PATH_PREFIX}{files[variant]['file']}')"
+                            for variant in VARIANTS)
+        lines.append(f"  '{key}': {{ {sources} }},")
+    lines.append("};\n\nexport default shard;\n")
+    return "\n".join(lines)
+
+
+def index_content(keys, shard_modules):
+    type_content = "\n".join(f"  | '{key}'" for key in keys)
+    loaders = "\n".join(f"  '{name}': () => import('./imageShards/{module}')," for name, module in shard_modules.items())
+    return HEADER + f"""
+import {{ useEffect, useState }} from 'react';
 
 // Define the Union Type of all available image keys for type safety
-export type ImageKey = 
+export type ImageKey =
 {type_content};
 
+export type ImageVariant = {' | '.join(f"'{v}'" for v in VARIANTS)};
+
 // Define the type for the image source (a number, which is what require() returns)
 type ImageSource = number;
+export type ImageShard = Record<string, Record<ImageVariant, ImageSource>>;
 
-// Define and export the constant map
-export const IMAGE_MAP: Record<ImageKey, ImageSource> = {{
-{'\n'.join(map_entries)}
+// Every key with a photo; the shard holding a key is its first letter
+const KEYS = '{'|'.join(keys)}';
+const IMAGE_KEYS = new Set(KEYS.split('|'));
+
+const SHARDS: Record<string, () => Promise<{{ default: ImageShard }}>> = {{
+{loaders}
 }};
+
+const loaded: Record<string, ImageShard> = {{}};
+const pending: Record<string, Promise<ImageShard>> = {{}};
+
+function shardOf(key: string): string {{
+  return /^[a-z]/.test(key) ? key[0] : '_';
+}}
+
+export function hasImage(key: string | undefined): key is ImageKey {{
+  return !!key && IMAGE_KEYS.has(key);
+}}
+
+// The source if its shard is already loaded, without waiting
+export function getLoadedImage(key: string, variant: ImageVariant = 'thumb'): ImageSource | undefined {{
+  return loaded[shardOf(key)]?.[key]?.[variant];
+}}
+
+export function loadImage(key: string, variant: ImageVariant = 'thumb'): Promise<ImageSource | undefined> {{
+  if (!hasImage(key)) return Promise.resolve(undefined);
+  const name = shardOf(key);
+  if (!pending[name]) {{
+    pending[name] = SHARDS[name]().then((module) => (loaded[name] = module.default));
+  }}
+  return pending[name].then((shard) => shard[key]?.[variant]);
+}}
+
+// Image source for a key, loading its shard on first use; undefined while
+// loading or when there is no photo
+export function useImage(key: string | undefined, variant: ImageVariant = 'thumb'): ImageSource | undefined {{
+  const [source, setSource] = useState(() => (key ? getLoadedImage(key, variant) : undefined));
+  useEffect(() => {{
+    let live = true;
+    if (!hasImage(key)) {{
+      setSource(undefined);
+      return;
+    }}
+    loadImage(key, variant).then((loadedSource) => {{
+      if (live) setSource(loadedSource);
+    }});
+    return () => {{
+      live = false;
+    }};
+  }}, [key, variant]);
+  return source;
+}}
 """
 
-    # 3. Write the content to the output file
+
+def write_file(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def generate_map():
+    # 1. Read the optimized image manifest
     try:
-        # Ensure the output directory exists
-        os.makedirs(os.path.dirname(OUTPUT_FILE), exist_ok=True)
-        
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        print(f"✅ Successfully generated image map at: {OUTPUT_FILE}")
-        print(f"   Total images included: {len(image_files)}")
-        
+        manifest = load_manifest()
+    except FileNotFoundError:
+        print(f"❌ Error: no image manifest in {ASSETS_DIR}, run image_pipeline.py first")
+        return
+
+    keys = image_keys(manifest)
+    shards = {}
+    for key, files in keys.items():
+        shards.setdefault(shard_name(key), {})[key] = files
+
+    # 2. Write the shards (hashed names) and drop the ones that went stale
+    try:
+        os.makedirs(SHARD_DIR, exist_ok=True)
+        shard_modules = {}
+        report = []
+        for name, entries in sorted(shards.items()):
+            content = shard_content(entries)
+            module = f"{name}.{hashlib.sha256(content.encode('utf-8')).hexdigest()[:8]}"
+            write_file(os.path.join(SHARD_DIR, module + '.ts'), content)
+            shard_modules[name] = module
+            report.append((module, len(entries), len(content.encode('utf-8')),
+                           {v: sum(files[v]['bytes'] for files in entries.values()) for v in VARIANTS}))
+
+        for file in os.listdir(SHARD_DIR):
+            if os.path.splitext(file)[0] not in shard_modules.values():
+                os.remove(os.path.join(SHARD_DIR, file))
+
+        # 3. Write the index with the compact key table and shard loaders
+        index = index_content(keys, shard_modules)
+        write_file(OUTPUT_FILE, index)
     except Exception as e:
         print(f"❌ Failed to write image map file: {e}")
+        return
+
+    print(f"✅ Successfully generated image map at: {OUTPUT_FILE} ({len(index.encode('utf-8')) / 1024:.1f} KB)")
+    print(f"   Total images included: {len(keys)} in {len(shards)} shards "
+          f"({len(manifest) - len(keys)} without a photo or with the placeholder)")
+    print(f"   {'shard':<14} {'images':>6} {'module KB':>10} " + " ".join(f"{v + ' KB':>10}" for v in VARIANTS))
+    for module, count, module_bytes, variant_bytes in report:
+        print(f"   {module:<14} {count:>6} {module_bytes / 1024:>10.1f} "
+              + " ".join(f"{variant_bytes[v] / 1024:>10.1f}" for v in VARIANTS))
+    totals = {v: sum(r[3][v] for r in report) for v in VARIANTS}
+    print(f"   {'total':<14} {len(keys):>6} {sum(r[2] for r in report) / 1024:>10.1f} "
+          + " ".join(f"{totals[v] / 1024:>10.1f}" for v in VARIANTS))
 
 
 if __name__ == "__main__":
-    generate_map()
\ No newline at end of file
+    with instrument.timer("generate_map"):
+        generate_map()
@@ -0,0 +1,227 @@
+import hashlib
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageOps
+
+import instrument
+
+# Headshot optimization stage, after fac_scrap.py.
+# Every source photo becomes two size-capped variants, each as WebP plus a
+# JPEG fallback:
+#   thumb   square, 128px  (faculty list renders them at 50x50)
+#   detail  longest side 320px (professor profile renders 100x100)
+# EXIF orientation is applied and then all metadata (EXIF, ICC, comments) is
+# dropped, and files are named <slug>.<content hash>.<ext>. Identical source
+# files are encoded once; the duplicates point at the first slug's files in
+# the manifest. Encoding runs in a process pool and sources whose sha256
+# hasn't changed since the last run are skipped.
+#
+# The manifest (manifest.json next to the variants) has per slug the source
+# size and dimensions and, per variant and format, the file, dimensions and
+# bytes, for building the app's image map from. The variants and manifest are
+# committed, so a checkout builds without running this stage; rerun it (or
+# pipeline.py) and commit the result when the sources change.
+#
+# The only source directory is data/imgs (what fac_scrap.py downloads). The
+# originals that used to ship in PathFinder/assets/images/imgs were removed
+# once their variants were committed; manifest entries whose source isn't in
+# a source directory are kept as they are for as long as their files exist.
+
+SOURCE_DIRS = ["../imgs"]
+OUTPUT_DIR = "../../PathFinder/assets/images/faculty"
+MANIFEST_NAME = "manifest.json"
+
+VARIANTS = {
+    # name: (max size, square crop)
+    "thumb": (128, True),
+    "detail": (320, False),
+}
+WEBP_QUALITY = 80
+JPEG_QUALITY = 82
+ALLOWED_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+
+def file_hash(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def find_sources(source_dirs=SOURCE_DIRS):
+    # -> {slug: path}; the first directory wins when a slug is in several
+    # (data/imgs is what fac_scrap.py last downloaded)
+    sources = {}
+    for source_dir in source_dirs:
+        if not os.path.isdir(source_dir):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            slug, ext = os.path.splitext(name)
+            if ext.lower() in ALLOWED_EXTENSIONS:
+                sources.setdefault(slug, os.path.join(source_dir, name))
+    return sources
+
+
+def render_variant(img, size, square):
+    if square:
+        # bias the crop up a little, headshots have the face above center
+        return ImageOps.fit(img, (size, size), Image.LANCZOS, centering=(0.5, 0.4))
+    img = img.copy()
+    img.thumbnail((size, size), Image.LANCZOS)
+    return img
+
+
+def encode(img, fmt):
+    buf = io.BytesIO()
+    if fmt == "webp":
+        img.save(buf, "WEBP", quality=WEBP_QUALITY, method=6)
+    else:
+        img.save(buf, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return buf.getvalue()
+
+
+def write_file(path, data):
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+
+def optimize_image(slug, source_path, output_dir=OUTPUT_DIR):
+    # process pool job: one source -> every variant; returns its manifest entry
+    with Image.open(source_path) as img:
+        img = ImageOps.exif_transpose(img)
+        # rebuilding from pixel data leaves every bit of metadata behind
+        img = img.convert("RGB")
+        entry = {
+            "source": source_path,
+            "width": img.width,
+            "height": img.height,
+            "bytes": os.path.getsize(source_path),
+            "variants": {}
+        }
+        for variant, (size, square) in VARIANTS.items():
+            out = render_variant(img, size, square)
+            formats = {}
+            for fmt, ext in (("webp", "webp"), ("jpeg", "jpg")):
+                data = encode(out, fmt)
+                # content hash in the name, so a changed photo is a new asset
+                rel_path = f"{variant}/{slug}.{hashlib.sha256(data).hexdigest()[:8]}.{ext}"
+                write_file(os.path.join(output_dir, rel_path), data)
+                formats[fmt] = {"file": rel_path, "width": out.width, "height": out.height, "bytes": len(data)}
+            entry["variants"][variant] = formats
+    return entry
+
+
+def load_manifest(manifest_file):
+    if not os.path.exists(manifest_file):
+        return {}
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, manifest_file):
+    temp_file = manifest_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(manifest.items())), f, indent=2)
+    os.replace(temp_file, manifest_file)
+
+
+def in_source_dirs(path, source_dirs):
+    return os.path.normpath(os.path.dirname(path)) in {os.path.normpath(d) for d in source_dirs}
+
+
+def outputs_exist(entry, output_dir):
+    return all(os.path.exists(os.path.join(output_dir, f["file"]))
+               for formats in entry.get("variants", {}).values() for f in formats.values())
+
+
+def run_pipeline(source_dirs=SOURCE_DIRS, output_dir=OUTPUT_DIR, workers=None):
+    for variant in VARIANTS:
+        os.makedirs(os.path.join(output_dir, variant), exist_ok=True)
+    manifest_file = os.path.join(output_dir, MANIFEST_NAME)
+    old_manifest = load_manifest(manifest_file)
+
+    sources = find_sources(source_dirs)
+    with instrument.timer("hash_sources"):
+        hashes = {slug: file_hash(path) for slug, path in sources.items()}
+    instrument.count("sources", len(sources))
+
+    manifest = {}
+    first_by_hash = {}
+    jobs = []
+    for slug, path in sources.items():
+        digest = hashes[slug]
+        if digest in first_by_hash:
+            # same photo as another slug: reuse that slug's files
+            manifest[slug] = {"duplicate_of": first_by_hash[digest], "sha256": digest}
+            continue
+        first_by_hash[digest] = slug
+        old = old_manifest.get(slug, {})
+        if old.get("sha256") == digest and "variants" in old and outputs_exist(old, output_dir):
+            manifest[slug] = old
+        else:
+            jobs.append(slug)
+
+    # entries whose source directory was retired: their committed variants
+    # are the only copy left
+    for slug, old in old_manifest.items():
+        if (slug not in manifest and not in_source_dirs(old.get("source", ""), source_dirs)
+                and "variants" in old and outputs_exist(old, output_dir)):
+            manifest[slug] = old
+
+    with instrument.timer("encode_variants"), ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {slug: pool.submit(optimize_image, slug, sources[slug], output_dir) for slug in jobs}
+        for slug, future in futures.items():
+            try:
+                manifest[slug] = {**future.result(), "sha256": hashes[slug]}
+            except Exception as e:
+                print(f"  {slug}: could not optimize {sources[slug]} ({e})")
+
+    # resolve duplicates to the original's variant files
+    for slug, entry in manifest.items():
+        if "duplicate_of" in entry and entry["duplicate_of"] in manifest and slug in sources:
+            original = manifest[entry["duplicate_of"]]
+            entry.update({k: v for k, v in original.items() if k not in ("source", "sha256")})
+            entry["source"] = sources[slug]
+
+    # variant files of slugs that went away
+    keep = {f["file"] for e in manifest.values() for formats in e.get("variants", {}).values()
+            for f in formats.values()}
+    for variant in VARIANTS:
+        for name in os.listdir(os.path.join(output_dir, variant)):
+            if f"{variant}/{name}" not in keep:
+                os.remove(os.path.join(output_dir, variant, name))
+
+    save_manifest(manifest, manifest_file)
+    instrument.count("encoded", len(jobs))
+    instrument.count("bytes_written", sum(f["bytes"] for slug in jobs if "variants" in manifest.get(slug, {})
+                                          for formats in manifest[slug]["variants"].values()
+                                          for f in formats.values()))
+    report(manifest, len(jobs), output_dir)
+    return manifest
+
+
+def report(manifest, encoded, output_dir=OUTPUT_DIR):
+    originals = [e for e in manifest.values() if "duplicate_of" not in e and "variants" in e]
+    source_bytes = sum(e["bytes"] for e in originals)
+    print(f"Optimized {encoded} images ({len(manifest) - len(originals)} duplicates, "
+          f"{len(originals) - encoded} unchanged) -> {output_dir}")
+    print(f"  sources: {source_bytes / 2**20:.1f} MB")
+    # a big group here is usually the faculty site's placeholder photo
+    groups = {}
+    for slug, entry in manifest.items():
+        if "duplicate_of" in entry:
+            groups.setdefault(entry["duplicate_of"], []).append(slug)
+    for slug, same in groups.items():
+        instrument.log(f"  same photo as {slug}: {', '.join(same)}")
+    for variant in VARIANTS:
+        for fmt in ("webp", "jpeg"):
+            total = sum(e["variants"][variant][fmt]["bytes"] for e in originals)
+            print(f"  {variant:>6} {fmt:<5} {total / 2**20:.2f} MB")
+
+
+if __name__ == "__main__":
+    # python image_pipeline.py [workers]
+    run_pipeline(workers=int(sys.argv[1]) if len(sys.argv) > 1 else None)
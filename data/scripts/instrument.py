@@ -0,0 +1,193 @@
+import atexit
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# --- Run instrumentation ---
+# Shared by the data scripts:
+#   with timer("stage"): ...     wall time per named stage (calls add up),
+#                                plus the peak RSS seen while it was open
+#   @timed("stage")              the same around a function
+#   count("records", n)          named counters (records parsed, bytes
+#                                fetched, cache hits, ...)
+#   log(...)                     print() for per-record tracing in hot loops,
+#                                silenced by the quiet switch
+# Memory is sampled from a background thread while any timer is open, so
+# nested timers and worker threads are covered without tracing allocations.
+# Process pool workers keep their own numbers; the parent counts what they
+# return.
+#
+# Switches (environment variables, so pipeline.py stages inherit them):
+#   DATA_QUIET=1              silence log()
+#   DATA_REPORT=<file.json>   write the run report there when the script exits
+#   DATA_PROFILE=1            print the timers and counters to stderr at exit
+
+QUIET = os.getenv("DATA_QUIET", "") not in ("", "0")
+REPORT_FILE = os.getenv("DATA_REPORT")
+PROFILE = os.getenv("DATA_PROFILE", "") not in ("", "0")
+SAMPLE_INTERVAL = 0.05
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def peak_rss(children=False):
+    # process high-water mark in bytes, None where getrusage is missing
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def current_rss():
+    # resident set size now (Linux); elsewhere the high-water mark
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return peak_rss()
+
+
+class Recorder:
+
+    def __init__(self):
+        self.timers = {}
+        self.counters = {}
+        # id -> peak sample dict of every timer that is open right now
+        self.open_timers = {}
+        self.lock = threading.Lock()
+        self.sampler = None
+        self.started = time.perf_counter()
+        self.cpu_started = time.process_time()
+
+    def sample(self):
+        rss = current_rss()
+        if rss is None:
+            return
+        with self.lock:
+            for stats in self.open_timers.values():
+                stats["peak"] = max(stats["peak"], rss)
+
+    def sample_loop(self):
+        while True:
+            time.sleep(SAMPLE_INTERVAL)
+            self.sample()
+
+    @contextmanager
+    def timer(self, name):
+        stats = {"peak": 0}
+        with self.lock:
+            self.open_timers[id(stats)] = stats
+            if self.sampler is None:
+                self.sampler = threading.Thread(target=self.sample_loop, daemon=True)
+                self.sampler.start()
+        self.sample()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.sample()
+            with self.lock:
+                del self.open_timers[id(stats)]
+                entry = self.timers.setdefault(name, {"seconds": 0.0, "calls": 0, "peak_rss": 0})
+                entry["seconds"] += elapsed
+                entry["calls"] += 1
+                entry["peak_rss"] = max(entry["peak_rss"], stats["peak"])
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self):
+        peak = peak_rss()
+        children = peak_rss(children=True)
+        with self.lock:
+            return {
+                "script": os.path.basename(sys.argv[0]),
+                "argv": sys.argv[1:],
+                "wall_seconds": round(time.perf_counter() - self.started, 3),
+                "cpu_seconds": round(time.process_time() - self.cpu_started, 3),
+                "peak_rss_mb": round(peak / 2**20, 1) if peak else None,
+                "children_peak_rss_mb": round(children / 2**20, 1) if children else None,
+                "timers": {name: {"seconds": round(t["seconds"], 4), "calls": t["calls"],
+                                  "peak_rss_mb": round(t["peak_rss"] / 2**20, 1)}
+                           for name, t in self.timers.items()},
+                "counters": dict(self.counters)
+            }
+
+
+RECORDER = Recorder()
+
+
+def timer(name):
+    return RECORDER.timer(name)
+
+
+def timed(name):
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with RECORDER.timer(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def count(name, n=1):
+    RECORDER.count(name, n)
+
+
+def set_quiet(quiet=True):
+    global QUIET
+    QUIET = quiet
+
+
+def log(*args, **kwargs):
+    if not QUIET:
+        print(*args, **kwargs)
+
+
+def report():
+    return RECORDER.report()
+
+
+def write_report(report_file):
+    os.makedirs(os.path.dirname(os.path.abspath(report_file)), exist_ok=True)
+    temp_file = report_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(report(), f, indent=2)
+    os.replace(temp_file, report_file)
+
+
+def print_report(file=sys.stderr):
+    r = report()
+    peak = f", peak {r['peak_rss_mb']} MB" if r["peak_rss_mb"] else ""
+    print(f"{r['script']}: {r['wall_seconds']:.2f}s wall, {r['cpu_seconds']:.2f}s cpu{peak}", file=file)
+    for name, t in sorted(r["timers"].items(), key=lambda item: -item[1]["seconds"]):
+        print(f"  {name:<28} {t['seconds']:>9.3f}s {t['calls']:>6}x {t['peak_rss_mb']:>8.1f} MB", file=file)
+    for name, value in sorted(r["counters"].items()):
+        print(f"  {name:<28} {value:>10}", file=file)
+
+
+def write_report_at_exit():
+    # pool workers inherit the switches too; only the script itself reports
+    if multiprocessing.parent_process() is not None:
+        return
+    if REPORT_FILE:
+        write_report(REPORT_FILE)
+    if PROFILE:
+        print_report()
+
+
+atexit.register(write_report_at_exit)
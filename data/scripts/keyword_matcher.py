@@ -0,0 +1,67 @@
+# Aho-Corasick automaton over a fixed list of keywords.
+# Built once, then every text is classified in a single left-to-right pass
+# no matter how many keywords there are, instead of one `in` check per
+# keyword. Matching is on the strings as given, so callers lower-case both
+# the keywords and the text if they want case-insensitive matches.
+
+
+class KeywordMatcher:
+
+    def __init__(self, keywords):
+        self.keywords = list(keywords)
+        # trie: goto[state] is {char: state}; state 0 is the root
+        self.goto = [{}]
+        # best[state] is the longest keyword ending at this state (directly
+        # or through its fail links) as (length, -index), or None
+        self.best = [None]
+
+        for index, keyword in enumerate(self.keywords):
+            if not keyword:
+                continue
+            state = 0
+            for char in keyword:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.best.append(None)
+                state = next_state
+            candidate = (len(keyword), -index)
+            if self.best[state] is None or candidate > self.best[state]:
+                self.best[state] = candidate
+
+        # fail links, breadth first so a state's fail target is done first
+        self.fail = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                target = self.goto[fail].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                inherited = self.best[self.fail[next_state]]
+                if inherited is not None and (self.best[next_state] is None or inherited > self.best[next_state]):
+                    self.best[next_state] = inherited
+
+        # fold the fail links into a full transition table (a DFA over the
+        # keyword alphabet) so scanning never walks fail chains; characters
+        # outside the alphabet always go back to the root
+        self.delta = [None] * len(self.goto)
+        self.delta[0] = dict(self.goto[0])
+        for state in queue:
+            self.delta[state] = {**self.delta[self.fail[state]], **self.goto[state]}
+
+    def longest(self, text):
+        # index of the longest keyword found anywhere in text (the earlier
+        # keyword on ties), or None
+        delta, best = self.delta, self.best
+        found = None
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if best[state] is not None and (found is None or best[state] > found):
+                found = best[state]
+        return None if found is None else -found[1]
@@ -0,0 +1,344 @@
+import csv
+import difflib
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from collections import Counter
+
+import instrument
+
+# Professor name reconciliation across the data sources:
+#   QuACS (professor_courses.json keys)  "Dawn M. Cairns-Weaver"
+#   faculty catalog (departments.json)   "Cairns-Weaver, Dawn"
+#   RMP (rmp_teachers.json)               "Dawn Cairns-Weaver"
+#   headshots (data/imgs)                 "dawn-cairns-weaver.jpg"
+# Every name is parsed into (given name, surname tokens). Candidates are only
+# scored when they share a surname block key, so matching N names against M
+# names costs about N * (names per surname) instead of N * M, and the result
+# is written once to a crosswalk table keyed by the QuACS name.
+
+PROFESSOR_COURSES_FILE = "../professor_data/professor_courses.json"
+DEPARTMENTS_FILE = "../professor_data/departments.json"
+RMP_TEACHERS_FILE = "../professor_data/rmp_teachers.json"
+IMAGES_DIR = "../imgs"
+CROSSWALK_FILE = "../professor_data/name_crosswalk.csv"
+
+CROSSWALK_COLUMNS = [
+    "quacs_name", "catalog_name", "department", "rmp_name", "image_slug",
+    "catalog_score", "rmp_score", "image_score"
+]
+
+MIN_SCORE = 0.85
+SURNAME_WEIGHT = 0.5
+SURNAME_PREFIX = 4
+
+TOKEN = re.compile(r"[a-z]+")
+SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "phd", "dr", "prof"}
+# short forms that show up on RMP and in image slugs
+NICKNAMES = {
+    "rich": "richard", "rick": "richard", "dick": "richard", "bob": "robert",
+    "rob": "robert", "bill": "william", "will": "william", "jim": "james",
+    "mike": "michael", "tom": "thomas", "dave": "david", "dan": "daniel",
+    "chris": "christopher", "joe": "joseph", "steve": "steven", "nick": "nicholas",
+    "tony": "anthony", "ed": "edward", "ted": "edward", "pat": "patrick",
+    "ken": "kenneth", "sam": "samuel", "matt": "matthew", "andy": "andrew",
+    "alex": "alexander", "greg": "gregory", "jeff": "jeffrey", "ben": "benjamin",
+    "liz": "elizabeth", "beth": "elizabeth", "kate": "katherine", "jen": "jennifer",
+    "jenny": "jennifer", "kathy": "kathryn", "becky": "rebecca", "doug": "douglas",
+    "tomek": "tomasz",
+}
+
+
+def fold(text):
+    # lower case ascii, accents dropped ("Zoë" -> "zoe")
+    text = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+
+def parse_name(name):
+    # -> (given, middles, surname parts); "Last, First" or "First ... Last"
+    name = fold(name)
+    if "," in name:
+        last, _, first = name.partition(",")
+    else:
+        words = name.split()
+        words = [w for w in words if w.strip(".") not in SUFFIXES] or words
+        first, last = " ".join(words[:-1]), (words[-1] if words else "")
+
+    given = [t for t in TOKEN.findall(first) if t not in SUFFIXES]
+    surname = [t for t in TOKEN.findall(last) if t not in SUFFIXES]
+    if not given and len(surname) > 1:
+        given, surname = surname[:1], surname[1:]
+    first = given[0] if given else ""
+    return first, given[1:], surname
+
+
+def block_keys(parsed):
+    # every surname part plus the joined surname, so "cairns-weaver",
+    # "cairns weaver" and "weaver" land in the same block; a last middle name
+    # counts too ("Esra Agca Aktunc" vs "Agca Aktunc, Esra"), and a short
+    # surname prefix catches typos ("Strzalkoswki", "McGuiness")
+    _, middles, surname = parsed
+    keys = {t for t in surname if len(t) > 1}
+    if surname:
+        joined = "".join(surname)
+        keys.add(joined)
+        keys.add("#" + joined[:SURNAME_PREFIX])
+    if middles and len(middles[-1]) > 1:
+        keys.add(middles[-1])
+    return keys
+
+
+def given_score(a, b):
+    if not a or not b:
+        return 0.5
+    a, b = NICKNAMES.get(a, a), NICKNAMES.get(b, b)
+    if a == b:
+        return 1.0
+    if len(a) == 1 or len(b) == 1:
+        return 0.8 if a[0] == b[0] else 0.0
+    if a.startswith(b) or b.startswith(a):
+        return 0.9
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+def surname_score(a, b):
+    # -> (score, via_middle); via_middle means one side's surname only shows
+    # up as the other side's middle name ("Humberto Terrones Maldonado")
+    a_last, b_last = "".join(a[2]), "".join(b[2])
+    if a_last == b_last or "".join(a[1][-1:] + a[2]) == b_last or a_last == "".join(b[1][-1:] + b[2]):
+        return 1.0, False
+    # "Cairns-Weaver" vs "Weaver", "Parker Ward" vs "Ward"
+    if set(a[2]) <= set(b[2]) or set(b[2]) <= set(a[2]):
+        return 0.9, False
+    if set(a[2]) <= set(a[1] + b[1]) or set(b[2]) <= set(b[1] + a[1]):
+        return 0.9, True
+    return difflib.SequenceMatcher(None, a_last, b_last).ratio(), False
+
+
+def name_score(a, b):
+    surname, via_middle = surname_score(a, b)
+    # people often go by a middle name ("Hasan Tankut Atuk" is "Atuk, Tankut")
+    given = max(
+        given_score(a[0], b[0]),
+        max((0.9 * given_score(a[0], m) for m in b[1] if len(m) > 1), default=0.0),
+        max((0.9 * given_score(m, b[0]) for m in a[1] if len(m) > 1), default=0.0),
+    )
+    # a middle name standing in for the surname needs a full given name match,
+    # or every "Jason Michael X" would match "Michael, J. Darryl"
+    if via_middle and given_score(a[0], b[0]) < 1.0:
+        return 0.0
+    score = SURNAME_WEIGHT * surname + (1 - SURNAME_WEIGHT) * given
+    # conflicting middle initials are a strong "different person" signal
+    if a[1] and b[1] and a[1][0][0] != b[1][0][0] and a[1][0] not in b[2] and b[1][0] not in a[2]:
+        score -= 0.1
+    return round(score, 3)
+
+
+class NameMatcher:
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.parsed = [parse_name(n) for n in self.names]
+        self.blocks = {}
+        for i, parsed in enumerate(self.parsed):
+            for key in block_keys(parsed):
+                self.blocks.setdefault(key, []).append(i)
+
+    def candidates(self, name):
+        parsed = parse_name(name)
+        seen = set()
+        for key in block_keys(parsed):
+            for i in self.blocks.get(key, ()):
+                if i not in seen:
+                    seen.add(i)
+                    yield i, name_score(parsed, self.parsed[i])
+
+    def best(self, name, min_score=MIN_SCORE):
+        # -> (name, score) or (None, 0.0); ties are ambiguous and don't match
+        ranked = sorted(self.candidates(name), key=lambda c: -c[1])
+        if not ranked or ranked[0][1] < min_score:
+            return None, 0.0
+        if len(ranked) > 1 and ranked[1][1] == ranked[0][1] and \
+                self.names[ranked[1][0]] != self.names[ranked[0][0]]:
+            return None, 0.0
+        return self.names[ranked[0][0]], ranked[0][1]
+
+    def assign(self, names, min_score=MIN_SCORE):
+        # one to one: -> {name: (target, score)}. Pairs are taken best score
+        # first and each target goes to one name. A name tied between targets
+        # stays unmatched, and so does a target tied between names (nobody
+        # with a lower score gets it either)
+        pairs = {}
+        for name in dict.fromkeys(names):
+            for i, score in self.candidates(name):
+                if score >= min_score:
+                    key = (name, self.names[i])
+                    pairs[key] = max(pairs.get(key, 0.0), score)
+        by_score = {}
+        for (name, target), score in pairs.items():
+            by_score.setdefault(score, []).append((name, target))
+
+        assigned = {}
+        done = set()
+        taken = set()
+        for score in sorted(by_score, reverse=True):
+            free = [(name, target) for name, target in by_score[score] if name not in done and target not in taken]
+            name_count = Counter(name for name, _ in free)
+            target_count = Counter(target for _, target in free)
+            for name, target in free:
+                if name_count[name] == 1 and target_count[target] == 1:
+                    assigned[name] = (target, score)
+                    taken.add(target)
+                elif target_count[target] > 1:
+                    taken.add(target)
+                done.add(name)
+        return assigned
+
+
+def load_quacs_names(professor_courses_file=PROFESSOR_COURSES_FILE):
+    with open(professor_courses_file, "r", encoding="utf-8") as f:
+        return [name for name in json.load(f) if name != "TBA"]
+
+
+def load_catalog(departments_file=DEPARTMENTS_FILE):
+    # -> {"Last, First": department}
+    with open(departments_file, "r", encoding="utf-8") as f:
+        return {entry["Name"]: entry["Department"] for entry in json.load(f)}
+
+
+def load_rmp_names(rmp_teachers_file=RMP_TEACHERS_FILE):
+    # rmp_teachers.json is several JSON documents back to back: compacted
+    # "Name": {...} maps and raw Relay stores with Teacher records (pasted
+    # with their trailing ";")
+    with open(rmp_teachers_file, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    decoder = json.JSONDecoder()
+    names = []
+    pos = 0
+    while True:
+        while pos < len(text) and (text[pos].isspace() or text[pos] == ";"):
+            pos += 1
+        if pos >= len(text):
+            break
+        doc, pos = decoder.raw_decode(text, pos)
+        if "client:root" in doc:
+            for record in doc.values():
+                if isinstance(record, dict) and record.get("__typename") == "Teacher":
+                    names.append(f"{record.get('firstName', '')} {record.get('lastName', '')}".strip())
+        else:
+            names.extend(doc)
+    return list(dict.fromkeys(names))
+
+
+def load_image_slugs(images_dir=IMAGES_DIR):
+    return sorted(os.path.splitext(f)[0] for f in os.listdir(images_dir)
+                  if f.lower().endswith((".jpg", ".jpeg", ".png", ".webp")))
+
+
+def build_crosswalk(quacs_names, catalog, rmp_names, image_slugs, min_score=MIN_SCORE):
+    # one row per QuACS name, then rows for anything in the other sources
+    # that no QuACS name picked up
+    catalog_match = NameMatcher(catalog)
+    rmp_match = NameMatcher(rmp_names)
+    # "peter-j-bonitatibus" -> "peter j bonitatibus"
+    image_names = {slug.replace("-", " "): slug for slug in image_slugs}
+    image_match = NameMatcher(image_names)
+
+    catalog_picks = catalog_match.assign(quacs_names, min_score)
+    rmp_picks = rmp_match.assign(quacs_names, min_score)
+    image_picks = image_match.assign(quacs_names, min_score)
+
+    rows = []
+    used = {"catalog": set(), "rmp": set(), "image": set()}
+    for name in quacs_names:
+        catalog_name, catalog_score = catalog_picks.get(name, (None, 0.0))
+        rmp_name, rmp_score = rmp_picks.get(name, (None, 0.0))
+        image_name, image_score = image_picks.get(name, (None, 0.0))
+        used["catalog"].add(catalog_name)
+        used["rmp"].add(rmp_name)
+        used["image"].add(image_name)
+        rows.append({
+            "quacs_name": name,
+            "catalog_name": catalog_name or "",
+            "department": catalog.get(catalog_name, ""),
+            "rmp_name": rmp_name or "",
+            "image_slug": image_names.get(image_name, ""),
+            "catalog_score": catalog_score or "",
+            "rmp_score": rmp_score or "",
+            "image_score": image_score or "",
+        })
+
+    # faculty with no QuACS history still get linked to each other
+    leftover_rmp = NameMatcher([n for n in rmp_names if n not in used["rmp"]])
+    leftover_images = NameMatcher([n for n in image_names if n not in used["image"]])
+    leftover_catalog = [n for n in catalog if n not in used["catalog"]]
+    rmp_picks = leftover_rmp.assign(leftover_catalog, min_score)
+    image_picks = leftover_images.assign(leftover_catalog, min_score)
+    for catalog_name in leftover_catalog:
+        rmp_name, rmp_score = rmp_picks.get(catalog_name, (None, 0.0))
+        image_name, image_score = image_picks.get(catalog_name, (None, 0.0))
+        used["rmp"].add(rmp_name)
+        used["image"].add(image_name)
+        rows.append({
+            "quacs_name": "", "catalog_name": catalog_name, "department": catalog[catalog_name],
+            "rmp_name": rmp_name or "", "image_slug": image_names.get(image_name, ""),
+            "catalog_score": "", "rmp_score": rmp_score or "", "image_score": image_score or "",
+        })
+    for rmp_name in rmp_names:
+        if rmp_name not in used["rmp"]:
+            rows.append({**dict.fromkeys(CROSSWALK_COLUMNS, ""), "rmp_name": rmp_name})
+    for image_name, slug in image_names.items():
+        if image_name not in used["image"]:
+            rows.append({**dict.fromkeys(CROSSWALK_COLUMNS, ""), "image_slug": slug})
+    return rows
+
+
+def save_crosswalk(rows, crosswalk_file=CROSSWALK_FILE):
+    with open(crosswalk_file, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=CROSSWALK_COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def load_crosswalk(crosswalk_file=CROSSWALK_FILE):
+    # -> {source name: row} for every non-empty name column, so any of the
+    # four spellings finds the same row
+    with open(crosswalk_file, "r", encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    lookup = {}
+    for row in rows:
+        for column in ("quacs_name", "catalog_name", "rmp_name", "image_slug"):
+            if row[column]:
+                lookup.setdefault(row[column], row)
+    return lookup
+
+
+if __name__ == "__main__":
+    # python name_match.py          -> rebuild name_crosswalk.csv
+    # python name_match.py <names>  -> show the crosswalk row for each name
+    if len(sys.argv) > 1:
+        lookup = load_crosswalk()
+        for name in sys.argv[1:]:
+            print(name, "->", lookup.get(name))
+        sys.exit(0)
+
+    start = time.perf_counter()
+    with instrument.timer("load_names"):
+        catalog = load_catalog()
+        quacs_names = load_quacs_names()
+        rmp_names = load_rmp_names()
+        image_slugs = load_image_slugs()
+    with instrument.timer("build_crosswalk"):
+        rows = build_crosswalk(quacs_names, catalog, rmp_names, image_slugs)
+    save_crosswalk(rows)
+    instrument.count("names", len(quacs_names) + len(catalog) + len(rmp_names) + len(image_slugs))
+    instrument.count("crosswalk_rows", len(rows))
+
+    linked = len({r["catalog_name"] for r in rows if r["quacs_name"] and r["catalog_name"]})
+    print(f"Matched {linked} of {len(catalog)} catalog names to {len(quacs_names)} QuACS names "
+          f"in {time.perf_counter() - start:.2f}s -> {CROSSWALK_FILE}")
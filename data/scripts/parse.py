@@ -2,11 +2,18 @@
 from collections import defaultdict
 from math import inf as inf
 from datetime import date
-from requests import get
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import requests
+from requests.adapters import HTTPAdapter
+import threading
+import codecs
 import json
+import time
 import sys
 import os
 
+import instrument
+
 
 #link to quacs data
 URL = "https://api.github.com/repos/quacs/quacs-data/contents/semester_data"
@@ -36,45 +43,120 @@ starting = {
 
 
 
-def compact_courses(input_file, output_file):
-    with open(input_file, "r") as f:
-        data = json.load(f)
-
-    compact = []
-
-    for subject in data:
+# --- Streaming compaction ---
+# The raw QuACS dump is a JSON list of subjects. Instead of json.load-ing the
+# whole thing we decode one subject at a time from a file handle (or an HTTP
+# response body), so memory only ever holds a single subject plus the compact
+# records written so far.
+CHUNK_SIZE = 1 << 16
+
+
+def iter_subjects(fp, chunk_size=CHUNK_SIZE):
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+
+    def read_more(buf, pos):
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            return buf[pos:] + utf8.decode(b"", final=True), True
+        if isinstance(chunk, bytes):
+            chunk = utf8.decode(chunk)
+        return buf[pos:] + chunk, False
+
+    while True:
+        # skip whitespace and list punctuation between subjects
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+
+        if pos == len(buf):
+            if eof:
+                raise ValueError("Unexpected end of courses data")
+            buf, eof = read_more(buf, pos)
+            pos = 0
+            continue
+
+        if not started:
+            if buf[pos] != "[":
+                raise ValueError("Expected a JSON list of subjects")
+            started = True
+            pos += 1
+            continue
+
+        if buf[pos] == "]":
+            return
+
+        try:
+            subject, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # the subject is cut off at the end of the buffer, read more of it
+            if eof:
+                raise
+            buf, eof = read_more(buf, pos)
+            pos = 0
+            continue
+
+        pos = end
+        yield subject
+
+
+def compact_course(course):
+    total_act = 0
+    total_cap = 0
+    instructors = set()
+
+    for section in course.get("sections", []):
+        total_act += section.get("act", 0)
+        total_cap += section.get("cap", 0)
+
+        for ts in section.get("timeslots", []):
+            instr_field = ts.get("instructor", "")
+            if instr_field:
+                # Split multiple instructors (comma-separated)
+                for name in instr_field.split(","):
+                    instructors.add(name.strip())
+
+    return {
+        "id": course["id"],
+        "title": course["title"],
+        "act": total_act,
+        "cap": total_cap,
+        "instructors": sorted(list(instructors))
+    }
+
+
+def iter_compact_courses(fp):
+    for subject in iter_subjects(fp):
         for course in subject.get("courses", []):
-            course_id = course["id"]
-            course_title = course["title"]
-
-            total_act = 0
-            total_cap = 0
-            instructors = set()
-
-            for section in course.get("sections", []):
-                total_act += section.get("act", 0)
-                total_cap += section.get("cap", 0)
+            yield compact_course(course)
 
-                for ts in section.get("timeslots", []):
-                    instr_field = ts.get("instructor", "")
-                    if instr_field:
-                        # Split multiple instructors (comma-separated)
-                        for name in instr_field.split(","):
-                            instructors.add(name.strip())
 
-            compact.append({
-                "id": course_id,
-                "title": course_title,
-                "act": total_act,
-                "cap": total_cap,
-                "instructors": sorted(list(instructors))
-            })
-
-    # Write out compact JSON
-    with open(output_file, "w") as f:
-        json.dump(compact, f, indent=2)
-
-    print(f"Compact data saved to {output_file}")
+def compact_courses(input_file, output_file):
+    # input_file can be a path or an open file / response body (text or bytes)
+    if isinstance(input_file, (str, os.PathLike)):
+        f = open(input_file, "rb")
+    else:
+        f = input_file
+
+    count = 0
+    try:
+        # Write out compact JSON one record at a time, in the same layout
+        # json.dump(compact, f, indent=2) would produce
+        with open(output_file, "w") as out:
+            for record in iter_compact_courses(f):
+                out.write("[\n  " if count == 0 else ",\n  ")
+                out.write(json.dumps(record, indent=2).replace("\n", "\n  "))
+                count += 1
+            out.write("\n]" if count else "[]")
+    finally:
+        if f is not input_file:
+            f.close()
+
+    instrument.log(f"Compact data saved to {output_file} ({count} courses)")
+    return count
 
 
 # Example usage:
@@ -85,31 +167,228 @@ def compact_courses(input_file, output_file):
 
 
 
-td = date.today(); day, month, year = td.day, td.month, td.year
+# --- Incremental sync ---
+# The manifest remembers the git sha of every semester folder (and of its
+# courses.json) that has already been compacted, plus the ETag of the last
+# full listing. A semester is only refetched when its sha changes, and the
+# manifest is saved after every semester so a partial run resumes where it
+# stopped.
+MANIFEST_FILE = "semester_manifest.json"
+OUTPUT_DIR = "../class_data"
+
+# --- Parallel pipeline ---
+# GitHub API calls (listing + one folder listing per changed semester) run on
+# a thread pool sharing one pooled session and the rate limit state below.
+# Downloading courses.json from raw.githubusercontent.com (not API rate
+# limited) and compacting it is CPU bound, so that runs in a process pool,
+# each worker streaming the body straight into compact_courses.
+FETCH_WORKERS = 8
+COMPACT_WORKERS = os.cpu_count() or 1
+
+HEADERS = {"Accept": "application/vnd.github+json"}
+if os.getenv("GITHUB_TOKEN"):
+  HEADERS["Authorization"] = "Bearer " + os.getenv("GITHUB_TOKEN")
 
-# check that we have access to the info
-data = get(URL).json()
-if "message" in data:
-  if "API rate limit exceeded" in data['message']:
-    print("API rate limit exceeded!")
+rate_lock = threading.Lock()
+rate_state = {"remaining": None, "reset": 0}
 
+# one session per process, created lazily so process pool workers get their own
+session = None
 
-curSem = data[-1]['url']
 
-counting = 0
-for sem in reversed(data[-4:]):
-  curSem = sem['url']
-  print(curSem)
-  
-  content = get(curSem).json()
-  courses = get(content[1]['download_url']).json()
+def get_session(pool_size=FETCH_WORKERS):
+  global session
+  if session is None:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.headers.update(HEADERS)
+  return session
 
-  with open("tempfile.json", 'w') as f: json.dump(courses, f, indent=4)
-  compact_courses("tempfile.json", "compact_classes" + str(curSem[-17:-11]) + ".json")
 
-  counting = counting + 1
-  if counting > 5:
-    break
+def wait_for_rate_limit():
+  with rate_lock:
+    if rate_state["remaining"] == 0:
+      delay = rate_state["reset"] - time.time()
+      if delay > 0:
+        print(f"Rate limit reached, waiting {int(delay) + 1}s for reset")
+        time.sleep(delay + 1)
+      rate_state["remaining"] = None
+
+
+def github_get(url, headers=None, retries=3):
+  # GET against the GitHub API that honours the X-RateLimit-* headers
+  for attempt in range(retries):
+    wait_for_rate_limit()
+    resp = get_session().get(url, headers=headers)
+    instrument.count("github_requests")
+
+    with rate_lock:
+      if "X-RateLimit-Remaining" in resp.headers:
+        rate_state["remaining"] = int(resp.headers["X-RateLimit-Remaining"])
+        rate_state["reset"] = int(resp.headers.get("X-RateLimit-Reset", 0))
+
+    if resp.status_code in (403, 429):
+      if "Retry-After" in resp.headers:
+        time.sleep(int(resp.headers["Retry-After"]))
+        continue
+      if rate_state["remaining"] == 0:
+        continue
+    # anything else that isn't a 2xx/304 (a 403 for a private repo, a 404,
+    # a 5xx) is an error, not a listing
+    resp.raise_for_status()
+    return resp
+
+  print("API rate limit exceeded!")
+  sys.exit(1)
+
+
+def load_manifest(manifest_file):
+  if not os.path.exists(manifest_file):
+    return {"etag": None, "semesters": {}}
+  with open(manifest_file, "r") as f:
+    return json.load(f)
+
+
+def save_manifest(manifest, manifest_file):
+  # write to a temp file first so a crash never leaves a half written manifest
+  temp_file = manifest_file + ".tmp"
+  with open(temp_file, "w") as f:
+    json.dump(manifest, f, indent=2)
+  os.replace(temp_file, manifest_file)
+
+
+def output_name(sem_name):
+  return "compact_classes" + sem_name + ".json"
+
+
+def get_listing(etag=None):
+  # returns (listing, etag); listing is None when GitHub answers 304 Not Modified
+  headers = {}
+  if etag:
+    headers["If-None-Match"] = etag
+  resp = github_get(URL, headers=headers)
+  if resp.status_code == 304:
+    return None, etag
+
+  data = resp.json()
+  if "message" in data:
+    print(data['message'])
+    sys.exit(1)
+  return data, resp.headers.get("ETag")
+
+
+def find_courses_file(sem):
+  # thread pool job: look inside a changed semester folder for courses.json
+  content = github_get(sem['url']).json()
+  return next((c for c in content if c['name'] == "courses.json"), None)
+
+
+def download_and_compact(download_url, output_file):
+  # process pool job: stream courses.json and compact it, then swap the
+  # result in so a killed run never leaves a truncated file behind
+  resp = get_session().get(download_url, stream=True)
+  resp.raise_for_status()
+  resp.raw.decode_content = True
+
+  count = compact_courses(resp.raw, output_file + ".tmp")
+  os.replace(output_file + ".tmp", output_file)
+  # -> (courses, bytes downloaded) for the parent's counters
+  return count, resp.raw.tell()
+
+
+def sync_semesters(output_dir=OUTPUT_DIR, manifest_file=None, latest=None,
+                   fetch_workers=FETCH_WORKERS, compact_workers=COMPACT_WORKERS):
+  # latest=None syncs every semester QuACS has, otherwise only the newest few
+  if manifest_file is None:
+    manifest_file = os.path.join(output_dir, MANIFEST_FILE)
+  manifest = load_manifest(manifest_file)
+
+  # a 304 only says nothing changed on GitHub; if compact files the manifest
+  # knows about were deleted here, get the full listing again
+  etag = manifest.get("etag")
+  if etag and not all(os.path.exists(os.path.join(output_dir, output_name(name)))
+                      for name in manifest["semesters"]):
+    etag = None
+  data, etag = get_listing(etag)
+  if data is None:
+    print("Semester listing unchanged, nothing to sync")
+    return []
+
+  sems = [s for s in data if s['type'] == "dir"]
+  if latest:
+    sems = sems[-latest:]
+
+  # folder sha is unchanged so nothing inside it changed either
+  changed = []
+  for sem in reversed(sems):
+    entry = manifest["semesters"].get(sem['name'], {})
+    output_file = os.path.join(output_dir, output_name(sem['name']))
+    if not os.path.exists(output_file) or entry.get("sha") != sem['sha']:
+      changed.append(sem)
+
+  def record(sem, courses_file):
+    manifest["semesters"][sem['name']] = {
+      "sha": sem['sha'],
+      "courses_sha": courses_file['sha'],
+      "output": output_name(sem['name'])
+    }
+    save_manifest(manifest, manifest_file)
+
+  updated = []
+  with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, \
+       ProcessPoolExecutor(max_workers=compact_workers) as compact_pool:
+    lookups = {fetch_pool.submit(find_courses_file, sem): sem for sem in changed}
+    compacting = {}
+
+    for future in as_completed(lookups):
+      sem = lookups[future]
+      courses_file = future.result()
+      if courses_file is None:
+        print(f"  no courses.json for {sem['name']}, skipping")
+        continue
+
+      entry = manifest["semesters"].get(sem['name'], {})
+      output_file = os.path.join(output_dir, output_name(sem['name']))
+      # folder changed but courses.json did not (e.g. only prereqs were updated)
+      if os.path.exists(output_file) and entry.get("courses_sha") == courses_file['sha']:
+        record(sem, courses_file)
+        continue
+
+      job = compact_pool.submit(download_and_compact, courses_file['download_url'], output_file)
+      compacting[job] = (sem, courses_file)
+
+    for future in as_completed(compacting):
+      sem, courses_file = compacting[future]
+      courses, fetched = future.result()
+      instrument.count("courses", courses)
+      instrument.count("bytes_fetched", fetched)
+      record(sem, courses_file)
+      print(f"Synced {sem['name']}")
+      updated.append(sem['name'])
+
+  # only remember the listing etag once every semester is done; a partial
+  # run has to look at the listing again to resume
+  if latest is None:
+    manifest["etag"] = etag
+  save_manifest(manifest, manifest_file)
+
+  print(f"{len(updated)} semester(s) updated, {len(sems) - len(updated)} unchanged")
+  return updated
+
+
+if __name__ == "__main__":
+  # python parse.py        -> every semester back to 2000
+  # python parse.py 4      -> only the newest 4 semesters
+  latest = None
+  if len(sys.argv) > 1 and sys.argv[1] != "all":
+    latest = int(sys.argv[1])
+
+  start = time.time()
+  with instrument.timer("sync_semesters"):
+    updated = sync_semesters(latest=latest)
+  instrument.count("semesters_synced", len(updated))
+  print(f"Finished in {time.time() - start:.1f}s")
 
 
 
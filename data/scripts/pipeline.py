@@ -0,0 +1,374 @@
+import ast
+import glob
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+# --- Data build pipeline ---
+# Every build script is a stage: the command to run, the directory it runs
+# from (the scripts use cwd-relative paths), its inputs and outputs, and the
+# stages it has to run after. A stage is skipped when the hash of its inputs
+# and code (the script plus every local module it imports) matches the last
+# successful run and its outputs are still what that run left behind, so a
+# stage whose upstream reran but produced identical files is skipped too.
+# Stages whose dependencies are done run in parallel, each one's output goes
+# to its own log, and every run ends with a per-stage timing report. Each
+# stage also writes its instrument.py report (timers, counters, peak memory)
+# to temps/pipeline_reports, and those are kept in the state file's last_run;
+# --quiet turns off the stages' per-record printing.
+#
+# Stages marked "network" (QuACS sync, contact scraping, headshots) fetch
+# from outside, so their inputs can't be hashed; they only run with --fetch
+# or when named, and are always rerun then (they are incremental on their
+# own). Otherwise their outputs are simply taken as sources.
+#
+# File hashes are cached by size and mtime, so a run with nothing to do only
+# stats files. Paths below are relative to data/; globs may use **.
+#
+#   python pipeline.py [stages ...] [--fetch] [--force] [--dry-run] [--quiet] [--workers N]
+#   (naming stages runs them and everything upstream of them)
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_DIR = os.path.dirname(SCRIPT_DIR)
+STATE_FILE = os.path.join(DATA_DIR, "temps", "pipeline_state.json")
+LOG_DIR = os.path.join(DATA_DIR, "temps", "pipeline_logs")
+REPORT_DIR = os.path.join(DATA_DIR, "temps", "pipeline_reports")
+WORKERS = 4
+LOG_TAIL = 20
+
+STAGES = {
+    "quacs": {
+        "cmd": ["parse.py"], "cwd": "scripts", "network": True,
+        "inputs": [], "outputs": ["class_data/compact_classes*.json"],
+    },
+    "class_store": {
+        "cmd": ["class_store.py"], "cwd": "scripts", "after": ["quacs"],
+        "inputs": ["class_data/compact_classes*.json"], "outputs": ["class_data/class_store.db"],
+    },
+    "professor_courses": {
+        "cmd": ["combine_prof.py", "incremental", "../class_data", "../professor_data/professor_courses.json"],
+        "cwd": "scripts", "after": ["quacs"],
+        "inputs": ["class_data/compact_classes*.json"],
+        "outputs": ["professor_data/professor_courses.json", "professor_data/professor_courses_manifest.json"],
+    },
+    "catalog_csv": {
+        "cmd": ["quatalog_class_info_scraper.py"], "cwd": "scripts",
+        "inputs": ["class/catalog.json"], "outputs": ["class/catalog.csv"],
+    },
+    "dept_list": {
+        "cmd": ["scripts/csv_convert.py"], "cwd": ".",
+        "inputs": ["mockData.json"], "outputs": ["dept_list.csv"],
+    },
+    "faculty": {
+        "cmd": ["scripts/faculty_info.py"], "cwd": ".", "network": True,
+        "inputs": ["professor_data/catalog.html"],
+        "outputs": ["professor_data/departments.json", "professor_data/contact_info.json"],
+    },
+    "search_index": {
+        "cmd": ["search_index.py"], "cwd": "scripts", "after": ["professor_courses", "faculty"],
+        "inputs": ["professor_data/professor_courses.json", "professor_data/departments.json", "class/catalog.json"],
+        "outputs": ["professor_data/search_index.json.gz"],
+    },
+    # the crosswalk also reads the downloaded headshots, but the headshots
+    # stage works from the crosswalk; new photos reach it on the next run
+    "name_crosswalk": {
+        "cmd": ["name_match.py"], "cwd": "scripts", "after": ["professor_courses", "faculty"],
+        "inputs": ["professor_data/professor_courses.json", "professor_data/departments.json",
+                   "professor_data/rmp_teachers.json", "imgs/*"],
+        "outputs": ["professor_data/name_crosswalk.csv"],
+    },
+    "headshots": {
+        "cmd": ["fac_scrap.py", "batch"], "cwd": "scripts", "network": True, "after": ["name_crosswalk"],
+        "inputs": ["professor_data/name_crosswalk.csv"],
+        "outputs": ["imgs/*", "professor_data/image_manifest.json"],
+    },
+    "image_variants": {
+        "cmd": ["image_pipeline.py"], "cwd": "scripts", "after": ["headshots"],
+        "inputs": ["imgs/*"],
+        "outputs": ["../PathFinder/assets/images/faculty/**/*"],
+    },
+    "image_map": {
+        "cmd": ["data/scripts/generate_image_map.py"], "cwd": "..", "after": ["image_variants"],
+        "inputs": ["../PathFinder/assets/images/faculty/manifest.json"],
+        "outputs": ["../PathFinder/components/ImageMap.ts", "../PathFinder/components/imageShards/*"],
+    },
+    # RMP ratings from saved Relay payloads; the one-professor rmp_script.py /
+    # rmp_csv_convert.py queue (temps/full_names.txt) stays a manual workflow
+    "rmp_ingest": {
+        "cmd": ["rmp_compacter.py"], "cwd": "scripts",
+        "inputs": ["temps/relay/*"],
+        "outputs": ["temps/rmp_compacted.json", "temps/batch_ratings.csv", "temps/batch_upsert.sql",
+                    "temps/batch_ratings_copy.sql", "temps/batch_prof_rate.json"],
+    },
+    "ratings_table": {
+        "cmd": ["rmp_csv_convert.py", "compacted"], "cwd": "scripts", "after": ["rmp_ingest"],
+        "inputs": ["temps/rmp_compacted.json", "temps/class_aliases.csv", "class/course_aliases.json"],
+        "outputs": ["temps/rmp_ratings.csv", "temps/rmp_rating_stats.csv"],
+    },
+}
+
+
+def data_path(path):
+    return os.path.normpath(os.path.join(DATA_DIR, path))
+
+
+def expand(patterns):
+    # -> sorted data/-relative files; a plain path that doesn't exist is kept
+    # so its absence is part of the hash
+    files = set()
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            files.update(os.path.relpath(p, DATA_DIR) for p in glob.glob(data_path(pattern), recursive=True)
+                         if os.path.isfile(p))
+        else:
+            files.add(os.path.normpath(pattern))
+    return sorted(files)
+
+
+def local_imports(script, seen=None):
+    # the script and every module of data/scripts it imports, recursively
+    seen = set() if seen is None else seen
+    if script in seen or not os.path.exists(script):
+        return seen
+    seen.add(script)
+    with open(script, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), script)
+    for node in ast.walk(tree):
+        names = []
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names = [node.module]
+        for name in names:
+            local_imports(os.path.join(SCRIPT_DIR, name.split(".")[0] + ".py"), seen)
+    return seen
+
+
+class FileHashes:
+    # sha256 per file, reused while size and mtime are unchanged
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def digest(self, path):
+        full_path = data_path(path)
+        try:
+            st = os.stat(full_path)
+        except FileNotFoundError:
+            return "missing"
+        cached = self.cache.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        h = hashlib.sha256()
+        with open(full_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+        self.cache[path] = [st.st_size, st.st_mtime_ns, h.hexdigest()]
+        return h.hexdigest()
+
+    def combined(self, files, extra=""):
+        h = hashlib.sha256(extra.encode("utf-8"))
+        for path in files:
+            h.update(f"\0{path}\0{self.digest(path)}".encode("utf-8"))
+        return h.hexdigest()
+
+
+def stage_key(name, hashes):
+    stage = STAGES[name]
+    script = os.path.join(data_path(stage["cwd"]), stage["cmd"][0])
+    code = [os.path.relpath(p, DATA_DIR) for p in sorted(local_imports(os.path.normpath(script)))]
+    return hashes.combined(code + expand(stage["inputs"]), json.dumps([stage["cmd"], stage["cwd"]]))
+
+
+def outputs_key(name, hashes):
+    return hashes.combined(expand(STAGES[name]["outputs"]))
+
+
+def topological_order(names):
+    # -> names sorted so every stage comes after the ones it depends on
+    order = []
+    state = {}
+
+    def visit(name, path):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Stage cycle: {' -> '.join(path + [name])}")
+        if name not in STAGES:
+            raise ValueError(f"Unknown stage: {name}")
+        state[name] = "visiting"
+        for dep in STAGES[name].get("after", []):
+            visit(dep, path + [name])
+        state[name] = "done"
+        order.append(name)
+
+    for name in names:
+        visit(name, [])
+    return order
+
+
+def load_state(state_file=STATE_FILE):
+    if not os.path.exists(state_file):
+        return {"files": {}, "stages": {}}
+    with open(state_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(state, state_file=STATE_FILE):
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
+    temp_file = state_file + ".tmp"
+    with open(temp_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(temp_file, state_file)
+
+
+def run_stage(name, log_dir=LOG_DIR, report_dir=REPORT_DIR, quiet=False):
+    # thread pool job: -> (return code, seconds, instrument report or None)
+    stage = STAGES[name]
+    os.makedirs(log_dir, exist_ok=True)
+    os.makedirs(report_dir, exist_ok=True)
+    report_file = os.path.join(report_dir, name + ".json")
+    if os.path.exists(report_file):
+        os.remove(report_file)
+    env = dict(os.environ, DATA_REPORT=report_file)
+    if quiet:
+        env["DATA_QUIET"] = "1"
+
+    start = time.perf_counter()
+    with open(os.path.join(log_dir, name + ".log"), "w", encoding="utf-8") as log:
+        result = subprocess.run([sys.executable] + stage["cmd"], cwd=data_path(stage["cwd"]),
+                                stdout=log, stderr=subprocess.STDOUT, env=env)
+    seconds = time.perf_counter() - start
+
+    stage_report = None
+    if os.path.exists(report_file):
+        with open(report_file, "r", encoding="utf-8") as f:
+            stage_report = json.load(f)
+    return result.returncode, seconds, stage_report
+
+
+def missing_outputs(name):
+    # declared plain-path outputs a stage exited 0 without writing
+    return [pattern for pattern in STAGES[name]["outputs"]
+            if not glob.has_magic(pattern) and not os.path.exists(data_path(pattern))]
+
+
+def log_tail(name, log_dir=LOG_DIR, lines=LOG_TAIL):
+    with open(os.path.join(log_dir, name + ".log"), "r", encoding="utf-8", errors="replace") as f:
+        return f.readlines()[-lines:]
+
+
+def run_pipeline(targets=None, fetch=False, force=False, dry_run=False, quiet=False, workers=WORKERS,
+                 state_file=STATE_FILE, log_dir=LOG_DIR, report_dir=REPORT_DIR):
+    # -> {stage: {"status", "seconds"}}; status is one of ran, skipped,
+    # offline (network stage not fetched), failed, blocked (upstream failed),
+    # stale (would run, with --dry-run)
+    order = topological_order(targets or list(STAGES))
+    named = set(targets or [])
+    state = load_state(state_file)
+    hashes = FileHashes(state["files"])
+    results = {}
+    keys = {}
+    running = {}
+    started = time.perf_counter()
+
+    def ready(name):
+        return name not in results and name not in running.values() and all(
+            dep not in order or results.get(dep, {}).get("status") in ("ran", "skipped", "offline", "stale")
+            for dep in STAGES[name].get("after", []))
+
+    def blocked(name):
+        return any(results.get(dep, {}).get("status") in ("failed", "blocked")
+                   for dep in STAGES[name].get("after", []))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while len(results) < len(order):
+            for name in order:
+                if name in results or name in running.values():
+                    continue
+                if blocked(name):
+                    results[name] = {"status": "blocked", "seconds": 0.0}
+                    print(f"  {name}: blocked by a failed upstream stage")
+                    continue
+                if not ready(name):
+                    continue
+                stage = STAGES[name]
+                previous = state["stages"].get(name, {})
+                if stage.get("network") and not (fetch or name in named):
+                    results[name] = {"status": "offline", "seconds": 0.0}
+                    continue
+                keys[name] = stage_key(name, hashes)
+                fresh = (not stage.get("network") and not force and previous.get("key") == keys[name]
+                         and previous.get("outputs") == outputs_key(name, hashes))
+                if fresh or dry_run:
+                    results[name] = {"status": "skipped" if fresh else "stale", "seconds": 0.0}
+                    continue
+                print(f"  {name}: running {' '.join(stage['cmd'])}")
+                running[pool.submit(run_stage, name, log_dir, report_dir, quiet)] = name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                code, seconds, stage_report = future.result()
+                missing = missing_outputs(name) if code == 0 else []
+                if code == 0 and not missing:
+                    state["stages"][name] = {"key": keys[name], "outputs": outputs_key(name, hashes),
+                                             "seconds": round(seconds, 3)}
+                    save_state(state, state_file)
+                    results[name] = {"status": "ran", "seconds": seconds, "report": stage_report}
+                    print(f"  {name}: done in {seconds:.1f}s")
+                elif missing:
+                    results[name] = {"status": "failed", "seconds": seconds, "report": stage_report}
+                    print(f"  {name}: failed, exited 0 without writing {', '.join(missing)}; "
+                          f"end of {os.path.join(log_dir, name + '.log')}:")
+                    print("".join("    " + line for line in log_tail(name, log_dir)), end="")
+                else:
+                    results[name] = {"status": "failed", "seconds": seconds, "report": stage_report}
+                    print(f"  {name}: failed (exit {code}), end of {os.path.join(log_dir, name + '.log')}:")
+                    print("".join("    " + line for line in log_tail(name, log_dir)), end="")
+
+    wall = time.perf_counter() - started
+    state["last_run"] = {"wall_seconds": round(wall, 3),
+                         "stages": {name: {"status": r["status"], "seconds": round(r["seconds"], 3),
+                                           "report": r.get("report")}
+                                    for name, r in results.items()}}
+    if not dry_run:
+        save_state(state, state_file)
+    report(order, results, wall)
+    return results
+
+
+def report(order, results, wall):
+    # peak MB is the stage process's high-water mark (pool workers included)
+    print(f"{'stage':<18} {'status':<8} {'seconds':>8} {'peak MB':>8}  slowest timer")
+    for name in order:
+        r = results[name]
+        stage_report = r.get("report") or {}
+        peak = max(stage_report.get("peak_rss_mb") or 0, stage_report.get("children_peak_rss_mb") or 0)
+        timers = stage_report.get("timers") or {}
+        slowest = max(timers.items(), key=lambda item: item[1]["seconds"], default=None)
+        print(f"{name:<18} {r['status']:<8} {r['seconds']:>8.2f} {peak or '':>8}  "
+              + (f"{slowest[0]} {slowest[1]['seconds']:.2f}s" if slowest else ""))
+    ran = [r for r in results.values() if r["status"] == "ran"]
+    print(f"{len(ran)} ran, {sum(r['status'] == 'skipped' for r in results.values())} up to date; "
+          f"{sum(r['seconds'] for r in ran):.1f}s of stage time in {wall:.1f}s")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    workers = WORKERS
+    if "--workers" in args:
+        i = args.index("--workers")
+        workers = int(args[i + 1])
+        del args[i:i + 2]
+    flags = {a for a in args if a.startswith("--")}
+    results = run_pipeline([a for a in args if not a.startswith("--")], fetch="--fetch" in flags,
+                           force="--force" in flags, dry_run="--dry-run" in flags, quiet="--quiet" in flags,
+                           workers=workers)
+    sys.exit(1 if any(r["status"] in ("failed", "blocked") for r in results.values()) else 0)
@@ -0,0 +1,110 @@
+import json
+import sys
+from array import array
+
+from course_codes import resolve
+
+# In-memory lookup engine over combine_prof's professor_courses.json.
+# Professors, courses and terms are interned to small integer ids and every
+# relation is stored both ways as compact integer arrays, so each of
+#   professor -> courses, course -> professors,
+#   term -> offerings, (professor, course) -> terms
+# is a single list/dict lookup instead of a scan over every professor.
+# Courses are keyed by their resolved code (course_codes.resolve), so a
+# cross-listed or renumbered course is one course here and joins with the
+# RMP ratings, which are resolved the same way; queries take either code.
+
+INDEX_FILE = "../professor_data/professor_courses.json"
+
+
+class ProfessorIndex:
+
+    def __init__(self, professor_courses):
+        # professor_courses is the instructor -> term -> [course_ids] mapping
+        # build_professor_index writes
+        self.professors = []
+        self.courses = []
+        self.terms = sorted({term for terms in professor_courses.values() for term in terms})
+
+        self.professor_ids = {}
+        self.course_ids = {}
+        self.term_ids = {term: i for i, term in enumerate(self.terms)}
+
+        prof_courses = []
+        course_profs = {}
+        term_courses = [set() for _ in self.terms]
+        self.pair_terms = {}
+
+        for name, terms in professor_courses.items():
+            prof_id = self.intern_professor(name)
+            seen = set()
+            for term, course_list in sorted(terms.items()):
+                term_id = self.term_ids[term]
+                for code in course_list:
+                    course_id = self.intern_course(resolve(code))
+                    term_courses[term_id].add(course_id)
+
+                    pair = self.pair_terms.setdefault((prof_id, course_id), array("H"))
+                    if not pair or pair[-1] != term_id:
+                        pair.append(term_id)
+
+                    if course_id not in seen:
+                        seen.add(course_id)
+                        course_profs.setdefault(course_id, array("I")).append(prof_id)
+            prof_courses.append(array("I", sorted(seen)))
+
+        self.prof_courses = prof_courses
+        self.course_profs = [course_profs.get(i, array("I")) for i in range(len(self.courses))]
+        self.term_courses = [array("I", sorted(ids)) for ids in term_courses]
+
+    def intern_professor(self, name):
+        if name not in self.professor_ids:
+            self.professor_ids[name] = len(self.professors)
+            self.professors.append(name)
+        return self.professor_ids[name]
+
+    def intern_course(self, code):
+        if code not in self.course_ids:
+            self.course_ids[code] = len(self.courses)
+            self.courses.append(code)
+        return self.course_ids[code]
+
+    # --- Query API ---
+
+    def courses_for(self, professor):
+        prof_id = self.professor_ids.get(professor)
+        if prof_id is None:
+            return []
+        return [self.courses[i] for i in self.prof_courses[prof_id]]
+
+    def professors_for(self, course):
+        course_id = self.course_ids.get(resolve(course))
+        if course_id is None:
+            return []
+        return [self.professors[i] for i in self.course_profs[course_id]]
+
+    def offerings(self, term):
+        # courses taught by at least one named instructor that term
+        term_id = self.term_ids.get(term)
+        if term_id is None:
+            return []
+        return [self.courses[i] for i in self.term_courses[term_id]]
+
+    def terms_for(self, professor, course):
+        key = (self.professor_ids.get(professor), self.course_ids.get(resolve(course)))
+        return [self.terms[i] for i in self.pair_terms.get(key, ())]
+
+
+def load_index(index_file=INDEX_FILE):
+    with open(index_file, "r", encoding="utf-8") as f:
+        return ProfessorIndex(json.load(f))
+
+
+if __name__ == "__main__":
+    index = load_index()
+    print(f"{len(index.professors)} professors, {len(index.courses)} courses, {len(index.terms)} terms")
+
+    # python prof_index.py CSCI-1200 -> who taught it and when
+    for code in sys.argv[1:]:
+        for prof in index.professors_for(code):
+            print(f"{prof}: {', '.join(index.terms_for(prof, code))}")
@@ -0,0 +1,375 @@
+import asyncio
+import csv
+import gzip
+import hashlib
+import json
+import sys
+import tempfile
+import traceback
+from urllib.parse import urlsplit, parse_qs, quote, unquote
+
+from prof_index import ProfessorIndex
+from course_codes import resolve
+from name_match import load_crosswalk
+
+# Read-only HTTP API for the app (services/api.ts points at localhost:4000).
+# Everything is loaded into memory once at startup and every response body is
+# built once per distinct request and cached together with its ETag and gzip
+# encoding, so a screen load is one local request instead of a chain of
+# single-row Supabase queries.
+
+HOST = "0.0.0.0"
+PORT = 4000
+
+PROFESSOR_COURSES_FILE = "../professor_data/professor_courses.json"
+CATALOG_FILE = "../class/catalog.json"
+DEPARTMENTS_FILE = "../professor_data/departments.json"
+# the combined ratings table (pipeline.py ratings_table / rmp_csv_convert.py
+# compacted), not the one-professor tempcsv.csv
+RATINGS_FILE = "../temps/rmp_ratings.csv"
+# RMP names ("Dawn Cairns-Weaver") -> QuACS names ("Dawn M. Cairns-Weaver")
+CROSSWALK_FILE = "../professor_data/name_crosswalk.csv"
+
+# batched keys: ?name=a&name=b or ?name=a|b; never "," since professor names
+# are often "Last, First"
+KEY_SEPARATOR = "|"
+
+GZIP_MIN_BYTES = 1024
+CACHE_SIZE = 4096
+
+
+def load_data(ratings_file=RATINGS_FILE, crosswalk_file=CROSSWALK_FILE):
+    with open(PROFESSOR_COURSES_FILE, "r", encoding="utf-8") as f:
+        professor_courses = json.load(f)
+    with open(CATALOG_FILE, "r", encoding="utf-8") as f:
+        catalog = json.load(f)
+    with open(DEPARTMENTS_FILE, "r", encoding="utf-8") as f:
+        departments = json.load(f)
+
+    # prof_name -> class_code -> rating row, same columns as the ratings table
+    ratings = {}
+    try:
+        with open(ratings_file, "r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                ratings.setdefault(row["prof_name"], {})[row["class_code"]] = {
+                    "num_ratings": int(row["num_ratings"]),
+                    "rating": float(row["rating"]),
+                    "diff": float(row["diff"])
+                }
+    except FileNotFoundError:
+        print(f"⚠️ No ratings table at {ratings_file}, serving without ratings")
+
+    # ratings are keyed by RMP name, everything else by QuACS name: re-key the
+    # ratings through the crosswalk, and keep the map so a request may use
+    # either spelling
+    quacs_names = {}
+    try:
+        quacs_names = {row["rmp_name"]: row["quacs_name"] for row in load_crosswalk(crosswalk_file).values()
+                       if row["rmp_name"] and row["quacs_name"]}
+    except FileNotFoundError:
+        print(f"⚠️ No name crosswalk at {crosswalk_file}, joining ratings by exact name")
+    joined = {}
+    for name, classes in ratings.items():
+        joined.setdefault(quacs_names.get(name, name), {}).update(classes)
+
+    return {
+        "professor_courses": professor_courses,
+        "index": ProfessorIndex(professor_courses),
+        "catalog": catalog,
+        "departments": departments,
+        "ratings": joined,
+        "quacs_names": quacs_names
+    }
+
+
+# --- Handlers ---
+# Each handler takes the loaded data, the path parameter (or None) and the
+# list of requested keys, and returns something JSON serialisable. Batched
+# lookups accept repeated (?code=A&code=B) or KEY_SEPARATOR separated keys.
+# Course codes are joined through course_codes.resolve, like the index and the
+# ratings, and professor names through the crosswalk; results stay keyed by
+# the code or name that was asked for.
+
+def quacs_name(data, name):
+    return data["quacs_names"].get(name, name)
+
+
+def get_professors(data, names):
+    index = data["index"]
+    result = {}
+    for name in names:
+        quacs = quacs_name(data, name)
+        if quacs in data["professor_courses"] or quacs in data["ratings"]:
+            result[name] = {
+                "terms": data["professor_courses"].get(quacs, {}),
+                "courses": index.courses_for(quacs),
+                "ratings": data["ratings"].get(quacs, {})
+            }
+    return result
+
+
+def get_courses(data, codes):
+    result = {}
+    for code in codes:
+        info = data["catalog"].get(code) or data["catalog"].get(resolve(code))
+        professors = data["index"].professors_for(code)
+        if info is None and not professors:
+            continue
+        info = info or {}
+        result[code] = {
+            "course_code": code,
+            "course_name": info.get("name", ""),
+            "course_desc": info.get("description", ""),
+            "professors": professors
+        }
+    return result
+
+
+def get_course_professors(data, codes):
+    # professors for each course with their rating for that course, the one
+    # call that replaces getProfessorsForCourse's query-per-rating loop
+    index = data["index"]
+    return {
+        code: [
+            {
+                "full_name": prof,
+                "terms": index.terms_for(prof, code),
+                "rating": data["ratings"].get(prof, {}).get(resolve(code))
+            }
+            for prof in index.professors_for(code)
+        ]
+        for code in codes
+    }
+
+
+def get_ratings(data, names):
+    return {name: data["ratings"][quacs_name(data, name)] for name in names
+            if quacs_name(data, name) in data["ratings"]}
+
+
+def get_departments(data, names):
+    if not names:
+        return data["departments"]
+    wanted = set(names)
+    return [d for d in data["departments"] if d["Name"] in wanted]
+
+
+ROUTES = {
+    "/professors": ("name", get_professors),
+    "/courses": ("code", get_courses),
+    "/courses/professors": ("code", get_course_professors),
+    "/ratings": ("name", get_ratings),
+    "/departments": ("name", get_departments),
+}
+
+
+# --- HTTP ---
+
+def request_keys(query, param):
+    keys = []
+    for value in parse_qs(query).get(param, []):
+        keys.extend(k.strip() for k in value.split(KEY_SEPARATOR) if k.strip())
+    return keys
+
+
+def build_response(data, path, query):
+    # returns (status, body, etag, gzipped body or None)
+    route = ROUTES.get(path.rstrip("/") or "/")
+    if route is not None:
+        keys = request_keys(query, route[0])
+    else:
+        # /courses/CSCI-1200 and /professors/<name> style single lookups; the
+        # key is taken whole
+        base, _, key = path.rstrip("/").rpartition("/")
+        route = ROUTES.get(base)
+        if route is None or not key.strip():
+            return 404, b'{"error": "not found"}', None, None
+        keys = [key.strip()]
+
+    handler = route[1]
+    result = handler(data, keys)
+    body = json.dumps(result, ensure_ascii=False).encode("utf-8")
+    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+    gzipped = gzip.compress(body) if len(body) >= GZIP_MIN_BYTES else None
+    return 200, body, etag, gzipped
+
+
+class ResponseCache:
+
+    def __init__(self, data, size=CACHE_SIZE):
+        self.data = data
+        self.size = size
+        self.entries = {}
+
+    def get(self, path, query):
+        key = (path, query)
+        if key not in self.entries:
+            if len(self.entries) >= self.size:
+                # drop the oldest entry, dicts keep insertion order
+                del self.entries[next(iter(self.entries))]
+            self.entries[key] = build_response(self.data, path, query)
+        return self.entries[key]
+
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error"}
+
+
+def format_response(status, body, headers):
+    lines = [f"HTTP/1.1 {status} {REASONS[status]}"]
+    headers = {
+        "Content-Type": "application/json; charset=utf-8",
+        "Access-Control-Allow-Origin": "*",
+        "Content-Length": str(len(body)),
+        **headers
+    }
+    lines.extend(f"{k}: {v}" for k, v in headers.items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def handle_connection(reader, writer, cache):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, target, version = request_line.decode("latin-1").split()
+            except ValueError:
+                writer.write(format_response(400, b"", {"Connection": "close"}))
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+
+            if method not in ("GET", "HEAD"):
+                response = format_response(405, b"", {"Allow": "GET, HEAD"})
+            else:
+                url = urlsplit(target)
+                status, body, etag, gzipped = cache.get(unquote(url.path), url.query)
+
+                extra = {}
+                if etag:
+                    extra["ETag"] = etag
+                    extra["Cache-Control"] = "no-cache"
+                if etag and headers.get("if-none-match") == etag:
+                    status, body = 304, b""
+                elif gzipped is not None and "gzip" in headers.get("accept-encoding", ""):
+                    body = gzipped
+                    extra["Content-Encoding"] = "gzip"
+                    extra["Vary"] = "Accept-Encoding"
+
+                response = format_response(status, body, extra)
+                if method == "HEAD":
+                    response = response[:len(response) - len(body)]
+
+            writer.write(response)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except ConnectionError:
+        pass
+    except Exception:
+        # a bug in a handler or a malformed request the parsing above let
+        # through: answer 500 instead of dropping the connection silently
+        traceback.print_exc()
+        try:
+            writer.write(format_response(500, b'{"error": "internal error"}', {"Connection": "close"}))
+            await writer.drain()
+        except ConnectionError:
+            pass
+    finally:
+        writer.close()
+
+
+async def serve(host=HOST, port=PORT, ratings_file=RATINGS_FILE):
+    cache = ResponseCache(load_data(ratings_file))
+    server = await asyncio.start_server(
+        lambda r, w: handle_connection(r, w, cache), host, port
+    )
+    print(f"Serving read API on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def check_crosswalk_join():
+    # a rating under an RMP spelling shows up under the QuACS name it maps to
+    data = load_data()
+    professor = next(name for name in data["professor_courses"]
+                     if len(name.split()) > 2 and data["index"].courses_for(name))
+    code = data["index"].courses_for(professor)[0]
+    rmp_name = f"{professor.split()[0]} {professor.split()[-1]}"
+    with tempfile.TemporaryDirectory() as tmp:
+        ratings_file, crosswalk_file = f"{tmp}/ratings.csv", f"{tmp}/crosswalk.csv"
+        with open(ratings_file, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows([["prof_name", "class_code", "num_ratings", "rating", "diff"],
+                                     [rmp_name, code, 3, 4.5, 2.0]])
+        with open(crosswalk_file, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows([["quacs_name", "catalog_name", "rmp_name", "image_slug"],
+                                     [professor, "", rmp_name, ""]])
+        data = load_data(ratings_file, crosswalk_file)
+
+    rating = {"num_ratings": 3, "rating": 4.5, "diff": 2.0}
+    assert get_professors(data, [professor])[professor]["ratings"] == {code: rating}
+    assert get_professors(data, [rmp_name])[rmp_name]["terms"] == data["professor_courses"][professor]
+    course = {p["full_name"]: p["rating"] for p in get_course_professors(data, [code])[code]}
+    assert course[professor] == rating, course
+    print(f"✅ {rmp_name} (RMP) -> {professor} (QuACS): {code} rated")
+
+
+def check_server_error():
+    # a handler that raises gets a 500 back, not a dropped connection
+    class BrokenCache:
+        def get(self, path, query):
+            raise KeyError(path)
+
+    async def request():
+        server = await asyncio.start_server(lambda r, w: handle_connection(r, w, BrokenCache()), "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"GET /courses?code=CSCI-1200 HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        await writer.drain()
+        status_line = await reader.readline()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return status_line
+
+    status_line = asyncio.run(request())
+    assert status_line.startswith(b"HTTP/1.1 500"), status_line
+    print(f"✅ failing handler (traceback above is the server log) -> {status_line.decode().strip()}")
+
+
+def run_check():
+    # batched and single lookups of "Last, First" department names
+    data = load_data()
+    first, second = data["departments"][0], data["departments"][1]
+    for path, query, expected in [
+        ("/departments", "name=" + quote(first["Name"]), [first]),
+        ("/departments", f"name={quote(first['Name'])}&name={quote(second['Name'])}", [first, second]),
+        ("/departments", "name=" + quote(first["Name"] + KEY_SEPARATOR + second["Name"]), [first, second]),
+        ("/departments/" + first["Name"], "", [first]),
+    ]:
+        status, body, _, _ = build_response(data, path, query)
+        result = json.loads(body)
+        assert status == 200 and result == expected, (path, query, result)
+        print(f"✅ {path}?{query} -> {len(result)} department(s)")
+    check_crosswalk_join()
+    check_server_error()
+
+
+if __name__ == "__main__":
+    # python read_api.py [port] [ratings csv] | check
+    if sys.argv[1:2] == ["check"]:
+        run_check()
+        sys.exit()
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else PORT
+    ratings_file = sys.argv[2] if len(sys.argv) > 2 else RATINGS_FILE
+    asyncio.run(serve(port=port, ratings_file=ratings_file))
@@ -0,0 +1,125 @@
+import csv
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from rmp_script import parse_reviews, summarize_reviews, build_result
+import instrument
+import sql_export
+
+# Batch version of the rmp_script.py -> rmp_csv_convert.py workflow.
+# Instead of one professor per run through temps/full_names.txt, point it at
+# a directory of saved review panes named after the professor
+# ("James Kilduff.html", ".txt" works too) and every page is parsed in a
+# process pool. The output is one ratings CSV for the ratings table, one SQL
+# file updating every professor and upserting every rating row (see
+# sql_export.py), the ratings again as a psql COPY block, and one
+# prof_rate.json holding all of them for anything that still needs to merge
+# classes by hand.
+#
+#   python rmp_batch.py <pages dir> [workers]
+
+PAGES_DIR = "../temps/pages"
+CSV_FILE = "../temps/batch_ratings.csv"
+SQL_FILE = "../temps/batch_upsert.sql"
+COPY_FILE = "../temps/batch_ratings_copy.sql"
+JSON_FILE = "../temps/batch_prof_rate.json"
+
+FACULTY_URL = "https://faculty.rpi.edu/"
+RMP_URL = "https://www.ratemyprofessors.com/professor/"
+
+
+def professor_from_path(path):
+    return os.path.splitext(os.path.basename(path))[0].strip()
+
+
+def process_page(path):
+    # worker: one saved review pane -> summary for that professor. A page
+    # that can't be read or parsed (an "N/A" rating, a truncated save) comes
+    # back as an error entry so the rest of the batch still gets written.
+    professor_name = professor_from_path(path)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            prof_num, reviews = parse_reviews(f.read())
+    except (OSError, ValueError) as e:
+        return {"name": professor_name, "file": path, "error": f"{type(e).__name__}: {e}"}
+    if not reviews:
+        return {"name": professor_name, "file": path, "error": "no reviews found"}
+
+    class_reviews, count_num_reviews, average_rat, average_diff = summarize_reviews(reviews)
+    return {
+        "name": professor_name,
+        "rating": average_rat,
+        "difficulty": average_diff,
+        "num_ratings": count_num_reviews,
+        # same guess fac_scrap.py makes from a name
+        "faculty_url": FACULTY_URL + professor_name.lower().replace(" ", "-"),
+        "rmp_url": RMP_URL + prof_num,
+        "classes": build_result(professor_name, class_reviews, "new")[professor_name]
+    }
+
+
+def rating_rows(summary):
+    # rows for the ratings table, averaged per class like rmp_csv does
+    for class_code, info in summary["classes"].items():
+        if class_code == "temp":
+            continue
+        tot_over, tot_diff, num = info
+        yield [summary["name"], class_code, num, round(tot_over / num, 1), round(tot_diff / num, 1)]
+
+
+def professor_row(summary):
+    return [summary["name"], summary["rating"], summary["difficulty"],
+            summary["num_ratings"], summary["faculty_url"], summary["rmp_url"]]
+
+
+def write_outputs(summaries, csv_file=CSV_FILE, sql_file=SQL_FILE, json_file=JSON_FILE, copy_file=COPY_FILE):
+    # ratings CSV, upsert SQL, COPY block and prof_rate.json for summaries
+    # shaped like process_page's (rmp_compacter.py writes through here too)
+    ratings = [row for summary in summaries for row in rating_rows(summary)]
+    with open(csv_file, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(sql_export.RATING_COLUMNS)
+        writer.writerows(ratings)
+
+    if summaries:
+        with open(sql_file, "w", encoding="utf-8") as f:
+            f.write(sql_export.ratings_upsert_sql([professor_row(s) for s in summaries], ratings))
+        with open(copy_file, "w", encoding="utf-8") as f:
+            f.write(sql_export.copy_sql("ratings", sql_export.RATING_COLUMNS, ratings))
+
+    with open(json_file, "w", encoding="utf-8") as f:
+        json.dump({s["name"]: s["classes"] for s in summaries}, f, indent=2)
+
+
+def run_batch(pages_dir=PAGES_DIR, workers=None, csv_file=CSV_FILE, sql_file=SQL_FILE,
+              json_file=JSON_FILE, copy_file=COPY_FILE):
+    pages = sorted(glob.glob(os.path.join(pages_dir, "*.html")) + glob.glob(os.path.join(pages_dir, "*.txt")))
+    if not pages:
+        print(f"No saved review pages found in {pages_dir}")
+        return []
+
+    with instrument.timer("parse_pages"), ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(process_page, pages, chunksize=max(1, len(pages) // 64)))
+    instrument.count("pages", len(pages))
+
+    summaries = [r for r in results if "error" not in r]
+    failed = [r for r in results if "error" in r]
+    instrument.count("failed_pages", len(failed))
+    for r in failed:
+        print(f"  skipped {r['file']}: {r['error']}")
+
+    with instrument.timer("write_outputs"):
+        write_outputs(summaries, csv_file, sql_file, json_file, copy_file)
+    print(f"Processed {len(summaries)} of {len(pages)} professors -> {csv_file}, {sql_file}, {copy_file}, {json_file}")
+    if failed:
+        print(f"{len(failed)} pages failed, see above")
+    return summaries
+
+
+if __name__ == "__main__":
+    pages_dir = sys.argv[1] if len(sys.argv) > 1 else PAGES_DIR
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    run_batch(pages_dir, workers)
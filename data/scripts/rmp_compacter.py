@@ -1,85 +1,419 @@
+import base64
+import glob
 import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 
-def compact_rmp_data(raw_json):
-    # Parse the JSON if it's a string
-    if isinstance(raw_json, str):
-        data = json.loads(raw_json)
-    else:
-        data = raw_json
-
-    # The main teacher entry (RateMyProfessors encodes it weirdly)
-    for key, val in data.items():
-        if key.startswith("VGVhY2hlci"):
-            teacher = val
-            break
-
-    # Extract key info
-    first_name = teacher.get("firstName", "")
-    last_name = teacher.get("lastName", "")
-    full_name = f"{first_name} {last_name}".strip()
-    legacy_id = teacher.get("legacyId")
-    overall = teacher.get("avgRating")
-    diff = teacher.get("avgDifficulty")
-    numreviews = teacher.get("numRatings")
-
-    # Construct RateMyProfessors URL
-    rmp_url = f"https://www.ratemyprofessors.com/professor/{legacy_id}"
-
-    # Now get the ratings list
-    ratings_conn_ref = teacher.get("__RatingsList_ratings_connection", {}).get("__ref")
-    ratings_ref = []
-
-    if ratings_conn_ref and ratings_conn_ref in raw_json:
-        ratings_ref = (
-            raw_json[ratings_conn_ref]
-            .get("edges", {})
-            .get("__refs", [])
-        )
+from course_codes import resolve
+import instrument
+import rmp_batch
 
+# --- Relay payload ingester ---
+# RMP professor pages carry their data as a Relay store: one flat
+# {id: record} map where records point at each other with {"__ref": id}
+# and lists of them with {"__refs": [...]}. A Teacher record links to its
+# ratings connection, the connection lists edge ids, every edge's node is a
+# Rating with class / helpfulRating / difficultyRating.
+#
+# The GraphQL responses the page fetches ("load more", search) are the same
+# records before Relay normalizes them: {"data": {"node": Teacher}} or
+# {"data": {"search": {"teachers": {"edges": [{"node": Teacher}]}}}}, with
+# the ratings nested inline as ratings.edges[].node instead of by ref.
+#
+# Instead of copying the review pane after clicking "load more" until it
+# stops, save the payloads themselves (the window.__RELAY_STORE__ script,
+# or the GraphQL responses). Files may hold any number of documents back to
+# back: concatenated, one per line (NDJSON), with the
+# "window.__RELAY_STORE__ = " prefix and trailing ";" left in. Files are
+# read in chunks, a document at a time, and every Teacher in every store or
+# response is extracted; the store dict itself is the index refs are
+# resolved through. The same professor in several payloads (e.g. a later
+# "load more" page) is merged by RMP id, with ratings deduplicated by rating
+# id. Documents that are neither are counted and reported as skipped.
+#
+#   python rmp_compacter.py <payload file or dir> [workers]
+#   python rmp_compacter.py check [professors]
 
-    course_dict = {}
+PAYLOADS_DIR = "../temps/relay"
+PAYLOAD_PATTERNS = ("*.json", "*.ndjson", "*.jsonl", "*.js", "*.txt")
+COMPACT_FILE = "../temps/rmp_compacted.json"
+RMP_TEACHERS_FILE = "../professor_data/rmp_teachers.json"
 
-    # Traverse all ratings
-    for ref in ratings_ref:
-        rating = data[ref]["node"]
-        rating_obj = data[rating["__ref"]]
+CHUNK_SIZE = 1 << 20
+RATINGS_CONNECTION = "__RatingsList_ratings_connection"
+RMP_URL = "https://www.ratemyprofessors.com/professor/"
 
-        course = rating_obj.get("class")
-        helpful = rating_obj.get("helpfulRating")
-        difficulty = rating_obj.get("difficultyRating")
 
-        if not course or helpful is None or difficulty is None:
+def iter_documents(f, chunk_size=CHUNK_SIZE):
+    # JSON documents from a text stream, skipping whatever is between them
+    # (whitespace, newlines, ";", "window.__RELAY_STORE__ = "). The buffer
+    # only grows while a document is incomplete, so memory stays at about
+    # the largest document plus a chunk.
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    eof = False
+    while True:
+        start = buf.find("{", pos)
+        if start < 0:
+            if eof:
+                return
+            buf, pos = f.read(chunk_size), 0
+            eof = not buf
             continue
+        try:
+            doc, pos = decoder.raw_decode(buf, start)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            # read at least as much again, so one big store is not
+            # reparsed once per chunk
+            more = f.read(max(chunk_size, len(buf) - start))
+            eof = not more
+            buf, pos = buf[start:] + more, 0
+            continue
+        yield doc
+
+
+def is_store(doc):
+    return isinstance(doc, dict) and "client:root" in doc
+
+
+def is_response(doc):
+    # a GraphQL response ({"data": ...}); errors-only responses have no data
+    return isinstance(doc, dict) and isinstance(doc.get("data"), dict)
+
+
+def teacher_ids(store):
+    return [key for key, record in store.items()
+            if isinstance(record, dict) and record.get("__typename") == "Teacher"]
+
+
+def teacher_ratings(store, teacher):
+    # -> {rating id: [class, helpful, difficulty]} across every ratings
+    # connection the store has for the teacher (the paginated list and the
+    # first page are separate connections over the same ratings)
+    ratings = {}
+    for field, value in teacher.items():
+        if field != RATINGS_CONNECTION and not field.startswith("ratings("):
+            continue
+        connection = store.get(value.get("__ref")) if isinstance(value, dict) else None
+        if not connection:
+            continue
+        for edge_ref in (connection.get("edges") or {}).get("__refs", []):
+            node = (store.get(edge_ref) or {}).get("node") or {}
+            rating = store.get(node.get("__ref"))
+            if not rating:
+                continue
+            course = rating.get("class")
+            helpful = rating.get("helpfulRating")
+            difficulty = rating.get("difficultyRating")
+            if not course or helpful is None or difficulty is None:
+                continue
+            ratings[rating.get("__id", node["__ref"])] = [course, helpful, difficulty]
+    return ratings
+
+
+def teacher_record(teacher, ratings):
+    return {
+        "legacy_id": teacher.get("legacyId"),
+        "name": f"{teacher.get('firstName', '')} {teacher.get('lastName', '')}".strip(),
+        "department": teacher.get("department"),
+        "overall": teacher.get("avgRating"),
+        "diff": teacher.get("avgDifficulty"),
+        "numreviews": teacher.get("numRatings"),
+        "ratings": ratings
+    }
 
+
+def store_records(store):
+    return [teacher_record(store[key], teacher_ratings(store, store[key])) for key in teacher_ids(store)]
+
+
+def response_teachers(value):
+    # every Teacher object nested anywhere in a response's data
+    if isinstance(value, dict):
+        if value.get("__typename") == "Teacher":
+            yield value
+            return
+        value = value.values()
+    elif not isinstance(value, list):
+        return
+    for item in value:
+        yield from response_teachers(item)
+
+
+def response_ratings(teacher):
+    # the same {rating id: [class, helpful, difficulty]} as teacher_ratings,
+    # from the inline ratings connection(s) of a response Teacher
+    ratings = {}
+    for field, connection in teacher.items():
+        if not (field == "ratings" or field.startswith("ratings(")) or not isinstance(connection, dict):
+            continue
+        for edge in connection.get("edges") or []:
+            rating = (edge or {}).get("node") or {}
+            course = rating.get("class")
+            helpful = rating.get("helpfulRating")
+            difficulty = rating.get("difficultyRating")
+            if not course or helpful is None or difficulty is None or not rating.get("id"):
+                continue
+            ratings[rating["id"]] = [course, helpful, difficulty]
+    return ratings
+
+
+def response_records(response):
+    return [teacher_record(teacher, response_ratings(teacher)) for teacher in response_teachers(response["data"])]
+
+
+def compact_entry(record):
+    # the rmp_teachers.json shape: CODE -> [[helpful, difficulty], ...]
+    course_dict = {}
+    for course, helpful, difficulty in record["ratings"].values():
         # Clean course code like "COMM4962" -> "COMM-4962"
-        course = course.strip().upper().replace(" ", "")
-        if not "-" in course:
-            course = course[:4] + "-" + course[4:]
-
-        # Add to course dict
-        course_dict.setdefault(course, []).append([helpful, difficulty])
-
-    # Build compact entry
-    compact_entry = {
-        "rmpurl": rmp_url,
-        "overall": overall,
-        "diff": diff,
-        "numreviews": numreviews,
+        course_dict.setdefault(resolve(course), []).append([helpful, difficulty])
+
+    return {
+        "rmpurl": f"{RMP_URL}{record['legacy_id']}",
+        "overall": record["overall"],
+        "diff": record["diff"],
+        "numreviews": record["numreviews"],
         **course_dict
     }
 
-    # Final compacted dict
-    return {full_name: compact_entry}
 
+def compact_rmp_data(raw_json):
+    # one saved store (text or parsed) -> {full name: compact entry} for
+    # every teacher in it
+    data = json.loads(raw_json) if isinstance(raw_json, str) else raw_json
+    return {record["name"]: compact_entry(record) for record in store_records(data)}
+
+
+def ingest_file(path, chunk_size=CHUNK_SIZE):
+    # process pool job: -> (teacher records, stores read, responses read,
+    # other documents)
+    records = []
+    stores = responses = others = 0
+    with open(path, "r", encoding="utf-8") as f:
+        for doc in iter_documents(f, chunk_size):
+            if is_store(doc):
+                stores += 1
+                records.extend(store_records(doc))
+            elif is_response(doc):
+                responses += 1
+                records.extend(response_records(doc))
+            else:
+                others += 1
+    return records, stores, responses, others
 
-# Example usage
-if __name__ == "__main__":
-    with open("tempfile.json", "r", encoding="utf-8") as f:
-        raw_json = f.read()
 
-    compacted = compact_rmp_data(raw_json)
+def merge_records(records):
+    # by RMP id (name when there is none); later payloads win for the
+    # averages, ratings are the union
+    merged = {}
+    for record in records:
+        key = record["legacy_id"] or record["name"]
+        if key in merged:
+            record = {**record, "ratings": {**merged[key]["ratings"], **record["ratings"]}}
+        merged[key] = record
+    return list(merged.values())
 
-    with open("compacted_maurice.json", "w", encoding="utf-8") as f:
-        json.dump(compacted, f, indent=2)
 
-    print("Compacted data saved to compacted_maurice.json")
\ No newline at end of file
+def payload_files(path):
+    if os.path.isfile(path):
+        return [path]
+    return sorted({p for pattern in PAYLOAD_PATTERNS for p in glob.glob(os.path.join(path, pattern))})
+
+
+def ingest(paths, workers=None, chunk_size=CHUNK_SIZE):
+    # -> (merged teacher records, stats)
+    results = []
+    if len(paths) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(ingest_file, paths, [chunk_size] * len(paths)))
+    else:
+        results = [ingest_file(path, chunk_size) for path in paths]
+
+    records = [record for file_records, _, _, _ in results for record in file_records]
+    stats = {
+        "files": len(paths),
+        "stores": sum(r[1] for r in results),
+        "responses": sum(r[2] for r in results),
+        "other_documents": sum(r[3] for r in results),
+        "teachers_seen": len(records)
+    }
+    return merge_records(records), stats
+
+
+def batch_summary(record):
+    # rmp_batch.py's per professor summary, so the same CSV/SQL writers apply
+    class_reviews = {}
+    for course, helpful, difficulty in record["ratings"].values():
+        class_reviews.setdefault(resolve(course), []).append([helpful, difficulty])
+    classes = {"temp": "temp"}
+    for course, pairs in class_reviews.items():
+        classes[course] = [sum(p[0] for p in pairs), sum(p[1] for p in pairs), len(pairs)]
+    return {
+        "name": record["name"],
+        "rating": record["overall"],
+        "difficulty": record["diff"],
+        "num_ratings": record["numreviews"],
+        "faculty_url": rmp_batch.FACULTY_URL + record["name"].lower().replace(" ", "-"),
+        "rmp_url": f"{RMP_URL}{record['legacy_id']}",
+        "classes": classes
+    }
+
+
+def run_ingest(path=PAYLOADS_DIR, workers=None, compact_file=COMPACT_FILE):
+    paths = payload_files(path)
+    if not paths:
+        print(f"No saved Relay payloads found in {path}")
+        return []
+
+    start = time.perf_counter()
+    with instrument.timer("ingest"):
+        records, stats = ingest(paths, workers)
+    elapsed = time.perf_counter() - start
+    for stat, n in stats.items():
+        instrument.count(stat, n)
+    instrument.count("bytes_read", sum(os.path.getsize(p) for p in paths))
+
+    with open(compact_file, "w", encoding="utf-8") as f:
+        json.dump({record["name"]: compact_entry(record) for record in records}, f, indent=2)
+    summaries = [batch_summary(record) for record in records if record["ratings"]]
+    with instrument.timer("write_outputs"):
+        rmp_batch.write_outputs(summaries)
+
+    print(f"Read {stats['stores']} Relay stores and {stats['responses']} GraphQL responses from "
+          f"{stats['files']} files: {len(records)} professors "
+          f"({stats['teachers_seen']} before merging) in {elapsed:.2f}s "
+          f"({len(records) / max(elapsed, 1e-9):.0f}/s) -> {compact_file}, {rmp_batch.SQL_FILE}")
+    if stats["other_documents"]:
+        print(f"⚠️ Skipped {stats['other_documents']} documents that are neither a Relay store "
+              f"nor a GraphQL response with data")
+    return records
+
+
+# --- Self check ---
+# Synthetic stores shaped like the saved ones, written back to back in every
+# layout the reader accepts, read with a small chunk size; the real
+# rmp_teachers.json stores are checked against one-at-a-time parsing.
+
+def relay_id(typename, number):
+    return base64.b64encode(f"{typename}-{number}".encode("ascii")).decode("ascii")
+
+
+def synthetic_store(legacy_id, first_name, last_name, ratings, page_size=5):
+    # ratings: [(class, helpful, difficulty)]; the first page_size are also on
+    # the first-page connection, like in the real payloads
+    teacher_id = relay_id("Teacher", legacy_id)
+    connection = f"client:{teacher_id}:{RATINGS_CONNECTION}"
+    first_page = f"client:{teacher_id}:ratings(first:{page_size})"
+    store = {
+        "client:root": {"__id": "client:root", "__typename": "__Root",
+                        f"node(id:\"{teacher_id}\")": {"__ref": teacher_id}},
+        teacher_id: {
+            "__id": teacher_id, "__typename": "Teacher", "id": teacher_id, "legacyId": legacy_id,
+            "firstName": first_name, "lastName": last_name, "department": "Computer Science",
+            "numRatings": len(ratings),
+            "avgRating": round(sum(r[1] for r in ratings) / max(len(ratings), 1), 1),
+            "avgDifficulty": round(sum(r[2] for r in ratings) / max(len(ratings), 1), 1),
+            f"ratings(first:{page_size})": {"__ref": first_page},
+            RATINGS_CONNECTION: {"__ref": connection}
+        }
+    }
+    for conn, count in ((first_page, min(page_size, len(ratings))), (connection, len(ratings))):
+        edges = []
+        for i in range(count):
+            edge_id = f"{conn}:edges:{i}"
+            rating_id = relay_id("Rating", legacy_id * 1000 + i)
+            store[edge_id] = {"__id": edge_id, "__typename": "RatingEdge", "node": {"__ref": rating_id}}
+            edges.append(edge_id)
+        store[conn] = {"__id": conn, "__typename": "RatingConnection", "edges": {"__refs": edges}}
+    for i, (course, helpful, difficulty) in enumerate(ratings):
+        rating_id = relay_id("Rating", legacy_id * 1000 + i)
+        store[rating_id] = {"__id": rating_id, "__typename": "Rating", "class": course,
+                            "comment": "synthetic " * 40, "helpfulRating": helpful, "difficultyRating": difficulty}
+    return store
+
+
+def synthetic_response(legacy_id, first_name, last_name, ratings, search=False):
+    # the same teacher as a GraphQL response: data.node, or one search hit
+    teacher = {
+        "__typename": "Teacher", "id": relay_id("Teacher", legacy_id), "legacyId": legacy_id,
+        "firstName": first_name, "lastName": last_name, "department": "Computer Science",
+        "numRatings": len(ratings),
+        "avgRating": round(sum(r[1] for r in ratings) / max(len(ratings), 1), 1),
+        "avgDifficulty": round(sum(r[2] for r in ratings) / max(len(ratings), 1), 1),
+        "ratings": {"edges": [
+            {"node": {"__typename": "Rating", "id": relay_id("Rating", legacy_id * 1000 + i), "class": course,
+                      "helpfulRating": helpful, "difficultyRating": difficulty}}
+            for i, (course, helpful, difficulty) in enumerate(ratings)
+        ]}
+    }
+    if search:
+        return {"data": {"search": {"teachers": {"edges": [{"cursor": "YXJyYXljb25uZWN0aW9uOjA=", "node": teacher}]}}}}
+    return {"data": {"node": teacher}}
+
+
+def synthetic_ratings(n, count):
+    courses = ["CSCI1200", "CSCI2300", "MATH2010", "COMM4962", "GSAS2520"]
+    return [(courses[(n + i) % len(courses)], 1 + (n * 7 + i) % 5, 1 + (n + i * 3) % 5) for i in range(count)]
+
+
+def run_check(professors=2000):
+    with open(RMP_TEACHERS_FILE, "r", encoding="utf-8") as f:
+        real = [doc for doc in iter_documents(f) if is_store(doc)]
+    records, _, _, _ = ingest_file(RMP_TEACHERS_FILE, chunk_size=4096)
+    expected = {name: entry for store in real for name, entry in compact_rmp_data(store).items()}
+    assert {r["name"]: compact_entry(r) for r in records} == expected, "chunked read differs"
+
+    stores = [synthetic_store(100000 + n, f"First{n}", f"Last{n}", synthetic_ratings(n, 3 + n % 20))
+              for n in range(professors)]
+    # professor 0 again with only its first page, as an earlier payload would
+    early = synthetic_store(100000, "First0", "Last0", synthetic_ratings(0, 3)[:2])
+    with tempfile.TemporaryDirectory() as payload_dir:
+        third = professors // 3
+        with open(os.path.join(payload_dir, "a_early.js"), "w", encoding="utf-8") as f:
+            f.write(f"window.__RELAY_STORE__ = {json.dumps(early)};\n")
+        with open(os.path.join(payload_dir, "b_concatenated.json"), "w", encoding="utf-8") as f:
+            f.write('{"Someone Compacted": {"overall": 4.0}}\n')
+            f.write("".join(json.dumps(s) + ";\n\n" for s in stores[:third]))
+        with open(os.path.join(payload_dir, "c_stores.ndjson"), "w", encoding="utf-8") as f:
+            f.write("".join(json.dumps(s) + "\n" for s in stores[third:2 * third]))
+        with open(os.path.join(payload_dir, "d_pasted.txt"), "w", encoding="utf-8") as f:
+            f.write("".join(f"window.__RELAY_STORE__ = {json.dumps(s)};" for s in stores[2 * third:]))
+        # GraphQL responses: professor 1 again (same rating ids, merged) and
+        # ten professors only seen here, by node and by search
+        with open(os.path.join(payload_dir, "e_graphql.json"), "w", encoding="utf-8") as f:
+            f.write(json.dumps(synthetic_response(100001, "First1", "Last1", synthetic_ratings(1, 4))) + "\n")
+            for n in range(professors, professors + 10):
+                response = synthetic_response(100000 + n, f"First{n}", f"Last{n}", synthetic_ratings(n, 3 + n % 20),
+                                              search=n % 2 == 1)
+                f.write(json.dumps(response) + "\n")
+            f.write('{"errors": [{"message": "rate limited"}]}\n')
+        size = sum(os.path.getsize(p) for p in payload_files(payload_dir))
+
+        start = time.perf_counter()
+        records, stats = ingest(payload_files(payload_dir), workers=1, chunk_size=64 * 1024)
+        elapsed = time.perf_counter() - start
+
+    assert stats["stores"] == professors + 1 and stats["responses"] == 11, stats
+    assert stats["other_documents"] == 2, stats
+    assert len(records) == professors + 10, len(records)
+    by_id = {r["legacy_id"]: r for r in records}
+    for n in range(professors + 10):
+        ratings = synthetic_ratings(n, 3 + n % 20)
+        assert sorted(by_id[100000 + n]["ratings"].values()) == sorted(list(r) for r in ratings), n
+    print(f"Check OK: {len(expected)} real stores match; {professors + 10} synthetic professors "
+          f"({size / 2**20:.1f} MB) in {elapsed:.2f}s, {professors / elapsed:.0f} professors/s")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "check":
+        run_check(int(sys.argv[2]) if len(sys.argv) > 2 else 2000)
+    else:
+        run_ingest(sys.argv[1] if len(sys.argv) > 1 else PAYLOADS_DIR,
+                   int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -1,78 +1,163 @@
 import json
-import csv
 import sys
+import pandas as pd
 
+import instrument
+from course_codes import resolve
 
 
-def rmp_csv(par_arr):
+# --- Columnar rating aggregation ---
+# prof_rate.json (one professor from rmp_script.py, or every professor from
+# rmp_batch.py) is flattened into one table with a row per professor/class
+# entry, class aliases are resolved against a persistent alias table, and
+# the per-class averages are a single group-by instead of dict loops.
+#
+# prof_rate.json entries come in two shapes:
+#   "new": CODE -> [rating_sum, diff_sum, num_ratings]
+#   "old": CODE -> [[rating, diff], ...] one pair per review
+# Only list values are class entries, so rmpurl/department/overall/diff/temp
+# and friends drop out on their own.
 
-    # --- Configuration for courses ---
-    input_json_file = '../temps/prof_rate.json'  # Change this to your JSON file's name
-    output_csv_file = '../temps/tempcsv.csv' # The name of the file to create
-    # ---------------------
+ALIAS_FILE = '../temps/class_aliases.csv'
+ALIAS_COLUMNS = ['prof_name', 'alias', 'class_code']
+KEY = ['prof_name', 'class_code']
+PERCENTILES = (0.25, 0.5, 0.75)
 
 
+def load_aliases(alias_file=ALIAS_FILE):
+    # prof_name is blank for aliases that apply to every professor
+    try:
+        return pd.read_csv(alias_file, dtype=str, keep_default_na=False)[ALIAS_COLUMNS]
+    except FileNotFoundError:
+        return pd.DataFrame(columns=ALIAS_COLUMNS, dtype=str)
+
+
+def save_aliases(aliases, alias_file=ALIAS_FILE):
+    aliases.drop_duplicates(subset=['prof_name', 'alias'], keep='last').to_csv(alias_file, index=False)
+
+
+def add_aliases(aliases, prof_names, par_arr):
+    # command line combines are [keep, drop] pairs: drop becomes an alias of keep
+    new = pd.DataFrame(
+        [[prof, drop, keep] for prof in prof_names for keep, drop in par_arr],
+        columns=ALIAS_COLUMNS
+    )
+    return pd.concat([aliases, new], ignore_index=True)
+
+
+def ratings_frames(professor_data):
+    # -> (sums, reviews): pre-summed "new" entries and per-review "old" ones
+    sums = []
+    reviews = []
+    for professor_name, infos in professor_data.items():
+        for class_code, value in infos.items():
+            if not isinstance(value, list) or not value:
+                continue
+            if isinstance(value[0], list):
+                reviews.extend((professor_name, class_code, r[0], r[1]) for r in value)
+            else:
+                sums.append((professor_name, class_code, value[0], value[1], value[2]))
+
+    sums = pd.DataFrame(sums, columns=KEY + ['rating_sum', 'diff_sum', 'num_ratings'])
+    reviews = pd.DataFrame(reviews, columns=KEY + ['rating', 'diff'])
+    return sums, reviews
+
+
+def apply_aliases(frame, aliases):
+    # professor specific aliases first, then the ones that apply to everyone,
+    # then the shared course code resolver (cross-listings, renumbering)
+    if frame.empty:
+        return frame
+    if aliases.empty:
+        return frame.assign(class_code=frame['class_code'].map(resolve))
+    aliases = aliases.drop_duplicates(subset=['prof_name', 'alias'], keep='last')
+
+    codes = frame['class_code']
+    specific = aliases[aliases['prof_name'] != '']
+    if not specific.empty:
+        lookup = dict(zip(zip(specific['prof_name'], specific['alias']), specific['class_code']))
+        keys = pd.Series(list(zip(frame['prof_name'], codes)), index=frame.index)
+        codes = keys.map(lookup).fillna(codes)
+
+    general = aliases[aliases['prof_name'] == '']
+    if not general.empty:
+        codes = codes.map(dict(zip(general['alias'], general['class_code']))).fillna(codes)
+
+    return frame.assign(class_code=codes.map(resolve))
+
+
+def aggregate_ratings(sums, reviews):
+    # one row per professor/class: num_ratings and rounded average rating/diff
+    from_reviews = reviews.groupby(KEY, sort=False).agg(
+        rating_sum=('rating', 'sum'),
+        diff_sum=('diff', 'sum'),
+        num_ratings=('rating', 'size')
+    ).reset_index()
+
+    frames = [df for df in (sums, from_reviews) if not df.empty]
+    if not frames:
+        return pd.DataFrame(columns=KEY + ['num_ratings', 'rating', 'diff'])
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined.astype({'rating_sum': float, 'diff_sum': float, 'num_ratings': int})
+
+    table = combined.groupby(KEY, sort=False, as_index=False)[['rating_sum', 'diff_sum', 'num_ratings']].sum()
+    table['rating'] = (table['rating_sum'] / table['num_ratings']).round(1)
+    table['diff'] = (table['diff_sum'] / table['num_ratings']).round(1)
+    return table[KEY + ['num_ratings', 'rating', 'diff']]
+
+
+def rating_stats(reviews, percentiles=PERCENTILES):
+    # per-class spread; needs per-review ("old" format) data
+    grouped = reviews.groupby(KEY, sort=False)
+    stats = pd.concat([
+        grouped.size().rename('num_ratings'),
+        grouped[['rating', 'diff']].mean().add_suffix('_mean'),
+        grouped[['rating', 'diff']].var(ddof=0).add_suffix('_var'),
+    ], axis=1)
+
+    quantiles = grouped['rating'].quantile(list(percentiles)).unstack()
+    quantiles.columns = [f"rating_p{round(p * 100)}" for p in quantiles.columns]
+    return stats.join(quantiles).reset_index()
+
+
+def rmp_csv(par_arr, input_json_file='../temps/prof_rate.json', output_csv_file='../temps/tempcsv.csv',
+            stats_csv_file=None, alias_file=ALIAS_FILE, shared_aliases=False):
 
     try:
         # 1. Read the JSON data from the input file
-        with open(input_json_file, 'r') as f:
+        with instrument.timer("read_prof_rate"), open(input_json_file, 'r') as f:
             professor_data = json.load(f)
+        instrument.count("professors", len(professor_data))
+
+        # 2. Resolve aliases: the command line combines are remembered in the
+        # alias table (for the professors in this file, or for everyone when
+        # shared_aliases is set), so reruns don't need them
+        aliases = load_aliases(alias_file)
+        if par_arr:
+            aliases = add_aliases(aliases, [''] if shared_aliases else list(professor_data), par_arr)
+            save_aliases(aliases, alias_file)
+
+        with instrument.timer("apply_aliases"):
+            sums, reviews = ratings_frames(professor_data)
+            sums = apply_aliases(sums, aliases)
+            reviews = apply_aliases(reviews, aliases)
+        instrument.count("class_entries", len(sums) + len(reviews))
 
-        # 2. Process the data to prepare for the CSV
-        output_rows = []
-        
-        # Add a header row for the CSV
-        output_rows.append(['prof_name', 'class_code', 'num_ratings', 'rating', 'diff']) 
-
-        store_prof_name = ""
-
-        # Loop through each professor (the top-level keys in the JSON)
-        for professor_name, infos in professor_data.items():
-            store_prof_name = professor_name
-            # goes through our list of combines
-            # adds the seocnd part to the first part and removes the second part
-            for combine in par_arr:
-                print(infos[combine[1]])
-                added_rat = infos[combine[0]][0] + infos[combine[1]][0]
-                added_dif = infos[combine[0]][1] + infos[combine[1]][1]
-                added_num = infos[combine[0]][2] + infos[combine[1]][2]
-                added_arr = [added_rat, added_dif, added_num]
-                print(added_arr)
-                infos[combine[0]] = added_arr
-                infos.pop(combine[1])
-
-
-            print()
-
-            for info in infos:
-
-                if(info == "rmpurl" or info == "department" or info == "overall" or info == "diff" or info == "temp"):
-                    continue
-                
-
-                print(info)
-                print(infos[info])
-                ratingval = round(infos[info][0] / infos[info][2], 1)
-                diffval = round(infos[info][1] / infos[info][2], 1)
-                infos[info] = [ratingval, diffval, infos[info][2]]
-                print(infos[info])
-                print()
-
-                output_rows.append([professor_name, info, infos[info][2], infos[info][0], infos[info][1]])
-            
-
-
-        
         # 3. Write the processed data to a CSV file
-        with open(output_csv_file, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            # writerows() writes all the rows at once
-            writer.writerows(output_rows)
+        with instrument.timer("aggregate_ratings"):
+            table = aggregate_ratings(sums, reviews)
+        with instrument.timer("write_csv"):
+            table.to_csv(output_csv_file, index=False, lineterminator='\r\n')
+        instrument.count("rows_written", len(table))
+        print(f"✅ Successfully created '{output_csv_file}' ({len(table)} rows, {table['prof_name'].nunique()} professors)!")
+
+        if stats_csv_file and not reviews.empty:
+            with instrument.timer("rating_stats"):
+                rating_stats(reviews).round(3).to_csv(stats_csv_file, index=False)
+            print(f"✅ Successfully created '{stats_csv_file}'!")
 
-        print(f"✅ Successfully created '{output_csv_file}'!")
+        return list(professor_data)[-1] if professor_data else ""
 
-        return store_prof_name
-        
 
     except FileNotFoundError:
         print(f"Error: The file '{input_json_file}' was not found.")
@@ -82,7 +167,8 @@ def rmp_csv(par_arr):
     except Exception as e:
         print(f"An unexpected error occurred: {e}")
 
-    return ""
+    # None tells the command line (and pipeline.py) that nothing was written
+    return None
 
 
 
@@ -91,25 +177,49 @@ def rmp_csv(par_arr):
 
 
 if __name__ == "__main__":
-    
+
+    # python rmp_csv_convert.py batch -> every professor from rmp_batch.py,
+    # with the class aliases applied; batch_ratings.csv is left as written so
+    # it still matches batch_upsert.sql / batch_ratings_copy.sql
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        converted = rmp_csv(
+            [pair for pair in zip(sys.argv[2::2], sys.argv[3::2])],
+            input_json_file='../temps/batch_prof_rate.json',
+            output_csv_file='../temps/batch_ratings_aliased.csv',
+            stats_csv_file='../temps/batch_rating_stats.csv',
+            shared_aliases=True
+        )
+        sys.exit(0 if converted is not None else 1)
+
+    # python rmp_csv_convert.py compacted -> every professor from rmp_compacter.py
+    if len(sys.argv) > 1 and sys.argv[1] == "compacted":
+        converted = rmp_csv(
+            [pair for pair in zip(sys.argv[2::2], sys.argv[3::2])],
+            input_json_file='../temps/rmp_compacted.json',
+            output_csv_file='../temps/rmp_ratings.csv',
+            stats_csv_file='../temps/rmp_rating_stats.csv',
+            shared_aliases=True
+        )
+        sys.exit(0 if converted is not None else 1)
 
     par_arr = []
-    
+
     for i in range(1, len(sys.argv), 2):
-        print(str(i) + sys.argv[i])
         par_arr.append([sys.argv[i], sys.argv[i+1]])
-    
-    print("paramters:")
-    print(par_arr)
+
+    instrument.log("paramters:")
+    instrument.log(par_arr)
     # put in the big string of it here
     profname = rmp_csv(par_arr)
+    if profname is None:
+        sys.exit(1)
 
 
     print("CSV created")
-    
 
-    
-    
+
+
+
     names_file = "../temps/full_names.txt"
     with open(names_file, "r", encoding="utf-8") as f:
         lines = f.readlines()
@@ -119,5 +229,4 @@ if __name__ == "__main__":
             f.writelines(lines[1:])
         else:
             f.writelines(lines)
-    
 
@@ -2,164 +2,103 @@ import re
 import json
 import sys
 
-def extract_class_info(json_text, what_print):
-
-    '''
-    # Regex patterns for the fields we care about
-    file_content_string = ""
-    
-    with open("../tempfile.txt", "r") as file:
-        file_content_string = file.read()
-
-
-    #get legacy id for url
-    legacyidindex = file_content_string.find("legacyId")
-    print(legacyidindex)
-    legacy_id = (file_content_string[legacyidindex+10:file_content_string.find(",", legacyidindex + 10)])
-    rmpurl = "https://www.ratemyprofessors.com/professor/" + legacy_id
-
-    firstnameindex = file_content_string.find("firstName")
-    #print(firstnameindex)
-    first_name = (file_content_string[firstnameindex+12:file_content_string.find("\"", firstnameindex + 12)])
-
-    
-    lastnameindex = file_content_string.find("lastName", firstnameindex)
-    #print(lastnameindex)
-    last_name = (file_content_string[lastnameindex+11:file_content_string.find("\"", lastnameindex + 11)])
-
-    
-    depnameindex = file_content_string.find("department", lastnameindex)
-    #print(depnameindex)
-    department = (file_content_string[depnameindex+13:file_content_string.find("\"", depnameindex + 13)])
-
-
-
-    numratingsindex = file_content_string.find("numRatings", depnameindex)
-    print(numratingsindex)
-    num_ratings = int(file_content_string[numratingsindex+12:file_content_string.find(",", numratingsindex + 12)])
-
-
-    #avgRating
-    avgratingsindex = file_content_string.find("avgRating", numratingsindex)
-    print(avgratingsindex)
-    avg_ratings = float(file_content_string[avgratingsindex+11:file_content_string.find(",", avgratingsindex + 11)])
-
-
-    #avgDifficulty
-    avgdiffindex = file_content_string.find("avgDifficulty", avgratingsindex)
-    print(avgdiffindex)
-    avg_diff = float(file_content_string[avgdiffindex+15:file_content_string.find(",", avgdiffindex + 15)])
-
-
-    '''
-
+import instrument
+from sql_export import sql_literal
+from course_codes import resolve
+
+# --- Review pane parser ---
+# One forward pass over the copied RMP review pane. The page is walked card
+# by card on the card marker, and inside each card every lookup starts where
+# the previous one ended and stops at the next card:
+#   class name  -> text of the first RatingHeader__StyledClass div (past the
+#                  online-class <img> icon or any wrapper tag before it)
+#   quality     -> first CardNumRatingNumber after it
+#   difficulty  -> second CardNumRatingNumber
+# The duplicate mobile header every card carries is simply never reached, and
+# a card missing a field is skipped instead of borrowing the next card's.
+# The markers include the class=" before them: longer needles make str.find
+# skip through the comments faster.
+REVIEW_MARKER = '<div class="Rating__StyledRating'
+CLASS_MARKER = 'class="RatingHeader__StyledClass'
+NUMBER_MARKER = 'class="CardNumRating__CardNumRatingNumber'
+PROF_MARKER = "/flag/professor-rating/"
+
+
+def clean_class_name(class_name):
+    # "csci1200" -> "CSCI-1200", cross-listed/renumbered codes -> one id
+    return resolve(class_name)
+
+
+def tag_text(html, index, end):
+    # (start, stop) of the text in the tag at index, past nested opening tags
+    index = html.find(">", index, end) + 1
+    while html.startswith("<", index) and not html.startswith("</", index):
+        index = html.find(">", index, end) + 1
+    return index, html.find("<", index, end)
+
+
+def parse_reviews(html):
+    # returns (rmp professor number, [(class_name, quality, difficulty), ...])
+    prof_num = ""
+    index = html.find(PROF_MARKER)
+    if index >= 0:
+        index += len(PROF_MARKER)
+        prof_num = html[index:html.find("/", index)]
+
+    reviews = []
+    # a page repeats a handful of course codes, resolve each once
+    class_names = {}
+    card = html.find(REVIEW_MARKER)
+    while card >= 0:
+        next_card = html.find(REVIEW_MARKER, card + len(REVIEW_MARKER))
+        card_end = next_card if next_card >= 0 else len(html)
+        pos = html.find(CLASS_MARKER, card, card_end)
+        card = next_card
+        if pos < 0:
+            continue
+        start, pos = tag_text(html, pos, card_end)
+        class_name = html[start:pos]
+
+        pos = html.find(NUMBER_MARKER, pos, card_end)
+        if pos < 0:
+            continue
+        start, pos = tag_text(html, pos, card_end)
+        quality = html[start:pos]
+
+        pos = html.find(NUMBER_MARKER, pos, card_end)
+        if pos < 0:
+            continue
+        start, pos = tag_text(html, pos, card_end)
+
+        if class_name not in class_names:
+            class_names[class_name] = clean_class_name(class_name)
+        reviews.append((class_names[class_name], float(quality), float(html[start:pos])))
+
+    return prof_num, reviews
+
+
+def summarize_reviews(reviews):
+    # class_name -> [[quality, difficulty], ...] plus overall averages
     tot_rating = 0
     tot_diff = 0
-
-    file_content_string = ""
-    
-    with open("../temps/ratings.txt", "r") as file:
-        file_content_string = file.read()
-
-    prof_num_index = file_content_string.find("/flag/professor-rating/")
-    prof_num = (file_content_string[prof_num_index+23:file_content_string.find("/", prof_num_index+23)])
-    
-
-    class_name_index = file_content_string.find("RatingHeader__StyledClass")
-    
-    # RatingHeader__StyledClass
-    # >
-    # >
-    # CardNumRating__CardNumRatingNumber
-    # > 
-    count_num_reviews = 0
     class_reviews = {}
 
-    while(class_name_index > 5):
-        print()
-        count_num_reviews = count_num_reviews + 1
-        print(count_num_reviews)
-
-        #find class name
-        class_name_index = file_content_string.find(">", class_name_index) 
-        old_index_here = class_name_index
-
-        #remote/online review
-        if(file_content_string[class_name_index:class_name_index+5] == "><img"):
-            print("image")
-            class_name_index = file_content_string.find("currentitem", class_name_index + 1)
-            class_name_index = file_content_string.find(">", class_name_index + 1)
-
-        if(count_num_reviews < 6): class_name_index = file_content_string.find(">", class_name_index + 1)
-        if(file_content_string[class_name_index-1:class_name_index+5] == "v></di"):
-            class_name_index = old_index_here
-        print(str(class_name_index) + file_content_string[class_name_index-1:class_name_index+5])
-        
-        class_name = (file_content_string[class_name_index+1:file_content_string.find("<", class_name_index+1)]).strip().upper()
-        print(class_name + " here===")
-        if(len(class_name) == 8):
-            class_name = class_name[:4] + "-" + class_name[4:]
-        
-
-        ratingindex = file_content_string.find("CardNumRating__CardNumRatingNumber", class_name_index)
-        
-        ratingindex = file_content_string.find(">", ratingindex)
-        print(ratingindex)
-        if(count_num_reviews == 78):
-            print(file_content_string[ratingindex-10:ratingindex+20])
-        user_rating = float(file_content_string[ratingindex+1:file_content_string.find("<", ratingindex)])
+    for class_name, user_rating, user_diff in reviews:
         tot_rating = tot_rating + user_rating
-        print(user_rating)
-
-
-
-        diffindex = file_content_string.find("CardNumRating__CardNumRatingNumber", ratingindex)
-        diffindex = file_content_string.find(">", diffindex)
-        print(diffindex)
-        user_diff = float(file_content_string[diffindex+1:file_content_string.find("<", diffindex)])
         tot_diff = tot_diff + user_diff
-        print(user_diff)
-        
-        
 
         if class_name not in class_reviews:
             class_reviews[class_name] = []
         class_reviews[class_name].append([user_rating, user_diff])
-        
-
-
-        class_name_index = file_content_string.find("RatingHeader__StyledClass", diffindex)
-        class_name_index = file_content_string.find("RatingHeader__StyledClass", class_name_index+5)
 
-    professor_name = "profn"
-    with open("../temps/full_names.txt", "r", encoding="utf-8") as f:
-            professor_name = f.readline().strip()
-    
-    print("Total reviews:")
-    print(count_num_reviews)
+    count_num_reviews = len(reviews)
     average_rat = round(tot_rating/count_num_reviews + 0.0001, 1)
-    print(average_rat)
     average_diff = round(tot_diff/count_num_reviews + 0.0001, 1)
-    print(average_diff)
-    
-
-    with open("../temps/sql_insert.sql", "r", encoding="utf-8") as f:
-            fac_link = f.readline().strip()
-
-    sql = f"""UPDATE professors
-SET rating = {average_rat},
-    difficulty = {average_diff},
-    num_ratings = {count_num_reviews},
-    faculty_url = \'{fac_link}\',
-    rmp_url = \'https://www.ratemyprofessors.com/professor/{prof_num}\'
-WHERE full_name = '{professor_name}';"""
-
-    print(sql)
-
-    with open("../temps/sql_insert.sql", "w", encoding="utf-8") as f:
-        f.write(sql)
+    return class_reviews, count_num_reviews, average_rat, average_diff
 
 
+def build_result(professor_name, class_reviews, what_print):
+    # the prof_rate.json entry for one professor
     result = {
         professor_name: {
             "temp": "temp"
@@ -183,6 +122,59 @@ WHERE full_name = '{professor_name}';"""
     return result
 
 
+def extract_class_info(json_text, what_print, verbose=None):
+    # json_text is the copied review pane; empty means read ../temps/ratings.txt
+    # verbose=None follows the DATA_QUIET switch (see instrument.py)
+    if verbose is None:
+        verbose = not instrument.QUIET
+
+    file_content_string = json_text
+    if not file_content_string:
+        with open("../temps/ratings.txt", "r") as file:
+            file_content_string = file.read()
+
+    with instrument.timer("parse_reviews"):
+        prof_num, reviews = parse_reviews(file_content_string)
+    instrument.count("pane_bytes", len(file_content_string))
+    instrument.count("reviews", len(reviews))
+    if verbose:
+        for count, (class_name, user_rating, user_diff) in enumerate(reviews, 1):
+            print(f"{count}: {class_name} {user_rating} {user_diff}")
+
+    class_reviews, count_num_reviews, average_rat, average_diff = summarize_reviews(reviews)
+
+    professor_name = "profn"
+    with open("../temps/full_names.txt", "r", encoding="utf-8") as f:
+            professor_name = f.readline().strip()
+    
+    if verbose:
+        print("Total reviews:")
+        print(count_num_reviews)
+        print(average_rat)
+        print(average_diff)
+    
+
+    with open("../temps/sql_insert.sql", "r", encoding="utf-8") as f:
+            fac_link = f.readline().strip()
+
+    rmp_url = f"https://www.ratemyprofessors.com/professor/{prof_num}"
+    sql = f"""UPDATE professors
+SET rating = {average_rat},
+    difficulty = {average_diff},
+    num_ratings = {count_num_reviews},
+    faculty_url = {sql_literal(fac_link)},
+    rmp_url = {sql_literal(rmp_url)}
+WHERE full_name = {sql_literal(professor_name)};"""
+
+    if verbose:
+        print(sql)
+
+    with open("../temps/sql_insert.sql", "w", encoding="utf-8") as f:
+        f.write(sql)
+
+    return build_result(professor_name, class_reviews, what_print)
+
+
 
 
 
@@ -211,9 +203,15 @@ WHERE full_name = '{professor_name}';"""
 
 if __name__ == "__main__":
     
+    # python rmp_script.py [old|new] [quiet]
+    args = sys.argv[1:]
+    if "quiet" in args:
+        instrument.set_quiet()
+    args = [a for a in args if a != "quiet"]
+
     filetype = "new"
-    if len(sys.argv) > 1:
-        filetype = sys.argv[1]
+    if len(args) > 0:
+        filetype = args[0]
     # put in the big string of it here
     compacted = extract_class_info("", filetype)
 
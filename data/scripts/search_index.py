@@ -0,0 +1,190 @@
+import bisect
+import gzip
+import json
+import re
+import sys
+import time
+import unicodedata
+
+import instrument
+
+# Offline search index over professors, faculty and courses.
+# Names, course codes and titles are split into normalized tokens; a sorted
+# token list gives prefix matches with bisect, and a trigram -> token table
+# catches typos ("goldscmidt", "csci1020"). The whole thing is written once
+# as a gzipped JSON artifact and loaded by whatever needs to search.
+
+PROFESSOR_COURSES_FILE = "../professor_data/professor_courses.json"
+DEPARTMENTS_FILE = "../professor_data/departments.json"
+CATALOG_FILE = "../class/catalog.json"
+INDEX_FILE = "../professor_data/search_index.json.gz"
+
+# "CSCI-1200", "csci 1200" and "csci1200" all normalize to the same token
+COURSE_CODE = re.compile(r"\b([a-z]{4})[\s\-]?(\d{4})\b")
+TOKEN = re.compile(r"[a-z0-9]+")
+
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+FUZZY_MIN_SIMILARITY = 0.4
+FUZZY_MIN_LENGTH = 3
+
+
+def normalize(text):
+    # lower-case, strip accents and apostrophes ("O'Brien" -> "obrien")
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return text.lower().replace("'", "").replace("’", "")
+
+
+def tokenize(text):
+    text = normalize(text)
+    tokens = TOKEN.findall(text)
+    tokens.extend(subj + num for subj, num in COURSE_CODE.findall(text))
+    return tokens
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchIndex:
+
+    def __init__(self, docs, tokens, postings, grams):
+        # docs: [kind, key, label]; tokens: sorted list; postings[i]: doc ids
+        # for tokens[i]; grams: trigram -> token ids
+        self.docs = docs
+        self.tokens = tokens
+        self.postings = postings
+        self.grams = grams
+
+    def prefix_tokens(self, token):
+        start = bisect.bisect_left(self.tokens, token)
+        end = bisect.bisect_left(self.tokens, token + "\uffff")
+        return range(start, end)
+
+    def fuzzy_tokens(self, token):
+        query_grams = trigrams(token)
+        counts = {}
+        for gram in query_grams:
+            for token_id in self.grams.get(gram, ()):
+                counts[token_id] = counts.get(token_id, 0) + 1
+
+        matches = []
+        for token_id, shared in counts.items():
+            # a token of length n has n + 1 padded trigrams (ignoring repeats)
+            candidate_grams = len(self.tokens[token_id]) + 1
+            similarity = shared / (len(query_grams) + candidate_grams - shared)
+            if similarity >= FUZZY_MIN_SIMILARITY:
+                matches.append((token_id, similarity))
+        return matches
+
+    def token_scores(self, token):
+        # doc id -> best score this query token earns in that doc
+        scores = {}
+
+        def add(token_id, score):
+            for doc_id in self.postings[token_id]:
+                if scores.get(doc_id, 0) < score:
+                    scores[doc_id] = score
+
+        for token_id in self.prefix_tokens(token):
+            add(token_id, EXACT_SCORE if self.tokens[token_id] == token else PREFIX_SCORE)
+
+        if not scores and len(token) >= FUZZY_MIN_LENGTH:
+            for token_id, similarity in self.fuzzy_tokens(token):
+                add(token_id, similarity)
+        return scores
+
+    def search(self, query, limit=10, kind=None):
+        query_tokens = list(dict.fromkeys(tokenize(query)))
+        if not query_tokens:
+            return []
+
+        matched = {}
+        totals = {}
+        for token in query_tokens:
+            for doc_id, score in self.token_scores(token).items():
+                matched[doc_id] = matched.get(doc_id, 0) + 1
+                totals[doc_id] = totals.get(doc_id, 0) + score
+
+        # docs matching more of the query first, then by score, then shorter labels
+        ranked = sorted(
+            (doc_id for doc_id in totals if kind is None or self.docs[doc_id][0] == kind),
+            key=lambda d: (-matched[d], -totals[d], len(self.docs[d][2]))
+        )
+        return [
+            {"kind": self.docs[d][0], "key": self.docs[d][1], "label": self.docs[d][2], "score": round(totals[d], 3)}
+            for d in ranked[:limit]
+        ]
+
+    def to_json(self):
+        return {
+            "docs": self.docs,
+            "tokens": self.tokens,
+            "postings": self.postings,
+            "grams": self.grams
+        }
+
+
+def build_search_index(professor_courses, departments, catalog):
+    docs = []
+    for name in professor_courses:
+        docs.append(["professor", name, name])
+    for entry in departments:
+        docs.append(["faculty", entry["Name"], f"{entry['Name']} ({entry['Department']})"])
+    for code, info in catalog.items():
+        docs.append(["course", code, f"{code} {info.get('name', '')}".strip()])
+
+    token_docs = {}
+    for doc_id, (kind, key, label) in enumerate(docs):
+        for token in set(tokenize(label)):
+            token_docs.setdefault(token, []).append(doc_id)
+
+    tokens = sorted(token_docs)
+    postings = [token_docs[t] for t in tokens]
+
+    grams = {}
+    for token_id, token in enumerate(tokens):
+        for gram in trigrams(token):
+            grams.setdefault(gram, []).append(token_id)
+
+    return SearchIndex(docs, tokens, postings, grams)
+
+
+def save_search_index(index, index_file=INDEX_FILE):
+    with gzip.open(index_file, "wt", encoding="utf-8") as f:
+        json.dump(index.to_json(), f, separators=(",", ":"), ensure_ascii=False)
+
+
+def load_search_index(index_file=INDEX_FILE):
+    with gzip.open(index_file, "rt", encoding="utf-8") as f:
+        data = json.load(f)
+    return SearchIndex(data["docs"], data["tokens"], data["postings"], data["grams"])
+
+
+if __name__ == "__main__":
+    # python search_index.py           -> build the artifact
+    # python search_index.py <query>   -> search the built artifact
+    if len(sys.argv) > 1:
+        index = load_search_index()
+        query = " ".join(sys.argv[1:])
+        start = time.perf_counter()
+        results = index.search(query)
+        elapsed = (time.perf_counter() - start) * 1000
+        for result in results:
+            print(f"{result['score']:>6}  {result['kind']:<9} {result['label']}")
+        print(f"{len(results)} results in {elapsed:.3f} ms")
+    else:
+        with open(PROFESSOR_COURSES_FILE, "r", encoding="utf-8") as f:
+            professor_courses = json.load(f)
+        with open(DEPARTMENTS_FILE, "r", encoding="utf-8") as f:
+            departments = json.load(f)
+        with open(CATALOG_FILE, "r", encoding="utf-8") as f:
+            catalog = json.load(f)
+
+        with instrument.timer("build_search_index"):
+            index = build_search_index(professor_courses, departments, catalog)
+        save_search_index(index)
+        instrument.count("documents", len(index.docs))
+        print(f"Search index with {len(index.docs)} entries and {len(index.tokens)} tokens saved to {INDEX_FILE}")
@@ -0,0 +1,199 @@
+import math
+import sqlite3
+
+# Bulk SQL export for the ratings data.
+# Everything we load into Supabase goes through here so values are escaped
+# in one place ("O'Brien" included) and a whole batch is one statement:
+#   upsert_sql   -> multi-row INSERT ... ON CONFLICT DO UPDATE, ready for the
+#                   Supabase SQL editor (PostgreSQL; SQLite accepts it too)
+#   upsert_statement -> the same statement with ? placeholders for
+#                   DB-API executemany
+#   copy_sql     -> a psql COPY ... FROM STDIN block in COPY text format
+#   update_sql   -> UPDATE ... FROM (VALUES ...), one statement per batch, for
+#                   tables we only fill in (never add rows to)
+# The unique key the ratings upsert relies on is a schema change, kept apart
+# in migrations/ratings_unique_key.sql.
+
+BATCH_SIZE = 1000
+MIGRATION_FILE = "../migrations/ratings_unique_key.sql"
+
+PROFESSOR_COLUMNS = ["full_name", "rating", "difficulty", "num_ratings", "faculty_url", "rmp_url"]
+PROFESSOR_TYPES = ["TEXT", "REAL", "REAL", "INTEGER", "TEXT", "TEXT"]
+PROFESSOR_KEY = ["full_name"]
+RATING_COLUMNS = ["prof_name", "class_code", "num_ratings", "rating", "diff"]
+RATING_KEY = ["prof_name", "class_code"]
+
+
+def quote_identifier(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_literal(value):
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if math.isnan(value) or math.isinf(value):
+            return "NULL"
+        return repr(value)
+    # standard SQL string: double the quotes, drop NULs postgres can't store
+    return "'" + str(value).replace("\x00", "").replace("'", "''") + "'"
+
+
+def on_conflict_clause(columns, key):
+    updates = [c for c in columns if c not in key]
+    target = ", ".join(quote_identifier(c) for c in key)
+    if not updates:
+        return f"ON CONFLICT ({target}) DO NOTHING"
+    assignments = ",\n    ".join(f"{quote_identifier(c)} = EXCLUDED.{quote_identifier(c)}" for c in updates)
+    return f"ON CONFLICT ({target}) DO UPDATE SET\n    {assignments}"
+
+
+def upsert_statement(table, columns, key):
+    # parameterized single-row form, for cursor.executemany(statement, rows)
+    cols = ", ".join(quote_identifier(c) for c in columns)
+    marks = ", ".join("?" for _ in columns)
+    return f"INSERT INTO {quote_identifier(table)} ({cols}) VALUES ({marks})\n{on_conflict_clause(columns, key)};"
+
+
+def upsert_sql(table, columns, key, rows, batch_size=BATCH_SIZE):
+    # rows are sequences in column order; one statement per batch_size rows
+    cols = ", ".join(quote_identifier(c) for c in columns)
+    conflict = on_conflict_clause(columns, key)
+
+    statements = []
+    for start in range(0, len(rows), batch_size):
+        values = ",\n    ".join(
+            "(" + ", ".join(sql_literal(v) for v in row) + ")"
+            for row in rows[start:start + batch_size]
+        )
+        statements.append(f"INSERT INTO {quote_identifier(table)} ({cols}) VALUES\n    {values}\n{conflict};")
+    return "\n\n".join(statements)
+
+
+def update_sql(table, columns, key, rows, types, batch_size=BATCH_SIZE):
+    # rows are sequences in column order, types the SQL type of each column;
+    # one statement per batch_size rows, and rows whose key isn't in the
+    # table change nothing. A VALUES list's columns are column1, column2, ...
+    # in both PostgreSQL and SQLite; the casts give a column that is all NULL
+    # in a batch a type PostgreSQL can assign.
+    # the last row for a key wins, like running the updates one by one
+    rows = list({tuple(row[columns.index(c)] for c in key): row for row in rows}.values())
+    name = quote_identifier(table)
+    source = [f'CAST("v"."column{i}" AS {t})' for i, t in enumerate(types, 1)]
+    assignments = ",\n    ".join(f"{quote_identifier(c)} = {v}"
+                                  for c, v in zip(columns, source) if c not in key)
+    match = " AND ".join(f"{name}.{quote_identifier(c)} = {v}"
+                         for c, v in zip(columns, source) if c in key)
+
+    statements = []
+    for start in range(0, len(rows), batch_size):
+        values = ",\n    ".join(
+            "(" + ", ".join(sql_literal(v) for v in row) + ")"
+            for row in rows[start:start + batch_size]
+        )
+        statements.append(f'UPDATE {name}\nSET {assignments}\nFROM (VALUES\n    {values}\n) AS "v"\nWHERE {match};')
+    return "\n\n".join(statements)
+
+
+def copy_value(value):
+    # PostgreSQL COPY text format escaping
+    if value is None or (isinstance(value, float) and (math.isnan(value) or math.isinf(value))):
+        return "\\N"
+    text = str(value).replace("\x00", "")
+    return (text.replace("\\", "\\\\").replace("\t", "\\t")
+                .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def copy_sql(table, columns, rows):
+    cols = ", ".join(quote_identifier(c) for c in columns)
+    lines = [f"COPY {quote_identifier(table)} ({cols}) FROM STDIN;"]
+    lines.extend("\t".join(copy_value(v) for v in row) for row in rows)
+    lines.append("\\.")
+    return "\n".join(lines) + "\n"
+
+
+def ratings_upsert_sql(professor_rows, rating_rows):
+    # the full load for professors + ratings, as one file: existing professors
+    # are updated (names not in the table are skipped, like the one-at-a-time
+    # UPDATE from rmp_script.py), ratings are upserted (needs MIGRATION_FILE)
+    return "\n\n".join(part for part in [
+        update_sql("professors", PROFESSOR_COLUMNS, PROFESSOR_KEY, professor_rows, PROFESSOR_TYPES),
+        upsert_sql("ratings", RATING_COLUMNS, RATING_KEY, rating_rows),
+    ] if part) + "\n"
+
+
+# --- SQLite check ---
+# Runs an emitted file against an in-memory SQLite copy of the two tables
+# (ON CONFLICT upserts are the same syntax there) and reads the rows back, so
+# escaping and conflict handling can be checked without a Supabase project.
+
+SQLITE_SCHEMA = """
+CREATE TABLE professors (
+    id INTEGER PRIMARY KEY, full_name TEXT NOT NULL, rating REAL, difficulty REAL,
+    num_ratings INTEGER, faculty_url TEXT, rmp_url TEXT
+);
+CREATE TABLE ratings (
+    id INTEGER PRIMARY KEY, prof_name TEXT NOT NULL, class_code TEXT NOT NULL,
+    num_ratings INTEGER, rating REAL, diff REAL
+);
+"""
+
+
+def load_into_sqlite(sql_text, conn=None, professor_names=()):
+    # a new database gets the schema, the migration and a bare row for each
+    # of professor_names
+    if conn is None:
+        conn = sqlite3.connect(":memory:")
+        conn.executescript(SQLITE_SCHEMA)
+        with open(MIGRATION_FILE, "r", encoding="utf-8") as f:
+            conn.executescript(f.read())
+        conn.executemany("INSERT INTO professors (full_name) VALUES (?)", [(n,) for n in professor_names])
+    conn.executescript(sql_text)
+    return conn
+
+
+def check_round_trip(professor_rows, rating_rows, unknown_professors=()):
+    # load twice (second run must update, not duplicate) and compare;
+    # unknown_professors are in the file but not the table and must stay out
+    sql_text = ratings_upsert_sql(list(professor_rows) + list(unknown_professors), rating_rows)
+    assert sql_text.count("UPDATE \"professors\"") == 1, "professors should be one bulk UPDATE"
+    conn = load_into_sqlite(sql_text, professor_names=[r[0] for r in professor_rows])
+    load_into_sqlite(sql_text, conn)
+
+    cols = ", ".join(PROFESSOR_COLUMNS)
+    stored = conn.execute(f"SELECT {cols} FROM professors ORDER BY full_name").fetchall()
+    expected = sorted(tuple(r) for r in professor_rows)
+    assert stored == expected, f"professors differ: {stored[:3]} vs {expected[:3]}"
+
+    cols = ", ".join(RATING_COLUMNS)
+    stored = conn.execute(f"SELECT {cols} FROM ratings ORDER BY prof_name, class_code").fetchall()
+    expected = sorted(tuple(r) for r in rating_rows)
+    assert stored == expected, f"ratings differ: {stored[:3]} vs {expected[:3]}"
+
+    # the parameterized form has to agree with the rendered one
+    conn.executemany(upsert_statement("ratings", RATING_COLUMNS, RATING_KEY), rating_rows)
+    assert conn.execute("SELECT COUNT(*) FROM ratings").fetchone()[0] == len(rating_rows)
+    return True
+
+
+if __name__ == "__main__":
+    # python sql_export.py -> check escaping/upserts against SQLite with
+    # awkward names
+    professors = [
+        ["Pat O'Brien", 4.3, 3.9, 10, "https://faculty.rpi.edu/pat-obrien", "https://www.ratemyprofessors.com/professor/1"],
+        ['Dana "DJ" Smith; DROP TABLE professors;--', 3.0, 2.0, 1, None, "https://www.ratemyprofessors.com/professor/2"],
+        ["Zoë Tab\tNew\nLine \\ Backslash", 5.0, 1.0, 2, "", ""],
+    ]
+    ratings = [
+        ["Pat O'Brien", "CSCI-1200", 3, 4.0, 4.0],
+        ["Pat O'Brien", "CSCI-2300", 7, 4.5, 3.9],
+        ["Zoë Tab\tNew\nLine \\ Backslash", "ARTS-1020", 2, 5.0, 1.0],
+    ]
+    unknown = [["Not Yet Listed", 4.0, 3.0, 1, None, None]]
+    check_round_trip(professors, ratings, unknown)
+    print(copy_sql("ratings", RATING_COLUMNS, ratings[-1:]), end="")
+    print("SQL export round trip OK")